@@ -0,0 +1,5 @@
+"""Performance benchmarks module."""
+
+# The benchmarks can be executed by standing in the project's root directory
+# and running the following command in a terminal:
+# python -m benchmarks.resolution_benchmarks
@@ -0,0 +1,301 @@
+"""Micro-benchmarks of the resolution of synthetic dependency graphs.
+
+The results are written as JSON, and can be compared to the results
+of another commit to detect regressions, for example::
+
+    python -m benchmarks.resolution_benchmarks --output baseline.json
+    python -m benchmarks.resolution_benchmarks --baseline baseline.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime, timezone
+from typing import Any
+
+from kanata import LifetimeScope
+from kanata.catalogs import IInjectableCatalog
+from kanata.plans import ResolutionPlanner
+from .synthetic_graphs import GRAPH_FACTORIES
+
+DEFAULT_SIZES: tuple[int, ...] = (10, 100, 1_000, 10_000)
+"""The default numbers of the injectables of the synthetic graphs."""
+
+# The metrics compared to the baselines, mapped to whether greater values are better.
+_COMPARED_METRICS: Mapping[tuple[str, ...], bool] = {
+    ("resolve_ns", "median"): False,
+    ("create_child_scope_ns", "median"): False,
+    ("requests_per_second",): True
+}
+
+def run_benchmark(
+    catalog: IInjectableCatalog,
+    root: type,
+    time_budget: float = 1.0,
+    min_sample_count: int = 5
+) -> dict[str, Any]:
+    """Measures the resolution of the specified injectable from the specified catalog.
+
+    The measured metrics are:
+
+    - the latency of the first resolution, which includes the planning;
+    - the latency of the subsequent resolutions, each in a new child scope;
+    - the latency of the creation of a child scope;
+    - the number of requests per second at steady state, where each request
+      creates a child scope, resolves the injectable and disposes of the scope.
+
+    :param catalog: The catalog of the injectables.
+    :type catalog: IInjectableCatalog
+    :param root: The type of the injectable to be resolved.
+    :type root: type
+    :param time_budget: The approximate number of seconds spent on measuring
+        each of the metrics, defaults to 1.0.
+    :type time_budget: float, optional
+    :param min_sample_count: The minimum number of samples of each latency,
+        regardless of the time budget, defaults to 5.
+    :type min_sample_count: int, optional
+    :return: The measured metrics; the latencies are in nanoseconds.
+    :rtype: dict[str, Any]
+    """
+
+    gc.collect()
+    start_time = time.perf_counter_ns()
+    scope = LifetimeScope(catalog)
+    scope.resolve(root)
+    cold_resolve_ns = time.perf_counter_ns() - start_time
+    plan = ResolutionPlanner.for_catalog(catalog).get_plan((root,))
+
+    def resolve_in_child_scope() -> int:
+        child_scope = scope.create_child_scope()
+        start_time = time.perf_counter_ns()
+        child_scope.resolve(root)
+        duration_ns = time.perf_counter_ns() - start_time
+        child_scope.dispose()
+        return duration_ns
+
+    def create_child_scope() -> int:
+        start_time = time.perf_counter_ns()
+        child_scope = scope.create_child_scope()
+        duration_ns = time.perf_counter_ns() - start_time
+        child_scope.dispose()
+        return duration_ns
+
+    resolve_samples = _sample(resolve_in_child_scope, time_budget, min_sample_count)
+    create_child_scope_samples = _sample(create_child_scope, time_budget, min_sample_count)
+
+    # Unlike the latencies, the throughput is measured with the garbage collector enabled,
+    # since collecting the garbage of the requests is part of the cost of a steady state.
+    request_count = 0
+    deadline = time.perf_counter_ns() + int(time_budget * 1e9)
+    start_time = time.perf_counter_ns()
+    while (now := time.perf_counter_ns()) < deadline or request_count < min_sample_count:
+        child_scope = scope.create_child_scope()
+        child_scope.resolve(root)
+        child_scope.dispose()
+        request_count += 1
+
+    scope.dispose()
+    return {
+        "registration_count": len(catalog.get_registrations()),
+        "plan_step_count": len(plan.steps),
+        "cold_resolve_ns": cold_resolve_ns,
+        "resolve_ns": _summarize(resolve_samples),
+        "create_child_scope_ns": _summarize(create_child_scope_samples),
+        "requests_per_second": request_count / ((now - start_time) / 1e9)
+    }
+
+def run_benchmarks(
+    graphs: Iterable[str] = GRAPH_FACTORIES,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    time_budget: float = 1.0
+) -> dict[str, Any]:
+    """Measures the resolution of the specified shapes of synthetic graphs
+    of each of the specified sizes.
+
+    :param graphs: The names of the shapes of the graphs, defaults to all of them.
+    :type graphs: Iterable[str], optional
+    :param sizes: The numbers of the injectables of the graphs, defaults to DEFAULT_SIZES.
+    :type sizes: Iterable[int], optional
+    :param time_budget: The approximate number of seconds spent on measuring
+        each of the metrics of each graph, defaults to 1.0.
+    :type time_budget: float, optional
+    :return: The JSON-serializable results, along with the description of the environment.
+    :rtype: dict[str, Any]
+    """
+
+    sizes = tuple(sizes)
+    results = []
+    for graph in graphs:
+        for size in sizes:
+            catalog, root = GRAPH_FACTORIES[graph](size)
+            results.append({
+                "graph": graph,
+                "size": size,
+                **run_benchmark(catalog, root, time_budget)
+            })
+
+    return {
+        "environment": {
+            "commit": _get_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform()
+        },
+        "results": results
+    }
+
+def compare_results(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    tolerance: float = 0.2
+) -> tuple[list[str], bool]:
+    """Compares the results of two runs of the benchmarks.
+
+    :param baseline: The results of the reference run.
+    :type baseline: Mapping[str, Any]
+    :param current: The results of the run to be compared.
+    :type current: Mapping[str, Any]
+    :param tolerance: The relative change of a metric above which
+        it's considered a regression, defaults to 0.2.
+    :type tolerance: float, optional
+    :return: The lines of the comparison and whether any of the metrics regressed.
+    :rtype: tuple[list[str], bool]
+    """
+
+    baseline_results = {
+        (result["graph"], result["size"]): result
+        for result in baseline["results"]
+    }
+    lines = [f"{'Graph':<16} {'Size':>6} {'Metric':<28} {'Baseline':>14} {'Current':>14} Change"]
+    has_regression = False
+    for result in current["results"]:
+        if not (baseline_result := baseline_results.get((result["graph"], result["size"]))):
+            continue
+
+        for path, is_greater_better in _COMPARED_METRICS.items():
+            baseline_value = _get_value(baseline_result, path)
+            value = _get_value(result, path)
+            change = (value - baseline_value) / baseline_value if baseline_value else 0.0
+            is_regression = (-change if is_greater_better else change) > tolerance
+            has_regression |= is_regression
+            lines.append(
+                f"{result['graph']:<16} {result['size']:>6} {'.'.join(path):<28}"
+                f" {baseline_value:>14.1f} {value:>14.1f} {change:+.1%}"
+                + (" REGRESSION" if is_regression else "")
+            )
+
+    return lines, has_regression
+
+def main(arguments: Sequence[str] | None = None) -> int:
+    """Runs the benchmarks and writes their results as JSON.
+
+    :param arguments: The command line arguments, defaults to the ones of the process.
+    :type arguments: Sequence[str] | None, optional
+    :return: The exit code of the process, which is 1 if any of the metrics regressed.
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.resolution_benchmarks",
+        description="Measures the resolution of synthetic dependency graphs."
+    )
+    parser.add_argument(
+        "--graphs",
+        nargs="+",
+        choices=tuple(GRAPH_FACTORIES),
+        default=tuple(GRAPH_FACTORIES),
+        help="The shapes of the graphs to be measured."
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="The numbers of the injectables of the graphs."
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=1.0,
+        help="The approximate number of seconds spent on measuring each metric."
+    )
+    parser.add_argument("--output", help="The path of the JSON file of the results.")
+    parser.add_argument(
+        "--baseline",
+        help="The path of the JSON file of the results to compare the results to."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="The relative change of a metric above which it's reported as a regression."
+    )
+    options = parser.parse_args(arguments)
+
+    results = run_benchmarks(options.graphs, options.sizes, options.time_budget)
+    document = json.dumps(results, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            file.write(document)
+    elif not options.baseline:
+        print(document)
+
+    if not options.baseline:
+        return 0
+
+    with open(options.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    lines, has_regression = compare_results(baseline, results, options.tolerance)
+    print("\n".join(lines))
+    return 1 if has_regression else 0
+
+def _sample(operation: Callable[[], int], time_budget: float, min_sample_count: int) -> list[int]:
+    # Just like timeit, the garbage collector is disabled so that it doesn't skew the latencies.
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = list[int]()
+        deadline = time.perf_counter_ns() + int(time_budget * 1e9)
+        while time.perf_counter_ns() < deadline or len(samples) < min_sample_count:
+            samples.append(operation())
+        return samples
+    finally:
+        if is_gc_enabled:
+            gc.enable()
+
+def _summarize(samples: Sequence[int]) -> dict[str, float]:
+    sorted_samples = sorted(samples)
+    return {
+        "count": len(sorted_samples),
+        "min": sorted_samples[0],
+        "median": statistics.median(sorted_samples),
+        "p90": sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * 0.9))],
+        "mean": statistics.fmean(sorted_samples)
+    }
+
+def _get_value(result: Mapping[str, Any], path: tuple[str, ...]) -> float:
+    value: Any = result
+    for key in path:
+        value = value[key]
+    return value
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ("git", "rev-parse", "HEAD"),
+            capture_output=True,
+            check=True,
+            text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+if __name__ == "__main__":
+    sys.exit(main())
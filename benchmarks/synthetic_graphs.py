@@ -0,0 +1,177 @@
+"""Generators of synthetic catalogs whose dependency graphs have well-known shapes."""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Generic, Protocol, TypeVar
+
+from kanata.catalogs import IInjectableCatalog, InjectableCatalogBuilder
+from kanata.models import InjectableScopeType
+
+_TValue = TypeVar("_TValue", covariant=True)
+
+# The number of injectables in each layer of the layered graphs.
+_LAYER_WIDTH = 10
+
+class IPlugin(Protocol):
+    """The contract of the injectables of the multi-injection graphs."""
+
+class IGeneric(Protocol[_TValue]):
+    """The contract of the generic injectable of the generic graphs."""
+
+class GenericImpl(Generic[_TValue], IGeneric[_TValue]):
+    """The generic injectable of the generic graphs."""
+
+def create_wide_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog in which the root depends directly on all the other injectables.
+
+    :param size: The number of the dependencies of the root.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder()
+    leaves = [_register(builder, _create_type(f"WideLeaf{index}")) for index in range(size)]
+    root = _register(builder, _create_type("WideRoot", leaves))
+    return builder.build(), root
+
+def create_deep_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog in which the scoped injectables form a single chain of dependencies.
+
+    Unlike scoped injectables, transient dependencies are resolved recursively,
+    hence chains of them are limited by the recursion limit of the interpreter.
+
+    :param size: The length of the chain.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder()
+    node = _register(builder, _create_type("DeepNode0"), InjectableScopeType.SCOPED)
+    for index in range(1, size):
+        node = _register(
+            builder,
+            _create_type(f"DeepNode{index}", (node,)),
+            InjectableScopeType.SCOPED
+        )
+    return builder.build(), node
+
+def create_diamond_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog in which the scoped injectables form a chain of diamonds,
+    hence most of them are reachable via multiple paths.
+
+    Unlike scoped injectables, transient dependencies are constructed for each path,
+    hence the number of their instances would grow exponentially with the number of diamonds.
+
+    :param size: The approximate number of the injectables.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder()
+    scope = InjectableScopeType.SCOPED
+    node = _register(builder, _create_type("DiamondBase"), scope)
+    for index in range(max(1, (size - 1) // 3)):
+        left = _register(builder, _create_type(f"DiamondLeft{index}", (node,)), scope)
+        right = _register(builder, _create_type(f"DiamondRight{index}", (node,)), scope)
+        node = _register(builder, _create_type(f"DiamondTop{index}", (left, right)), scope)
+    return builder.build(), node
+
+def create_multi_injection_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog in which the root depends on all the injectables of the same contract.
+
+    :param size: The number of the injectables of the contract.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder()
+    for index in range(size):
+        builder.register_type(_create_type(f"Plugin{index}"), (IPlugin,))
+    root = _register(builder, _create_type("PluginHost", (tuple[IPlugin, ...],)))
+    return builder.build(), root
+
+def create_generic_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog in which the root depends on the closed types
+    of the same generic injectable for distinct type arguments.
+
+    :param size: The number of the distinct type arguments.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder().register_generic(GenericImpl, (IGeneric,))
+    type_arguments = [_create_type(f"GenericArgument{index}") for index in range(size)]
+    root = _register(builder, _create_type(
+        "GenericRoot",
+        [IGeneric[type_argument] for type_argument in type_arguments]
+    ))
+    return builder.build(), root
+
+def create_mixed_scope_graph(size: int) -> tuple[IInjectableCatalog, type]:
+    """Creates a catalog of layers of injectables that depend on two injectables
+    of the layer below, with singletons in the bottom half, scoped injectables above them
+    and transient injectables in the top layer, so that none of them is captive.
+
+    :param size: The approximate number of the injectables.
+    :type size: int
+    :return: The catalog and the type of the root injectable.
+    :rtype: tuple[IInjectableCatalog, type]
+    """
+
+    builder = InjectableCatalogBuilder()
+    width = min(size, _LAYER_WIDTH)
+    layer_count = max(1, size // width)
+    layer = list[type]()
+    for layer_index in range(layer_count):
+        scope = (
+            InjectableScopeType.SINGLETON if layer_index < layer_count // 2
+            else InjectableScopeType.SCOPED if layer_index < layer_count - 1
+            else InjectableScopeType.TRANSIENT
+        )
+        layer = [
+            _register(
+                builder,
+                _create_type(
+                    f"MixedNode{layer_index}_{index}",
+                    (layer[index], layer[(index + 1) % width]) if layer else ()
+                ),
+                scope
+            )
+            for index in range(width)
+        ]
+    root = _register(builder, _create_type("MixedRoot", layer))
+    return builder.build(), root
+
+GRAPH_FACTORIES: Mapping[str, Callable[[int], tuple[IInjectableCatalog, type]]] = {
+    "wide": create_wide_graph,
+    "deep": create_deep_graph,
+    "diamond": create_diamond_graph,
+    "multi_injection": create_multi_injection_graph,
+    "generic": create_generic_graph,
+    "mixed_scope": create_mixed_scope_graph
+}
+"""The factories of the synthetic catalogs, keyed by the names of the shapes of their graphs."""
+
+def _register(
+    builder: InjectableCatalogBuilder,
+    injectable_type: type,
+    scope_type: InjectableScopeType = InjectableScopeType.TRANSIENT
+) -> type:
+    builder.register_type(injectable_type, (injectable_type,), scope_type)
+    return injectable_type
+
+def _create_type(name: str, dependencies: Sequence[Any] = ()) -> type:
+    # The initializer is compiled from source, so that its signature
+    # is inspected and bound the same way as the ones of hand-written classes.
+    namespace = {f"_T{index}": dependency for index, dependency in enumerate(dependencies)}
+    parameters = "".join(f", d{index}: _T{index}" for index in range(len(dependencies)))
+    arguments = "".join(f"d{index}, " for index in range(len(dependencies)))
+    exec( # pylint: disable=exec-used
+        f"def __init__(self{parameters}) -> None:\n    self.dependencies = ({arguments})",
+        namespace
+    )
+    return type(name, (), {"__init__": namespace["__init__"], "__module__": __name__})
@@ -1,13 +1,9 @@
 from os.path import dirname, join
 
-import structlog
 import sys
 
 sys.path.append(join(dirname(__file__), "samples"))
 
-# Disable the log spam for the samples.
-structlog.configure_once(logger_factory=structlog.ReturnLoggerFactory())
-
 from samples.calculator import run as run_sample_calculator # pylint: disable=no-name-in-module,wrong-import-position
 
 VALID_SAMPLES = ["calculator"]
@@ -1,5 +1,30 @@
 """Quick access to the core functionality."""
 
-from .ilifetime_scope import ILifetimeScope, TInjectable
-from .injectable_discovery import find_injectables
-from .lifetime_scope import LifetimeScope
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .container_compiler import compile_container, load_container
+    from .dependency_analysis import analyze_dependencies
+    from .factory import Factory
+    from .ilifetime_scope import ILifetimeScope, TInjectable, TResult
+    from .injectable_discovery import find_injectable_references, find_injectables
+    from .keyed_scope_cache import KeyedScopeCache
+    from .lifetime_scope import LifetimeScope
+    from .lifetime_scope_options import LifetimeScopeOptions
+    from .lifetime_scope_pool import LifetimeScopePool
+    from .provider import Provider
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "container_compiler": ("compile_container", "load_container"),
+    "dependency_analysis": ("analyze_dependencies",),
+    "factory": ("Factory",),
+    "ilifetime_scope": ("ILifetimeScope", "TInjectable", "TResult"),
+    "injectable_discovery": ("find_injectable_references", "find_injectables"),
+    "keyed_scope_cache": ("KeyedScopeCache",),
+    "lifetime_scope": ("LifetimeScope",),
+    "lifetime_scope_options": ("LifetimeScopeOptions",),
+    "lifetime_scope_pool": ("LifetimeScopePool",),
+    "provider": ("Provider",)
+})
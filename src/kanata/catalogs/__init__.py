@@ -1,3 +1,20 @@
-from .iinjectable_catalog import IInjectableCatalog
-from .injectable_catalog import InjectableCatalog
-from .injectable_catalog_builder import InjectableCatalogBuilder
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .iinjectable_catalog import IInjectableCatalog
+    from .injectable_catalog import InjectableCatalog
+    from .injectable_catalog_builder import InjectableCatalogBuilder
+    from .lazy_injectable_catalog import LazyInjectableCatalog
+    from .mutable_injectable_catalog import MutableInjectableCatalog
+    from .overlay_injectable_catalog import OverlayInjectableCatalog
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "iinjectable_catalog": ("IInjectableCatalog",),
+    "injectable_catalog": ("InjectableCatalog",),
+    "injectable_catalog_builder": ("InjectableCatalogBuilder",),
+    "lazy_injectable_catalog": ("LazyInjectableCatalog",),
+    "mutable_injectable_catalog": ("MutableInjectableCatalog",),
+    "overlay_injectable_catalog": ("OverlayInjectableCatalog",)
+})
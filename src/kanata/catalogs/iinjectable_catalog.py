@@ -38,3 +38,14 @@ class IInjectableCatalog(Protocol):
         :rtype: InjectableRegistration | None
         """
         ...
+
+    def is_registered(self, contract: type) -> bool:
+        """Determines whether there is any registration associated to
+        the specified contract or injectable, without raising any exceptions.
+
+        :param contract: The contract or injectable to check.
+        :type contract: type
+        :return: True, if there is at least one matching registration.
+        :rtype: bool
+        """
+        ...
@@ -1,12 +1,10 @@
 from collections.abc import Iterable
 from typing import get_origin
 
-from kanata.exceptions import InjectableRegistrationException
-from kanata.models import (
-    InjectableInstanceRegistration, InjectableRegistration, InjectableTypeRegistration
-)
+from kanata.models import InjectableRegistration
 from kanata.utils import get_generic_type_parameters, get_or_add
 from .iinjectable_catalog import IInjectableCatalog
+from .registration_utils import get_injectable_key, is_contract_registered
 
 class InjectableCatalog(IInjectableCatalog):
     """Provides access to information about the known injectables."""
@@ -38,6 +36,11 @@ class InjectableCatalog(IInjectableCatalog):
     ) -> InjectableRegistration | None:
         return self.__registrations_by_injectable.get(injectable, None)
 
+    def is_registered(self, contract: type) -> bool:
+        return is_contract_registered(
+            contract, self.__registrations_by_contract, self.__registrations_by_injectable
+        )
+
     def __build_registration_maps(self, registrations: Iterable[InjectableRegistration]) -> None:
         for registration in registrations:
             for contract_type in registration.contract_types:
@@ -47,15 +50,5 @@ class InjectableCatalog(IInjectableCatalog):
                     lambda _: [])
                 by_injectables.append(registration)
 
-            match registration:
-                case InjectableTypeRegistration():
-                    key = registration.injectable_type
-                case InjectableInstanceRegistration():
-                    key = type(registration.injectable_instance)
-                case _:
-                    raise InjectableRegistrationException(
-                        type(registration),
-                        "Unsupported type of injectable registration."
-                    )
-
+            key = get_injectable_key(registration)
             self.__registrations_by_injectable[key] = registration
@@ -3,8 +3,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import Any
 
-from kanata import find_injectables
 from kanata.exceptions import ArgumentException
+from kanata.injectable_discovery import find_injectables
 from kanata.models import (
     InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType,
     InjectableTypeRegistration
@@ -19,16 +19,30 @@ class InjectableCatalogBuilder:
     def __init__(self) -> None:
         self.__registrations = list[InjectableRegistration]()
 
-    def add_module(self, module_name: str) -> InjectableCatalogBuilder:
+    def add_module(
+        self,
+        module_name: str,
+        scan_sources: bool = False,
+        manifest_path: str | None = None
+    ) -> InjectableCatalogBuilder:
         """Discovers the injectable registrations from the module with the specified name.
 
         :param module_name: The name of the module to explore.
         :type module_name: str
+        :param scan_sources: Whether to scan the source files to find the modules to import,
+            instead of importing every package, defaults to False.
+        :type scan_sources: bool, optional
+        :param manifest_path: The path of the discovery manifest file to use, if any.
+        :type manifest_path: str | None, optional
         :return: The same instance of the builder.
         :rtype: InjectableCatalogBuilder
         """
 
-        self.__registrations.extend(find_injectables(module_name))
+        self.__registrations.extend(find_injectables(
+            module_name,
+            scan_sources,
+            manifest_path=manifest_path
+        ))
         return self
 
     def register_instance(
@@ -59,7 +73,9 @@ class InjectableCatalogBuilder:
         self,
         injectable_type: type,
         contract_types: Iterable[type],
-        scope_type: InjectableScopeType = InjectableScopeType.TRANSIENT
+        scope_type: InjectableScopeType = InjectableScopeType.TRANSIENT,
+        time_to_live: float | None = None,
+        refresh_in_background: bool = True
     ) -> InjectableCatalogBuilder:
         """Registers the specified type as an injectable.
 
@@ -69,17 +85,59 @@ class InjectableCatalogBuilder:
         :type contract_types: Iterable[type]
         :param scope_type: The injectable scope, defaults to InjectableScopeType.TRANSIENT
         :type scope_type: InjectableScopeType, optional
+        :param time_to_live: The number of seconds after which a singleton expires, defaults to None
+        :type time_to_live: float | None, optional
+        :param refresh_in_background: Whether to rebuild an expired singleton in the background,
+            defaults to True
+        :type refresh_in_background: bool, optional
+        :return: The same instance of the builder.
+        :rtype: InjectableCatalogBuilder
+        """
+
+        return self.__register_type(
+            injectable_type,
+            contract_types,
+            False,
+            scope_type,
+            time_to_live,
+            refresh_in_background
+        )
+
+    def register_external(
+        self,
+        injectable_type: type,
+        contract_types: Iterable[type] | None = None
+    ) -> InjectableCatalogBuilder:
+        """Registers the specified type as a scoped injectable whose instances
+        are added to lifetime scopes explicitly, instead of being constructed.
+
+        :param injectable_type: The type to be registered.
+        :type injectable_type: type
+        :param contract_types: The contracts by which to register the type,
+            defaults to the type itself.
+        :type contract_types: Iterable[type] | None, optional
         :return: The same instance of the builder.
         :rtype: InjectableCatalogBuilder
         """
 
-        return self.__register_type(injectable_type, contract_types, False, scope_type)
+        # TODO https://github.com/PyCQA/pylint/issues/6550
+        self.__registrations.append(
+            InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
+                contract_types=set(contract_types or (injectable_type,)),
+                injectable_type=injectable_type,
+                scope=InjectableScopeType.SCOPED,
+                is_external=True
+            )
+        )
+        return self
 
     def register_generic(
         self,
         injectable_type: type,
         contract_types: Iterable[type],
-        scope_type: InjectableScopeType = InjectableScopeType.TRANSIENT
+        scope_type: InjectableScopeType = InjectableScopeType.TRANSIENT,
+        time_to_live: float | None = None,
+        refresh_in_background: bool = True
     ) -> InjectableCatalogBuilder:
         """Registers the specified generic type as an injectable.
 
@@ -89,6 +147,11 @@ class InjectableCatalogBuilder:
         :type contract_types: Iterable[type]
         :param scope_type: The injectable scope, defaults to InjectableScopeType.TRANSIENT
         :type scope_type: InjectableScopeType, optional
+        :param time_to_live: The number of seconds after which a singleton expires, defaults to None
+        :type time_to_live: float | None, optional
+        :param refresh_in_background: Whether to rebuild an expired singleton in the background,
+            defaults to True
+        :type refresh_in_background: bool, optional
         :return: The same instance of the builder.
         :rtype: InjectableCatalogBuilder
         """
@@ -97,7 +160,14 @@ class InjectableCatalogBuilder:
         for contract_type in contract_types:
             InjectableCatalogBuilder.__validate_generic_type(contract_type)
 
-        return self.__register_type(injectable_type, contract_types, True, scope_type)
+        return self.__register_type(
+            injectable_type,
+            contract_types,
+            True,
+            scope_type,
+            time_to_live,
+            refresh_in_background
+        )
 
     def build(self) -> IInjectableCatalog:
         """Builds the injectable catalog.
@@ -122,7 +192,9 @@ class InjectableCatalogBuilder:
         injectable_type: type,
         contract_types: Iterable[type],
         is_generic: bool,
-        scope_type: InjectableScopeType
+        scope_type: InjectableScopeType,
+        time_to_live: float | None,
+        refresh_in_background: bool
     ) -> InjectableCatalogBuilder:
         # TODO https://github.com/PyCQA/pylint/issues/6550
         self.__registrations.append(
@@ -130,7 +202,9 @@ class InjectableCatalogBuilder:
                 contract_types=set(contract_types),
                 injectable_type=injectable_type,
                 is_generic=is_generic,
-                scope=scope_type
+                scope=scope_type,
+                time_to_live=time_to_live,
+                refresh_in_background=refresh_in_background
             )
         )
         return self
@@ -0,0 +1,100 @@
+import functools
+import importlib
+from collections.abc import Iterable
+from typing import get_origin
+
+from kanata.exceptions import InjectableRegistrationException
+from kanata.models import InjectableRegistration, InjectableTypeRegistration, ManifestRegistration
+from kanata.utils import get_generic_type_parameters, get_or_add, get_type_name
+from .iinjectable_catalog import IInjectableCatalog
+
+class LazyInjectableCatalog(IInjectableCatalog):
+    """A catalog that refers to its injectables by the names of their modules and types,
+    such as the ones recorded in a discovery manifest, and imports the module
+    of an injectable only when its registration is first requested.
+
+    Therefore, a process imports only the modules of the injectables
+    it actually resolves, while the contracts are expected to be imported by the callers.
+    """
+
+    def __init__(self, references: Iterable[ManifestRegistration]) -> None:
+        """Initializes a new instance.
+
+        :param references: The references to the registrations of the injectables.
+        :type references: Iterable[ManifestRegistration]
+        """
+
+        self.__references_by_contract: dict[str, list[ManifestRegistration]] = {}
+        self.__references_by_injectable: dict[str, ManifestRegistration] = {}
+        self.__registrations: dict[str, InjectableRegistration] = {}
+        # The names of the requested types, since formatting them on each lookup is expensive.
+        self.__type_names: dict[type, str] = {}
+        for reference in references:
+            injectable_name = f"{reference.module_name}:{reference.qualname}"
+            self.__references_by_injectable[injectable_name] = reference
+            for contract_name in reference.contract_types:
+                get_or_add(self.__references_by_contract, contract_name, lambda _: []).append(
+                    reference
+                )
+
+    def get_registrations(self) -> tuple[InjectableRegistration, ...]:
+        """Gets all the registrations available in the catalog.
+
+        This imports the modules of all of the injectables.
+
+        :return: The available registrations.
+        :rtype: tuple[InjectableRegistration, ...]
+        """
+
+        return tuple(map(self.__load, self.__references_by_injectable.values()))
+
+    def get_registrations_by_contract(
+        self,
+        contract: type
+    ) -> tuple[InjectableRegistration, ...]:
+        references = [*self.__references_by_contract.get(self.__get_type_name(contract), ())]
+
+        if (origin := get_origin(contract)) and get_generic_type_parameters(origin):
+            references.extend(self.__references_by_contract.get(self.__get_type_name(origin), ()))
+
+        return tuple(map(self.__load, references))
+
+    def get_registration_by_injectable(
+        self,
+        injectable: type
+    ) -> InjectableRegistration | None:
+        if not (reference := self.__references_by_injectable.get(self.__get_type_name(injectable))):
+            return None
+
+        return self.__load(reference)
+
+    def is_registered(self, contract: type) -> bool:
+        name = self.__get_type_name(contract)
+        if name in self.__references_by_contract or name in self.__references_by_injectable:
+            return True
+
+        return bool(
+            (origin := get_origin(contract))
+            and self.__get_type_name(origin) in self.__references_by_contract
+            and get_generic_type_parameters(origin)
+        )
+
+    def __get_type_name(self, clazz: type) -> str:
+        return get_or_add(self.__type_names, clazz, get_type_name)
+
+    def __load(self, reference: ManifestRegistration) -> InjectableRegistration:
+        injectable_name = f"{reference.module_name}:{reference.qualname}"
+        if registration := self.__registrations.get(injectable_name):
+            return registration
+
+        module = importlib.import_module(reference.module_name)
+        injectable_type: type = functools.reduce(getattr, reference.qualname.split("."), module)
+        registration = vars(injectable_type).get(InjectableTypeRegistration.PROPERTY_NAME)
+        if not isinstance(registration, InjectableTypeRegistration):
+            raise InjectableRegistrationException(
+                injectable_type,
+                "The referenced injectable isn't declared as an injectable by its module."
+            )
+
+        self.__registrations[injectable_name] = registration
+        return registration
@@ -0,0 +1,177 @@
+import threading
+from collections.abc import Callable, Iterable
+from typing import get_origin
+
+from kanata.models import InjectableRegistration
+from kanata.utils import get_generic_type_parameters
+from .iinjectable_catalog import IInjectableCatalog
+from .registration_utils import get_injectable_key, is_contract_registered
+
+ChangeListener = Callable[[frozenset[type]], None]
+
+class MutableInjectableCatalog(IInjectableCatalog):
+    """A catalog of injectables whose registrations may change at runtime,
+    such as when plugins are loaded.
+
+    The resolution plans depending on the changed contracts are invalidated,
+    while the rest of them remain cached. Instances resolved before a change
+    are kept by the lifetime scopes.
+    """
+
+    def __init__(self, registrations: Iterable[InjectableRegistration] = ()) -> None:
+        """Initializes a new instance.
+
+        :param registrations: The initial registrations, defaults to none.
+        :type registrations: Iterable[InjectableRegistration], optional
+        """
+
+        # Readers aren't locked, hence the maps are replaced instead of being modified.
+        self.__lock = threading.Lock()
+        self.__registrations_by_contract: dict[type, tuple[InjectableRegistration, ...]] = {}
+        self.__registrations_by_injectable: dict[type, InjectableRegistration] = {}
+        self.__change_listeners: tuple[ChangeListener, ...] = ()
+        self.__build_registration_maps(registrations)
+
+    def get_registrations(self) -> tuple[InjectableRegistration, ...]:
+        return tuple(self.__registrations_by_injectable.values())
+
+    def get_registrations_by_contract(
+        self,
+        contract: type
+    ) -> tuple[InjectableRegistration, ...]:
+        registrations = self.__registrations_by_contract.get(contract, ())
+        if (origin := get_origin(contract)) and get_generic_type_parameters(origin):
+            registrations += self.__registrations_by_contract.get(origin, ())
+
+        return registrations
+
+    def get_registration_by_injectable(
+        self,
+        injectable: type
+    ) -> InjectableRegistration | None:
+        return self.__registrations_by_injectable.get(injectable, None)
+
+    def is_registered(self, contract: type) -> bool:
+        return is_contract_registered(
+            contract, self.__registrations_by_contract, self.__registrations_by_injectable
+        )
+
+    def add_registration(self, registration: InjectableRegistration) -> None:
+        """Adds the specified registration, replacing the existing registration
+        of the same injectable, if there is one.
+
+        :param registration: The registration to be added.
+        :type registration: InjectableRegistration
+        :raises InjectableRegistrationException: Raised when the registration is invalid.
+        """
+
+        with self.__lock:
+            changed_types = self.__add_registration(registration)
+            change_listeners = self.__change_listeners
+
+        for change_listener in change_listeners:
+            change_listener(changed_types)
+
+    def remove_registration(self, registration: InjectableRegistration) -> bool:
+        """Removes the specified registration.
+
+        :param registration: The registration to be removed.
+        :type registration: InjectableRegistration
+        :return: True, if the registration has been found and removed.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            key = get_injectable_key(registration)
+            if self.__registrations_by_injectable.get(key) is not registration:
+                return False
+
+            changed_types = self.__remove_registration(key, registration)
+            change_listeners = self.__change_listeners
+
+        for change_listener in change_listeners:
+            change_listener(changed_types)
+        return True
+
+    def add_change_listener(self, change_listener: ChangeListener) -> None:
+        """Adds a listener that is notified of the contracts and injectables
+        affected by each change, after the change has been made.
+
+        :param change_listener: The listener to be notified.
+        :type change_listener: ChangeListener
+        """
+
+        with self.__lock:
+            self.__change_listeners += (change_listener,)
+
+    def remove_change_listener(self, change_listener: ChangeListener) -> None:
+        """Removes a listener added earlier.
+
+        :param change_listener: The listener to be removed.
+        :type change_listener: ChangeListener
+        """
+
+        with self.__lock:
+            self.__change_listeners = tuple(
+                listener
+                for listener in self.__change_listeners
+                if listener != change_listener
+            )
+
+    def __build_registration_maps(self, registrations: Iterable[InjectableRegistration]) -> None:
+        registrations_by_contract = dict[type, list[InjectableRegistration]]()
+        for registration in registrations:
+            for contract_type in registration.contract_types:
+                registrations_by_contract.setdefault(contract_type, []).append(registration)
+
+            key = get_injectable_key(registration)
+            self.__registrations_by_injectable[key] = registration
+
+        self.__registrations_by_contract = {
+            contract_type: tuple(contract_registrations)
+            for contract_type, contract_registrations in registrations_by_contract.items()
+        }
+
+    def __add_registration(self, registration: InjectableRegistration) -> frozenset[type]:
+        key = get_injectable_key(registration)
+        changed_types = set[type]()
+        if replaced_registration := self.__registrations_by_injectable.get(key):
+            changed_types.update(self.__remove_registration(key, replaced_registration))
+
+        registrations_by_contract = dict(self.__registrations_by_contract)
+        for contract_type in registration.contract_types:
+            registrations_by_contract[contract_type] = (
+                registrations_by_contract.get(contract_type, ()) + (registration,)
+            )
+        self.__registrations_by_contract = registrations_by_contract
+        self.__registrations_by_injectable = {
+            **self.__registrations_by_injectable,
+            key: registration
+        }
+
+        changed_types.update(registration.contract_types)
+        changed_types.add(key)
+        return frozenset(changed_types)
+
+    def __remove_registration(
+        self,
+        key: type,
+        registration: InjectableRegistration
+    ) -> frozenset[type]:
+        registrations_by_contract = dict(self.__registrations_by_contract)
+        for contract_type in registration.contract_types:
+            remaining_registrations = tuple(
+                other_registration
+                for other_registration in registrations_by_contract.get(contract_type, ())
+                if other_registration is not registration
+            )
+            if remaining_registrations:
+                registrations_by_contract[contract_type] = remaining_registrations
+            else:
+                registrations_by_contract.pop(contract_type, None)
+        self.__registrations_by_contract = registrations_by_contract
+        registrations_by_injectable = dict(self.__registrations_by_injectable)
+        del registrations_by_injectable[key]
+        self.__registrations_by_injectable = registrations_by_injectable
+
+        return frozenset((*registration.contract_types, key))
@@ -0,0 +1,111 @@
+from collections.abc import Iterable
+from typing import get_origin
+
+from kanata.models import InjectableRegistration
+from .iinjectable_catalog import IInjectableCatalog
+from .injectable_catalog import InjectableCatalog
+
+class OverlayInjectableCatalog(IInjectableCatalog):
+    """A catalog that layers a few override registrations over a base catalog.
+
+    The contracts of the override registrations are served exclusively by them,
+    while the rest of the contracts are served by the base catalog as-is,
+    hence the base catalog is neither copied nor modified. Lifetime scopes
+    of an overlay reuse the resolution plans of the base catalog
+    that don't depend on any of the overridden contracts.
+    """
+
+    def __init__(
+        self,
+        base: IInjectableCatalog,
+        overrides: Iterable[InjectableRegistration]
+    ) -> None:
+        """Initializes a new instance.
+
+        :param base: The catalog to be overlaid. It must not change afterwards.
+        :type base: IInjectableCatalog
+        :param overrides: The registrations that override the ones of the base catalog.
+        :type overrides: Iterable[InjectableRegistration]
+        """
+
+        self.__base = base
+        self.__overrides = InjectableCatalog(overrides)
+        self.__overridden_contracts = frozenset(
+            contract_type
+            for registration in self.__overrides.get_registrations()
+            for contract_type in registration.contract_types
+        )
+
+    @property
+    def base(self) -> IInjectableCatalog:
+        """Gets the overlaid catalog.
+
+        :return: The overlaid catalog.
+        :rtype: IInjectableCatalog
+        """
+
+        return self.__base
+
+    @property
+    def overridden_contracts(self) -> frozenset[type]:
+        """Gets the contracts served exclusively by the override registrations.
+
+        :return: The contracts served exclusively by the override registrations.
+        :rtype: frozenset[type]
+        """
+
+        return self.__overridden_contracts
+
+    def is_overridden(self, contract: type) -> bool:
+        """Determines whether the specified contract, or the injectable
+        of the same type, is served by the override registrations.
+
+        :param contract: The contract or injectable to check.
+        :type contract: type
+        :return: True, if the contract is served by the override registrations.
+        :rtype: bool
+        """
+
+        return (
+            self.__is_overridden_contract(contract)
+            or self.__overrides.get_registration_by_injectable(contract) is not None
+        )
+
+    def get_registrations(self) -> tuple[InjectableRegistration, ...]:
+        # Base registrations are hidden once all of their contracts are overridden.
+        return self.__overrides.get_registrations() + tuple(
+            registration
+            for registration in self.__base.get_registrations()
+            if not registration.contract_types <= self.__overridden_contracts
+        )
+
+    def get_registrations_by_contract(
+        self,
+        contract: type
+    ) -> tuple[InjectableRegistration, ...]:
+        if self.__is_overridden_contract(contract):
+            return self.__overrides.get_registrations_by_contract(contract)
+
+        return self.__base.get_registrations_by_contract(contract)
+
+    def get_registration_by_injectable(
+        self,
+        injectable: type
+    ) -> InjectableRegistration | None:
+        return (
+            self.__overrides.get_registration_by_injectable(injectable)
+            or self.__base.get_registration_by_injectable(injectable)
+        )
+
+    def is_registered(self, contract: type) -> bool:
+        if self.__overrides.is_registered(contract):
+            return True
+
+        return not self.__is_overridden_contract(contract) and self.__base.is_registered(contract)
+
+    def __is_overridden_contract(self, contract: type) -> bool:
+        # Overriding an open generic contract overrides all of its closed variants, too.
+        return (
+            contract in self.__overridden_contracts
+            or get_origin(contract) in self.__overridden_contracts
+        )
@@ -0,0 +1,89 @@
+"""Utility methods for injectable registrations."""
+
+from collections.abc import Mapping
+from typing import Any, get_origin
+
+from kanata.exceptions import InjectableRegistrationException
+from kanata.models import (
+    InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType,
+    InjectableTypeRegistration
+)
+from kanata.utils import get_generic_type_parameters
+
+def get_injectable_key(registration: InjectableRegistration) -> type:
+    """Validates the specified registration and gets the type of its injectable,
+    by which the registration is identified within a catalog.
+
+    :param registration: The registration to be validated.
+    :type registration: InjectableRegistration
+    :raises InjectableRegistrationException: Raised when the registration is invalid.
+    :return: The type of the injectable of the registration.
+    :rtype: type
+    """
+
+    match registration:
+        case InjectableTypeRegistration():
+            __validate_time_to_live(registration)
+            __validate_external(registration)
+            return registration.injectable_type
+        case InjectableInstanceRegistration():
+            return type(registration.injectable_instance)
+        case _:
+            raise InjectableRegistrationException(
+                type(registration),
+                "Unsupported type of injectable registration."
+            )
+
+def is_contract_registered(
+    contract: type,
+    registrations_by_contract: Mapping[type, Any],
+    registrations_by_injectable: Mapping[type, Any]
+) -> bool:
+    """Determines whether the specified contract is registered in the specified maps
+    of a catalog, either directly, as an injectable, or via its open generic type.
+
+    :param contract: The contract to be checked.
+    :type contract: type
+    :param registrations_by_contract: The registrations of the catalog, keyed by their contracts.
+    :type registrations_by_contract: Mapping[type, Any]
+    :param registrations_by_injectable: The registrations of the catalog,
+        keyed by their injectables.
+    :type registrations_by_injectable: Mapping[type, Any]
+    :return: True, if the contract is registered.
+    :rtype: bool
+    """
+
+    if contract in registrations_by_contract:
+        return True
+
+    if contract in registrations_by_injectable:
+        return True
+
+    return bool(
+        (origin := get_origin(contract))
+        and origin in registrations_by_contract
+        and get_generic_type_parameters(origin)
+    )
+
+def __validate_external(registration: InjectableTypeRegistration) -> None:
+    if registration.is_external and registration.scope != InjectableScopeType.SCOPED:
+        raise InjectableRegistrationException(
+            registration.injectable_type,
+            "Only scoped injectables may be external."
+        )
+
+def __validate_time_to_live(registration: InjectableTypeRegistration) -> None:
+    if registration.time_to_live is None:
+        return
+
+    if registration.scope != InjectableScopeType.SINGLETON:
+        raise InjectableRegistrationException(
+            registration.injectable_type,
+            "Only singleton injectables may have a time-to-live."
+        )
+
+    if registration.time_to_live <= 0:
+        raise InjectableRegistrationException(
+            registration.injectable_type,
+            "The time-to-live of an injectable must be positive."
+        )
@@ -0,0 +1,195 @@
+"""Utilities for compiling catalogs and their resolution plans into a picklable form."""
+
+from collections.abc import Iterable
+
+from .catalogs import IInjectableCatalog, InjectableCatalog
+from .exceptions import InjectableRegistrationException
+from .lifetime_scope import LifetimeScope
+from .lifetime_scope_options import LifetimeScopeOptions
+from .models import (
+    CompiledContainer, CompiledRegistration, CompiledResolutionPlan, CompiledResolutionStep,
+    InjectableInstanceRegistration, InjectableRegistration, InjectableTypeRegistration,
+    ResolutionPlan, ResolutionStep
+)
+from .plans import ResolutionPlanner
+from .resolvers import IResolver
+from .utils import get_type_by_name, get_type_name
+
+def compile_container(
+    catalog: IInjectableCatalog,
+    requested_types: Iterable[type] = ()
+) -> CompiledContainer:
+    """Compiles the specified catalog, along with the resolution plans built for it so far,
+    into a picklable form that refers to the types by their qualified names.
+
+    The types must be importable by their qualified names, hence types
+    defined within functions cannot be compiled. Registered instances are pickled as-is.
+
+    :param catalog: The catalog to be compiled.
+    :type catalog: IInjectableCatalog
+    :param requested_types: The injectables or contracts whose plans
+        are to be built before the compilation, defaults to ().
+    :type requested_types: Iterable[type], optional
+    :return: The compiled form of the catalog and of its plans.
+    :rtype: CompiledContainer
+    """
+
+    planner = ResolutionPlanner.for_catalog(catalog)
+    for requested_type in requested_types:
+        planner.get_plan((planner.get_injectable_type(requested_type),))
+
+    registrations = catalog.get_registrations()
+    registration_indexes = {
+        id(registration): index for index, registration in enumerate(registrations)
+    }
+    closed_generic_type_infos = tuple(planner.closed_generic_types.values())
+    closed_generic_type_indexes = {
+        generic_type_info.closed_generic_type: index
+        for index, generic_type_info in enumerate(closed_generic_type_infos)
+    }
+
+    def get_name(typ: type) -> str | int:
+        index = closed_generic_type_indexes.get(typ)
+        return get_type_name(typ) if index is None else index
+
+    return CompiledContainer(
+        registrations=tuple(
+            __compile_registration(catalog, registration) for registration in registrations
+        ),
+        closed_generic_types=tuple(
+            (
+                registration_indexes[id(generic_type_info.origin_registration)],
+                get_type_name(generic_type_info.generic_type_argument)
+            )
+            for generic_type_info in closed_generic_type_infos
+        ),
+        plans=tuple(
+            CompiledResolutionPlan(
+                requested_types=tuple(map(get_name, plan.requested_types)),
+                injectable_types=tuple(map(get_name, plan.injectable_types)),
+                steps=tuple(
+                    CompiledResolutionStep(
+                        get_name(step.injectable_type),
+                        registration_indexes[id(step.registration)],
+                        step.scope_type,
+                        step.is_requested
+                    )
+                    for step in plan.steps
+                ),
+                contracts=tuple(map(get_type_name, plan.contracts))
+            )
+            for plan in planner.get_plans()
+        )
+    )
+
+def load_container(
+    container: CompiledContainer,
+    resolvers: tuple[IResolver, ...] | None = None,
+    options: LifetimeScopeOptions | None = None
+) -> LifetimeScope:
+    """Restores a root lifetime scope, along with its resolution plans,
+    from the specified compiled container, without discovery and planning.
+
+    :param container: The compiled container.
+    :type container: CompiledContainer
+    :param resolvers: The resolvers of the lifetime scope, defaults to None.
+    :type resolvers: tuple[IResolver, ...] | None, optional
+    :param options: The options of the lifetime scope, defaults to None.
+    :type options: LifetimeScopeOptions | None, optional
+    :return: A new root lifetime scope that is ready to resolve the planned injectables.
+    :rtype: LifetimeScope
+    """
+
+    registrations = tuple(map(__load_registration, container.registrations))
+    catalog = InjectableCatalog(registrations)
+    lifetime_scope = LifetimeScope(catalog, resolvers, options)
+    planner = ResolutionPlanner.for_catalog(catalog)
+    closed_generic_types = tuple(
+        planner.get_closed_generic_type(
+            registrations[registration_index], # type: ignore
+            get_type_by_name(type_argument)
+        ).closed_generic_type
+        for registration_index, type_argument in container.closed_generic_types
+    )
+    types_by_name: dict[str, type] = {}
+
+    def get_type(name: str | int) -> type:
+        if isinstance(name, int):
+            return closed_generic_types[name]
+        if (typ := types_by_name.get(name)) is None:
+            types_by_name[name] = typ = get_type_by_name(name)
+        return typ
+
+    for plan in container.plans:
+        planner.add_plan(ResolutionPlan(
+            requested_types=tuple(map(get_type, plan.requested_types)),
+            injectable_types=tuple(map(get_type, plan.injectable_types)),
+            steps=tuple(
+                ResolutionStep(
+                    get_type(step.injectable_type),
+                    registrations[step.registration],
+                    step.scope_type,
+                    step.is_requested
+                )
+                for step in plan.steps
+            ),
+            contracts=frozenset(map(get_type, plan.contracts))
+        ))
+
+    return lifetime_scope
+
+def __compile_registration(
+    catalog: IInjectableCatalog,
+    registration: InjectableRegistration
+) -> CompiledRegistration:
+    # Only the contracts the registration effectively serves, such as in an overlay catalog.
+    contract_types = tuple(
+        get_type_name(contract_type)
+        for contract_type in registration.contract_types
+        if any(
+            other_registration is registration
+            for other_registration in catalog.get_registrations_by_contract(contract_type)
+        )
+    )
+    match registration:
+        case InjectableTypeRegistration():
+            # TODO https://github.com/PyCQA/pylint/issues/6550
+            return CompiledRegistration( # pylint: disable=unexpected-keyword-arg
+                injectable_type=get_type_name(registration.injectable_type),
+                contract_types=contract_types,
+                scope=registration.scope,
+                is_generic=registration.is_generic,
+                time_to_live=registration.time_to_live,
+                refresh_in_background=registration.refresh_in_background,
+                is_external=registration.is_external
+            )
+        case InjectableInstanceRegistration():
+            return CompiledRegistration( # pylint: disable=unexpected-keyword-arg
+                injectable_type=None,
+                injectable_instance=registration.injectable_instance,
+                contract_types=contract_types
+            )
+        case _:
+            raise InjectableRegistrationException(
+                type(registration),
+                "Unsupported type of injectable registration."
+            )
+
+def __load_registration(registration: CompiledRegistration) -> InjectableRegistration:
+    contract_types = set(map(get_type_by_name, registration.contract_types))
+    if registration.injectable_type is None:
+        # TODO https://github.com/PyCQA/pylint/issues/6550
+        return InjectableInstanceRegistration( # pylint: disable=unexpected-keyword-arg
+            injectable_instance=registration.injectable_instance,
+            contract_types=contract_types
+        )
+
+    return InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
+        injectable_type=get_type_by_name(registration.injectable_type),
+        contract_types=contract_types,
+        scope=registration.scope,
+        is_generic=registration.is_generic,
+        time_to_live=registration.time_to_live,
+        refresh_in_background=registration.refresh_in_background,
+        is_external=registration.is_external
+    )
@@ -1,4 +1,18 @@
 """Decorators."""
 
-from .injectable import injectable
-from .scope import scope
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .expires import expires
+    from .inject import inject
+    from .injectable import injectable
+    from .scope import scope
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "expires": ("expires",),
+    "inject": ("inject",),
+    "injectable": ("injectable",),
+    "scope": ("scope",)
+})
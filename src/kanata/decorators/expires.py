@@ -0,0 +1,29 @@
+from collections.abc import Callable
+from typing import TypeVar
+
+from kanata.injectable_registry import get_or_add_registration
+
+T = TypeVar("T")
+
+def expires(
+    time_to_live: float,
+    refresh_in_background: bool = True
+) -> Callable[[type[T]], type[T]]:
+    """Specifies the time-to-live of a singleton injectable class,
+    after which its instance is rebuilt.
+
+    :param time_to_live: The number of seconds after which the instance expires.
+    :type time_to_live: float
+    :param refresh_in_background: Whether to rebuild the instance in the background
+        while still returning the stale instance, defaults to True.
+    :type refresh_in_background: bool, optional
+    :return: A decorator that returns the same class that it decorates.
+    :rtype: Callable[[type[T]], type[T]]
+    """
+    def decorator(wrapped_class: type[T]) -> type[T]:
+        registration = get_or_add_registration(wrapped_class)
+        registration.time_to_live = time_to_live
+        registration.refresh_in_background = refresh_in_background
+        return wrapped_class
+
+    return decorator
@@ -0,0 +1,41 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from kanata.ilifetime_scope import ILifetimeScope
+
+TCallable = TypeVar("TCallable", bound=Callable[..., Any])
+
+def inject(
+    lifetime_scope: ILifetimeScope | Callable[[], ILifetimeScope]
+) -> Callable[[TCallable], TCallable]:
+    """Fills in the annotated parameters of a function from a lifetime scope on each call.
+
+    :param lifetime_scope: The lifetime scope, or a factory that returns the lifetime scope
+        to be used for the current call, such as the scope of the current request.
+    :type lifetime_scope: ILifetimeScope | Callable[[], ILifetimeScope]
+    :return: A decorator that returns a wrapper of the function it decorates.
+    :rtype: Callable[[TCallable], TCallable]
+    """
+
+    get_scope: Callable[[], ILifetimeScope] = (
+        lifetime_scope if callable(lifetime_scope)
+        else lambda: lifetime_scope # type: ignore
+    )
+
+    def decorator(func: TCallable) -> TCallable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await get_scope().call_async(func, *args, **kwargs)
+
+            return async_wrapper # type: ignore
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return get_scope().call(func, *args, **kwargs)
+
+        return wrapper # type: ignore
+
+    return decorator
@@ -1,8 +1,7 @@
 from collections.abc import Callable
 from typing import TypeVar
 
-from kanata.models import InjectableTypeRegistration
-from kanata.utils import get_generic_type_parameters, get_or_add_attribute
+from kanata.injectable_registry import get_or_add_registration
 
 T = TypeVar("T")
 
@@ -16,21 +15,8 @@ def injectable(contract_type: type) -> Callable[[type[T]], type[T]]:
     """
 
     def decorator(wrapped_class: type[T]) -> type[T]:
-        registration = get_or_add_attribute(
-            wrapped_class,
-            InjectableTypeRegistration.PROPERTY_NAME,
-            lambda injectable_type=wrapped_class: __create_registration(injectable_type)
-        )
+        registration = get_or_add_registration(wrapped_class)
         registration.contract_types.add(contract_type)
         return wrapped_class
 
     return decorator
-
-def __create_registration(
-    injectable_type: type
-) -> InjectableTypeRegistration:
-    # TODO https://github.com/PyCQA/pylint/issues/6550
-    return InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
-        injectable_type=injectable_type,
-        is_generic=bool(get_generic_type_parameters(injectable_type))
-    )
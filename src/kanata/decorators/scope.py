@@ -1,8 +1,8 @@
 from collections.abc import Callable
 from typing import TypeVar
 
-from kanata.models import InjectableScopeType, InjectableTypeRegistration
-from kanata.utils import get_or_add_attribute
+from kanata.injectable_registry import get_or_add_registration
+from kanata.models import InjectableScopeType
 
 T = TypeVar("T")
 
@@ -15,12 +15,7 @@ def scope(scope_type: InjectableScopeType) -> Callable[[type[T]], type[T]]:
     :rtype: Callable[[type[T]], type[T]]
     """
     def decorator(wrapped_class: type[T]) -> type[T]:
-        registration = get_or_add_attribute(
-            wrapped_class,
-            InjectableTypeRegistration.PROPERTY_NAME,
-            # TODO https://github.com/PyCQA/pylint/issues/6550
-            lambda: InjectableTypeRegistration(injectable_type=wrapped_class) # pylint: disable=unexpected-keyword-arg
-        )
+        registration = get_or_add_registration(wrapped_class)
         registration.scope = scope_type
         return wrapped_class
 
@@ -0,0 +1,228 @@
+"""Utilities for analyzing the costs of the dependency graphs of catalogs."""
+
+import dataclasses
+import json
+from collections.abc import Mapping
+
+from .catalogs import IInjectableCatalog
+from .graphs import BidirectedGraph
+from .graphs.sorting import topological_sort_many
+from .metrics import MetricsSnapshot
+from .models import (
+    DependencyKind, DependencyReport, InjectableAnalysis, InjectableInstanceRegistration,
+    InjectableScopeType, InjectableTypeRegistration
+)
+from .plans import ResolutionPlanner
+from .utils import get_dependent_contracts, get_type_name
+
+# Providers and factories construct their instances on demand, not along with their dependees.
+_DEFERRED_KINDS = frozenset((DependencyKind.PROVIDER, DependencyKind.FACTORY))
+
+def analyze_dependencies(
+    catalog: IInjectableCatalog,
+    construction_times_ns: Mapping[str, float] | None = None
+) -> DependencyReport:
+    """Analyzes the dependency graph of all the injectables of the specified catalog.
+
+    The dependencies injected via providers and factories are excluded,
+    since they aren't constructed along with their dependees.
+
+    :param catalog: The catalog to be analyzed.
+    :type catalog: IInjectableCatalog
+    :param construction_times_ns: The construction times of the injectables in nanoseconds,
+        keyed by the qualified names of their types, such as the ones returned by
+        :func:`get_construction_times` after a warm-up run, defaults to None.
+        If None, the critical paths are the longest chains of dependencies.
+    :type construction_times_ns: Mapping[str, float] | None, optional
+    :raises CyclicGraphException: Raised when the dependency graph contains a cycle.
+    :return: The report of the costs of the dependency graph.
+    :rtype: DependencyReport
+    """
+
+    graph, scopes = __build_dependency_graph(catalog)
+    names = {injectable: get_type_name(injectable) for injectable in graph.nodes}
+    dependencies = dict[type, tuple[type, ...]]()
+    fan_ins = dict.fromkeys(graph.nodes, 0)
+    closures = dict[type, frozenset[type]]()
+    depths = dict[type, int]()
+    critical_paths = dict[type, tuple[type, ...]]()
+    critical_path_times = dict[type, float]()
+    # The dependencies come before their dependees, hence they're always analyzed first.
+    for injectable in topological_sort_many(graph, sorted(graph.nodes, key=names.__getitem__)):
+        dependencies[injectable] = injectable_dependencies = tuple(dict.fromkeys(
+            edge.target for edge in graph.get_out_edges(injectable)
+        ))
+        for dependency in injectable_dependencies:
+            fan_ins[dependency] += 1
+        closures[injectable] = frozenset(
+            transitive_dependency
+            for dependency in injectable_dependencies
+            for transitive_dependency in (dependency, *closures[dependency])
+        )
+        depths[injectable] = max(
+            (depths[dependency] + 1 for dependency in injectable_dependencies),
+            default=0
+        )
+
+        time = (
+            construction_times_ns.get(names[injectable], 0.0)
+            if construction_times_ns is not None
+            else 1.0
+        )
+        critical_dependency = max(
+            injectable_dependencies,
+            key=lambda dependency: (critical_path_times[dependency], names[dependency]),
+            default=None
+        )
+        if critical_dependency is None:
+            critical_paths[injectable] = (injectable,)
+            critical_path_times[injectable] = time
+        else:
+            critical_paths[injectable] = (injectable, *critical_paths[critical_dependency])
+            critical_path_times[injectable] = time + critical_path_times[critical_dependency]
+
+    analyses = []
+    for injectable, closure in closures.items():
+        scope_counts = dict[str, int]()
+        for member in (injectable, *closure):
+            scope_counts[scopes[member]] = scope_counts.get(scopes[member], 0) + 1
+        # TODO https://github.com/PyCQA/pylint/issues/6550
+        analyses.append(InjectableAnalysis( # pylint: disable=unexpected-keyword-arg
+            name=names[injectable],
+            scope=scopes[injectable],
+            closure_size=len(closure),
+            depth=depths[injectable],
+            fan_in=fan_ins[injectable],
+            fan_out=len(dependencies[injectable]),
+            scope_counts=dict(sorted(scope_counts.items())),
+            critical_path=tuple(names[member] for member in critical_paths[injectable]),
+            critical_path_time_ns=(
+                critical_path_times[injectable] if construction_times_ns is not None else None
+            )
+        ))
+
+    critical_injectable = max(
+        critical_path_times,
+        key=lambda injectable: (critical_path_times[injectable], names[injectable]),
+        default=None
+    )
+    return DependencyReport( # pylint: disable=unexpected-keyword-arg
+        injectables=tuple(sorted(
+            analyses,
+            key=lambda analysis: (-analysis.closure_size, analysis.name)
+        )),
+        critical_path=(
+            tuple(names[member] for member in critical_paths[critical_injectable])
+            if critical_injectable is not None
+            else ()
+        ),
+        critical_path_time_ns=(
+            critical_path_times[critical_injectable]
+            if critical_injectable is not None and construction_times_ns is not None
+            else None
+        )
+    )
+
+def get_construction_times(snapshot: MetricsSnapshot) -> dict[str, float]:
+    """Gets the average construction times of the injectables recorded in the specified
+    snapshot of metrics, such as the one taken after a warm-up run.
+
+    :param snapshot: The snapshot of the metrics.
+    :type snapshot: MetricsSnapshot
+    :return: The average construction times in nanoseconds,
+        keyed by the qualified names of the types of the injectables.
+    :rtype: dict[str, float]
+    """
+
+    return {
+        dict(histogram.labels)["injectable"]: histogram.sum / histogram.count
+        for histogram in snapshot.histograms
+        if histogram.name == "kanata_construction_duration_ns" and histogram.count
+    }
+
+def format_report_as_json(report: DependencyReport) -> str:
+    """Formats the specified report as JSON, with sorted keys and one value per line,
+    so that the reports of subsequent builds can be diffed.
+
+    :param report: The report to be formatted.
+    :type report: DependencyReport
+    :return: The JSON document of the report.
+    :rtype: str
+    """
+
+    return json.dumps(dataclasses.asdict(report), indent=2, sort_keys=True)
+
+def format_report_as_text(report: DependencyReport, limit: int = 20) -> str:
+    """Formats the specified report as human-readable text.
+
+    :param report: The report to be formatted.
+    :type report: DependencyReport
+    :param limit: The maximum number of injectables listed, defaults to 20.
+    :type limit: int, optional
+    :return: The text of the report.
+    :rtype: str
+    """
+
+    lines = [
+        f"Injectables: {len(report.injectables)}",
+        "",
+        f"{'Closure':>7} {'Depth':>5} {'Fan-in':>6} {'Fan-out':>7}  Injectable"
+    ]
+    for analysis in report.injectables[:limit]:
+        scope_counts = ", ".join(
+            f"{scope}: {count}" for scope, count in analysis.scope_counts.items()
+        )
+        lines.append(
+            f"{analysis.closure_size:>7} {analysis.depth:>5}"
+            f" {analysis.fan_in:>6} {analysis.fan_out:>7}"
+            f"  {analysis.name} ({analysis.scope}; {scope_counts})"
+        )
+
+    if report.critical_path_time_ns is None:
+        lines.extend(("", f"Longest chain ({len(report.critical_path)} injectables):"))
+    else:
+        lines.extend(("", f"Critical path ({report.critical_path_time_ns / 1e6:.3f} ms):"))
+    lines.extend(f"  {name}" for name in report.critical_path)
+    return "\n".join(lines)
+
+def __build_dependency_graph(
+    catalog: IInjectableCatalog
+) -> tuple[BidirectedGraph[type], dict[type, str]]:
+    planner = ResolutionPlanner.for_catalog(catalog)
+    graph: BidirectedGraph[type] = BidirectedGraph()
+    scopes = dict[type, str]()
+    injectables_to_visit = list[type]()
+    for registration in catalog.get_registrations():
+        match registration:
+            # Open generic injectables are analyzed once they're closed by their dependees.
+            case InjectableTypeRegistration() if not registration.is_generic:
+                injectables_to_visit.append(registration.injectable_type)
+            case InjectableInstanceRegistration():
+                injectables_to_visit.append(type(registration.injectable_instance))
+
+    while injectables_to_visit:
+        injectable = injectables_to_visit.pop()
+        if injectable in scopes:
+            continue
+
+        graph.try_add_node(injectable)
+        registration = planner.get_registration(injectable)
+        if not isinstance(registration, InjectableTypeRegistration):
+            # Registered instances are never constructed, just like singletons.
+            scopes[injectable] = InjectableScopeType.SINGLETON.name.lower()
+            continue
+
+        scopes[injectable] = registration.scope.name.lower()
+        if registration.is_external:
+            continue
+
+        for contract, kind in get_dependent_contracts(injectable):
+            if kind in _DEFERRED_KINDS:
+                continue
+
+            for dependency in planner.get_injectable_types(contract):
+                graph.try_add_node(dependency)
+                graph.try_add_edge(injectable, dependency)
+                injectables_to_visit.append(dependency)
+
+    return graph, scopes
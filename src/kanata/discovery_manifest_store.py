@@ -0,0 +1,139 @@
+"""Utilities for persisting the results of injectable discovery."""
+
+import json
+import os
+from typing import Any
+
+from .models import (
+    DiscoveryManifest, InjectableScopeType, InjectableTypeRegistration, ManifestRegistration,
+    ManifestSourceFile
+)
+from .utils import get_type_name
+
+MANIFEST_VERSION: int = 1
+"""The version of the format of the discovery manifests.
+Manifests of other versions are ignored.
+"""
+
+def load_manifest(path: str, module_name: str) -> DiscoveryManifest | None:
+    """Loads the discovery manifest of the specified module from the specified file.
+
+    :param path: The path of the manifest file.
+    :type path: str
+    :param module_name: The name of the root module the manifest is expected to describe.
+    :type module_name: str
+    :return: The manifest, if the file exists and describes the module; otherwise, None.
+    :rtype: DiscoveryManifest | None
+    """
+
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            document: dict[str, Any] = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(document, dict)
+        or document.get("version") != MANIFEST_VERSION
+        or document.get("module") != module_name
+    ):
+        return None
+
+    try:
+        return DiscoveryManifest(
+            module_name=module_name,
+            directories=dict(document["directories"]),
+            source_files=tuple(
+                __load_source_file(source_file) for source_file in document["files"]
+            )
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def save_manifest(path: str, manifest: DiscoveryManifest) -> None:
+    """Saves the specified discovery manifest to the specified file.
+
+    The file is replaced atomically, hence concurrent readers
+    never observe a partially written manifest.
+
+    :param path: The path of the manifest file.
+    :type path: str
+    :param manifest: The manifest to be saved.
+    :type manifest: DiscoveryManifest
+    """
+
+    document = {
+        "version": MANIFEST_VERSION,
+        "module": manifest.module_name,
+        "directories": manifest.directories,
+        "files": [__dump_source_file(source_file) for source_file in manifest.source_files]
+    }
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(document, file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+def create_manifest_registration(
+    registration: InjectableTypeRegistration
+) -> ManifestRegistration:
+    """Creates the manifest record of the specified registration.
+
+    :param registration: The registration to be recorded.
+    :type registration: InjectableTypeRegistration
+    :return: The manifest record of the registration.
+    :rtype: ManifestRegistration
+    """
+
+    # TODO https://github.com/PyCQA/pylint/issues/6550
+    return ManifestRegistration( # pylint: disable=unexpected-keyword-arg
+        module_name=registration.injectable_type.__module__,
+        qualname=registration.injectable_type.__qualname__,
+        contract_types=tuple(sorted(map(get_type_name, registration.contract_types))),
+        scope=registration.scope,
+        is_generic=registration.is_generic,
+        time_to_live=registration.time_to_live,
+        refresh_in_background=registration.refresh_in_background
+    )
+
+def __load_source_file(document: list[Any]) -> ManifestSourceFile:
+    path, module_name, modified_time, size, registrations = document
+    # TODO https://github.com/PyCQA/pylint/issues/6550
+    return ManifestSourceFile( # pylint: disable=unexpected-keyword-arg
+        path=path,
+        module_name=module_name,
+        modified_time=modified_time,
+        size=size,
+        registrations=tuple(
+            ManifestRegistration( # pylint: disable=unexpected-keyword-arg
+                module_name=module_name,
+                qualname=qualname,
+                contract_types=tuple(contract_types),
+                scope=InjectableScopeType(scope),
+                is_generic=is_generic,
+                time_to_live=time_to_live,
+                refresh_in_background=refresh_in_background
+            )
+            for (
+                qualname, contract_types, scope, is_generic, time_to_live, refresh_in_background
+            ) in registrations
+        )
+    )
+
+def __dump_source_file(source_file: ManifestSourceFile) -> list[Any]:
+    return [
+        source_file.path,
+        source_file.module_name,
+        source_file.modified_time,
+        source_file.size,
+        [
+            [
+                registration.qualname,
+                registration.contract_types,
+                int(registration.scope),
+                registration.is_generic,
+                registration.time_to_live,
+                registration.refresh_in_background
+            ]
+            for registration in source_file.registrations
+        ]
+    ]
@@ -1,5 +1,16 @@
 """Library-wide exception types."""
 
-from .argument_exception import ArgumentException
-from .dependency_resolution_exception import DependencyResolutionException
-from .injectable_registration_exception import InjectableRegistrationException
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .argument_exception import ArgumentException
+    from .dependency_resolution_exception import DependencyResolutionException
+    from .injectable_registration_exception import InjectableRegistrationException
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "argument_exception": ("ArgumentException",),
+    "dependency_resolution_exception": ("DependencyResolutionException",),
+    "injectable_registration_exception": ("InjectableRegistrationException",)
+})
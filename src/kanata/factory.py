@@ -0,0 +1,51 @@
+from typing import Any, Generic, TypeVar
+
+from .ilifetime_scope import ILifetimeScope
+
+T = TypeVar("T")
+
+class Factory(Generic[T]):
+    """Constructs new instances of an injectable on demand,
+    mixing arguments known only at runtime with injected dependencies.
+
+    By depending on ``Factory[IContract]`` or ``Callable[..., IContract]``,
+    an injectable can construct instances of the injectable associated to
+    the contract by passing some of the parameters, such as an identifier,
+    while the rest of the parameters are filled in from the lifetime scope
+    that owns the dependee, which is the root scope for singletons, context-bound
+    and thread-bound injectables, and the scope that has resolved the dependee
+    otherwise. The constructed instances are owned
+    by the caller, regardless of the scope type of the injectable.
+    """
+
+    def __init__(self, lifetime_scope: ILifetimeScope, injectable_type: type[T]) -> None:
+        """Initializes a new instance.
+
+        :param lifetime_scope: The lifetime scope used to resolve the dependencies.
+        :type lifetime_scope: ILifetimeScope
+        :param injectable_type: The type of the injectable to be constructed.
+        :type injectable_type: type[T]
+        """
+
+        self.__lifetime_scope = lifetime_scope
+        self.__injectable_type = injectable_type
+
+    @property
+    def injectable_type(self) -> type[T]:
+        """Gets the type of the injectable constructed by the factory.
+
+        :return: The type of the injectable constructed by the factory.
+        :rtype: type[T]
+        """
+
+        return self.__injectable_type
+
+    def __call__(self, /, *args: Any, **kwargs: Any) -> T:
+        """Constructs a new instance of the injectable.
+
+        :raises DependencyResolutionException: Raised when dependency resolution fails.
+        :return: The new instance of the injectable.
+        :rtype: T
+        """
+
+        return self.__lifetime_scope.call(self.__injectable_type, *args, **kwargs)
@@ -1,6 +1,18 @@
 """Graph representation and manipulation related types."""
 
-from .bidirected_graph import BidirectedGraph
-from .edge import Edge
-from .graph import Graph
-from .tnode import TNode
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .bidirected_graph import BidirectedGraph
+    from .edge import Edge
+    from .graph import Graph
+    from .tnode import TNode
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "bidirected_graph": ("BidirectedGraph",),
+    "edge": ("Edge",),
+    "graph": ("Graph",),
+    "tnode": ("TNode",)
+})
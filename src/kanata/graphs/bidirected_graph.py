@@ -24,7 +24,7 @@ class BidirectedGraph(Graph[TNode]):
         if node not in self:
             raise ArgumentException("node", node, "The specified node is not in the graph.")
 
-        for edge in self.edges:
+        for edge in self._get_incident_edges(node):
             if edge.source == node:
                 yield edge
 
@@ -1,6 +1,18 @@
 """Graph specific exception types."""
 
-from .cyclic_graph_exception import CyclicGraphException
-from .disconnected_sub_graph_exception import DisconnectedSubGraphException
-from .duplicate_edge_exception import DuplicateEdgeException
-from .duplicate_node_exception import DuplicateNodeException
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .cyclic_graph_exception import CyclicGraphException
+    from .disconnected_sub_graph_exception import DisconnectedSubGraphException
+    from .duplicate_edge_exception import DuplicateEdgeException
+    from .duplicate_node_exception import DuplicateNodeException
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "cyclic_graph_exception": ("CyclicGraphException",),
+    "disconnected_sub_graph_exception": ("DisconnectedSubGraphException",),
+    "duplicate_edge_exception": ("DuplicateEdgeException",),
+    "duplicate_node_exception": ("DuplicateNodeException",)
+})
@@ -17,6 +17,8 @@ class Graph(Generic[TNode]):
         self.__allow_parallel_edges: bool = allow_parallel_edges
         self.__nodes: set[TNode] = set()
         self.__edges: list[Edge[TNode]] = []
+        # Indexes the edges by both of their nodes to avoid scanning all edges.
+        self.__edges_by_node: dict[TNode, list[Edge[TNode]]] = {}
 
     @property
     def allow_parallel_edges(self) -> bool:
@@ -99,17 +101,29 @@ class Graph(Generic[TNode]):
         """
 
         new_edge = Edge(source, target)
-        if self.__allow_parallel_edges:
-            self.__edges.append(new_edge)
-            return True
-
-        for edge in self.__edges:
-            if self._is_same_edge(edge, new_edge):
-                return False
+        if not self.__allow_parallel_edges:
+            # Identical edges always share the source node.
+            for edge in self.__edges_by_node.get(source, ()):
+                if self._is_same_edge(edge, new_edge):
+                    return False
 
         self.__edges.append(new_edge)
+        self.__edges_by_node.setdefault(source, []).append(new_edge)
+        if target != source:
+            self.__edges_by_node.setdefault(target, []).append(new_edge)
         return True
 
+    def _get_incident_edges(self, node: TNode) -> tuple[Edge[TNode], ...]:
+        """Gets the edges that have the specified node as either their source or target.
+
+        :param node: The node for which to get the edges.
+        :type node: TNode
+        :return: The edges incident to the node.
+        :rtype: tuple[Edge[TNode], ...]
+        """
+
+        return tuple(self.__edges_by_node.get(node, ()))
+
     def _is_same_edge(self, existing_edge: Edge, new_edge: Edge) -> bool:
         """Determines whether two edges are equal.
 
@@ -1,3 +1,12 @@
 """Graph related sorting methods."""
 
-from .topological_sorter import topological_sort
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .topological_sorter import topological_sort, topological_sort_many
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "topological_sorter": ("topological_sort", "topological_sort_many")
+})
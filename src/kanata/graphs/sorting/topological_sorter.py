@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Iterator
+
 from kanata.exceptions import ArgumentException
 from kanata.graphs import BidirectedGraph, TNode
 from kanata.graphs.exceptions import CyclicGraphException, DisconnectedSubGraphException
@@ -16,40 +18,77 @@ def topological_sort(graph: BidirectedGraph[TNode], start_node: TNode) -> tuple[
     :rtype: tuple[TNode, ...]
     """
 
-    if start_node not in graph:
-        raise ArgumentException(
-            "start_node",
-            start_node,
-            f"The start node '{start_node}' is not in the graph."
-        )
+    return topological_sort_many(graph, (start_node,))
+
+def topological_sort_many(
+    graph: BidirectedGraph[TNode],
+    start_nodes: Iterable[TNode]
+) -> tuple[TNode, ...]:
+    """Produces a linear ordering of the specified graph's nodes
+    such that for every directed edge uv from node u to node v, u comes before v in the ordering,
+    using multiple starting points that together must reach every node of the graph.
+
+    :param graph: The graph whose nodes are to be sorted.
+    :type graph: BidirectedGraph[TNode]
+    :param start_nodes: The nodes used as the starting points for the ordering.
+    :type start_nodes: Iterable[TNode]
+    :raises ArgumentException: Raised when any of the specified start nodes is not in the graph.
+    :raises DisconnectedSubGraphException: Raised when a disconnected sub-graph
+        is detected within the graph.
+    :return: The sorted nodes of the specified graph.
+    :rtype: tuple[TNode, ...]
+    """
 
     visited_nodes: set[TNode] = set()
-    unvisited_nodes: set[TNode] = graph.nodes
     sorted_nodes: list[TNode] = []
-    __visit(graph, start_node, visited_nodes, set(), sorted_nodes)
-    if visited_nodes != unvisited_nodes:
-        raise DisconnectedSubGraphException(tuple(str(node) for node in unvisited_nodes))
+    for start_node in start_nodes:
+        if start_node not in graph:
+            raise ArgumentException(
+                "start_nodes",
+                start_node,
+                f"The start node '{start_node}' is not in the graph."
+            )
+        __visit(graph, start_node, visited_nodes, sorted_nodes)
+
+    if len(visited_nodes) != len(graph.nodes):
+        raise DisconnectedSubGraphException(
+            tuple(str(node) for node in graph.nodes - visited_nodes)
+        )
     return tuple(sorted_nodes)
 
 def __visit(
     graph: BidirectedGraph[TNode],
-    node: TNode,
+    start_node: TNode,
     visited_nodes: set[TNode],
-    currently_visiting: set[TNode],
     sorted_nodes: list[TNode]
 ) -> None:
-    if node in visited_nodes:
+    if start_node in visited_nodes:
         return
-    if node in currently_visiting:
-        raise CyclicGraphException(
-            currently_visiting,
-            "A directed acyclic graph (DAG) is expected."
-        )
 
-    currently_visiting.add(node)
-    for out_node in {edge.target for edge in graph.get_out_edges(node)}:
-        __visit(graph, out_node, visited_nodes, currently_visiting, sorted_nodes)
-    currently_visiting.remove(node)
+    # An explicit stack is used instead of recursion to support deep graphs.
+    currently_visiting: set[TNode] = {start_node}
+    stack: list[tuple[TNode, Iterator[TNode]]] = [
+        (start_node, __get_out_nodes(graph, start_node))
+    ]
+    while stack:
+        node, out_nodes = stack[-1]
+        for out_node in out_nodes:
+            if out_node in visited_nodes:
+                continue
+            if out_node in currently_visiting:
+                raise CyclicGraphException(
+                    currently_visiting,
+                    "A directed acyclic graph (DAG) is expected."
+                )
+
+            currently_visiting.add(out_node)
+            stack.append((out_node, __get_out_nodes(graph, out_node)))
+            break
+        else:
+            stack.pop()
+            currently_visiting.remove(node)
+            visited_nodes.add(node)
+            sorted_nodes.append(node)
 
-    visited_nodes.add(node)
-    sorted_nodes.append(node)
+def __get_out_nodes(graph: BidirectedGraph[TNode], node: TNode) -> Iterator[TNode]:
+    return iter(dict.fromkeys(edge.target for edge in graph.get_out_edges(node)))
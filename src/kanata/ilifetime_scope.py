@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Protocol, TypeVar
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from typing import Any, Protocol, TypeVar
 
 TInjectable = TypeVar("TInjectable")
+TResult = TypeVar("TResult")
 
 class ILifetimeScope(Protocol):
     """Interface for an injectable lifetime scope
@@ -21,6 +24,61 @@ class ILifetimeScope(Protocol):
         """
         ...
 
+    def try_resolve(self, injectable: type[TInjectable]) -> TInjectable | None:
+        """Resolves an instance of an injectable associated to the specified interface,
+        if it's registered and all of its dependencies can be satisfied.
+
+        Unlike :meth:`resolve`, unsatisfiable requests don't raise exceptions
+        and are remembered, so that probing for optional services is cheap.
+
+        :param injectable: The injectable for which to get a resolved instance.
+        :type injectable: type[TInjectable]
+        :return: If possible, an instance of the appropriate injectable.
+        :rtype: TInjectable | None
+        """
+        ...
+
+    def resolve_many(self, injectables: Iterable[type]) -> tuple[Any, ...]:
+        """Resolves instances of the specified injectables in a single batch.
+
+        The dependency graphs of the injectables are combined and resolved at once,
+        hence shared dependencies are constructed only once per batch.
+
+        :param injectables: The injectables for which to get resolved instances.
+        :type injectables: Iterable[type]
+        :raises DependencyResolutionException: Raised when dependency resolution fails.
+        :return: The instances of the appropriate injectables, in the order of the request.
+        :rtype: tuple[Any, ...]
+        """
+        ...
+
+    def call(self, func: Callable[..., TResult], /, *args: Any, **kwargs: Any) -> TResult:
+        """Calls the specified callable with the specified arguments,
+        filling in the rest of its annotated parameters from the scope.
+
+        Parameters that are passed explicitly are never filled in, and parameters
+        with default values are left as-is if there is no matching registration.
+        The analysis of the signature is cached after the first call.
+
+        :param func: The callable to be called.
+        :type func: Callable[..., TResult]
+        :raises DependencyResolutionException: Raised when dependency resolution fails.
+        :return: The result of the callable.
+        :rtype: TResult
+        """
+        ...
+
+    async def call_async(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        """Same as :meth:`call`, but the result of the callable is awaited, if awaitable.
+
+        :param func: The callable to be called.
+        :type func: Callable[..., Any]
+        :raises DependencyResolutionException: Raised when dependency resolution fails.
+        :return: The awaited result of the callable.
+        :rtype: Any
+        """
+        ...
+
     def create_child_scope(self) -> ILifetimeScope:
         """Creates a lifetime scoped attached to the current one.
         This child will have access to the same injectable catalog,
@@ -31,3 +89,123 @@ class ILifetimeScope(Protocol):
         :rtype: ILifetimeScope
         """
         ...
+
+    def for_key(self, key: Hashable) -> ILifetimeScope:
+        """Gets the child lifetime scope associated to the specified key,
+        creating it on the first request. The same child is returned
+        for the same key until it is evicted, after which it is disposed of.
+
+        Since the child may be evicted and disposed of while another thread is still using it,
+        use :meth:`lease_key` when the child is used concurrently with the evictions.
+
+        :param key: The key associated to the child lifetime scope, such as a tenant identifier.
+        :type key: Hashable
+        :return: A lifetime scope attached to the current lifetime scope.
+        :rtype: ILifetimeScope
+        """
+        ...
+
+    def lease_key(self, key: Hashable) -> AbstractContextManager[ILifetimeScope]:
+        """Gets the child lifetime scope associated to the specified key, just like
+        :meth:`for_key`, and defers its disposal until the returned context manager exits,
+        even if the child is evicted meanwhile.
+
+        :param key: The key associated to the child lifetime scope, such as a tenant identifier.
+        :type key: Hashable
+        :return: A context manager that returns a lifetime scope
+            attached to the current lifetime scope.
+        :rtype: AbstractContextManager[ILifetimeScope]
+        """
+        ...
+
+    def map(
+        self,
+        handler: type,
+        items: Iterable[Any],
+        concurrency: int = 1
+    ) -> Iterator[Any]:
+        """Handles each of the specified items in its own child scope on a thread pool.
+
+        For each item, the handler is resolved in a child scope and is called with the item.
+        The child scopes are pooled and their instances are disposed of as soon as
+        the item is handled. The items are pulled lazily, so that at most
+        the specified number of items are in flight at a time.
+
+        :param handler: The callable injectable used for handling the items.
+        :type handler: type
+        :param items: The items to be handled.
+        :type items: Iterable[Any]
+        :param concurrency: The maximum number of items handled at a time, defaults to 1.
+        :type concurrency: int, optional
+        :raises ArgumentException: Raised when the concurrency isn't positive.
+        :return: An iterator over the results of the handler, in the order of the items.
+        :rtype: Iterator[Any]
+        """
+        ...
+
+    def map_async(
+        self,
+        handler: type,
+        items: Iterable[Any] | AsyncIterable[Any],
+        concurrency: int = 1
+    ) -> AsyncIterator[Any]:
+        """Handles each of the specified items in its own child scope and asyncio task.
+
+        Same as :meth:`map`, but the results of the handler are awaited, if awaitable.
+
+        :param handler: The callable injectable used for handling the items.
+        :type handler: type
+        :param items: The items to be handled.
+        :type items: Iterable[Any] | AsyncIterable[Any]
+        :param concurrency: The maximum number of items handled at a time, defaults to 1.
+        :type concurrency: int, optional
+        :raises ArgumentException: Raised when the concurrency isn't positive.
+        :return: An asynchronous iterator over the results of the handler,
+            in the order of the items.
+        :rtype: AsyncIterator[Any]
+        """
+        ...
+
+    def dispose(self) -> None:
+        """Disposes of the instances owned by the lifetime scope
+        in reverse order of their construction, as well as its keyed children.
+
+        The lifetime scope remains usable afterwards, starting with no instances.
+        """
+        ...
+
+    async def dispose_async(self) -> None:
+        """Same as :meth:`dispose`, but asynchronously disposable instances are awaited."""
+        ...
+
+    def prepare_for_fork(self) -> None:
+        """Prepares the lifetime scope tree to be shared by forked worker processes,
+        such as the ones of a pre-forking web server.
+
+        All singletons are constructed, the resolution plans of all registrations
+        are built, along with their closed generic types, and the objects tracked
+        by the garbage collector are frozen, so that the collections of the workers
+        don't touch the memory pages shared copy-on-write with the parent process.
+        After each fork, the :meth:`~kanata.models.IForkAware.after_fork` method
+        of the singletons that have one is called in the child process.
+
+        This should be called on the root scope, right before forking.
+
+        :raises DependencyResolutionException: Raised when a singleton cannot be constructed.
+        """
+        ...
+
+    def add_instance(self, injectable: type, instance: Any) -> None:
+        """Adds an instance of a scoped injectable to the lifetime scope,
+        such as the object of the request handled by the scope.
+
+        The injectable must be registered as a scoped injectable, so that
+        its dependees can be resolved, and the added instance is injected
+        instead of a new one being constructed.
+
+        :param injectable: The type of the injectable.
+        :type injectable: type
+        :param instance: The instance of the injectable.
+        :type instance: Any
+        """
+        ...
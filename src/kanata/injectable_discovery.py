@@ -1,31 +1,120 @@
 """Utilities for discovering injectables."""
 
 import importlib
-import inspect
+import importlib.util
 import os
 import pkgutil
-from types import ModuleType
-from typing import Any
+from collections.abc import Iterable
 
-import structlog
+from .discovery_manifest_store import create_manifest_registration, load_manifest, save_manifest
+from .injectable_registry import get_registered_injectables
+from .loggers import ILogger, get_logger
+from .models import (
+    DiscoveryManifest, InjectableRegistration, InjectableTypeRegistration, ManifestRegistration,
+    ManifestSourceFile
+)
 
-from .constants import LOGGER_NAME
-from .models import InjectableRegistration
+__DECORATOR_NAMES = frozenset(("injectable", "scope", "expires"))
+__MIN_PARALLEL_SCAN_SIZE = 256
 
-def find_injectables(module_name: str) -> tuple[InjectableRegistration, ...]:
+def find_injectables(
+    module_name: str,
+    scan_sources: bool = False,
+    max_workers: int | None = None,
+    manifest_path: str | None = None
+) -> tuple[InjectableRegistration, ...]:
     """Recursively discovers all injectables starting from the specified module.
 
+    The packages are imported so that the decorators of their injectables are executed,
+    after which the injectables are looked up in the registry of the decorators
+    instead of inspecting the members of each module.
+
+    When the sources are scanned, the source files of the modules are parsed first,
+    in parallel, and only the modules that decorate classes with the decorators
+    of the framework are imported, along with the modules they import.
+
+    When a manifest is used, the results of the discovery are recorded in the manifest
+    along with the modification times and the sizes of the source files.
+    On later discoveries, only the modules known to declare injectables are imported
+    and only the source files that have changed since are scanned again.
+
     :param module_name: The name of the root module.
     :type module_name: str
+    :param scan_sources: Whether to scan the source files to find the modules to import,
+        instead of importing every package, defaults to False.
+    :type scan_sources: bool, optional
+    :param max_workers: The maximum number of processes used for scanning the source files,
+        defaults to the number of processors.
+    :type max_workers: int | None, optional
+    :param manifest_path: The path of the discovery manifest file to use, if any.
+        The sources are always scanned when a manifest is used.
+    :type manifest_path: str | None, optional
     :return: The registration objects of the discovered injectables.
     :rtype: tuple[InjectableRegistration, ...]
     """
 
-    logger = structlog.get_logger(logger_name=LOGGER_NAME)
-    registrations: list[InjectableRegistration] = []
+    logger = get_logger()
+    if manifest_path is not None:
+        is_imported = __import_manifest_modules(module_name, manifest_path, max_workers, logger)
+    elif scan_sources:
+        is_imported = __import_scanned_modules(module_name, max_workers, logger)
+    else:
+        is_imported = False
+
+    if not is_imported:
+        __import_packages(module_name, logger)
+
+    registrations = get_registered_injectables(module_name)
+    logger.debug("Found injectables", count=len(registrations))
+    return registrations
+
+def find_injectable_references(
+    module_name: str,
+    manifest_path: str,
+    max_workers: int | None = None
+) -> tuple[ManifestRegistration, ...]:
+    """Discovers the references to all injectables starting from the specified module,
+    without importing their modules, as long as the discovery manifest is up to date.
+
+    Otherwise, the injectables are discovered via :func:`find_injectables` first,
+    which updates the manifest.
+
+    :param module_name: The name of the root module.
+    :type module_name: str
+    :param manifest_path: The path of the discovery manifest file to use.
+    :type manifest_path: str
+    :param max_workers: The maximum number of processes used for scanning the source files,
+        defaults to the number of processors.
+    :type max_workers: int | None, optional
+    :return: The references to the discovered injectables.
+    :rtype: tuple[ManifestRegistration, ...]
+    """
+
+    manifest = load_manifest(manifest_path, module_name)
+    if not manifest or not __is_up_to_date(manifest):
+        registrations = find_injectables(
+            module_name,
+            max_workers=max_workers,
+            manifest_path=manifest_path
+        )
+        if not (manifest := load_manifest(manifest_path, module_name)):
+            return tuple(
+                create_manifest_registration(registration)
+                for registration in registrations
+                if isinstance(registration, InjectableTypeRegistration)
+            )
+
+    return tuple(
+        registration
+        for source_file in manifest.source_files
+        for registration in source_file.registrations
+    )
+
+def __import_packages(module_name: str, logger: ILogger) -> None:
     module_names: list[str] = [module_name]
     discovered_module_names = set[str]()
     root_path: str | None = None
+    is_debug_enabled = logger.is_debug_enabled
     while module_names:
         module_name = module_names.pop()
         # (Issue #23) Validate the path to avoid importing non-existent packages.
@@ -37,10 +126,10 @@ def find_injectables(module_name: str) -> tuple[InjectableRegistration, ...]:
         if module_name in discovered_module_names:
             continue
 
-        logger.debug("Loading module", name=module_name)
+        if is_debug_enabled:
+            logger.debug("Loading module", name=module_name)
         discovered_module_names.add(module_name)
         module = importlib.import_module(module_name)
-        registrations.extend(__get_registrations(module, logger))
 
         if not (path := getattr(module, "__path__", None)):
             continue
@@ -49,22 +138,231 @@ def find_injectables(module_name: str) -> tuple[InjectableRegistration, ...]:
             path_head, path_tail = os.path.split(path[0])
             root_path = path_head or path_tail
 
-        logger.debug("Walking path", path=path)
+        if is_debug_enabled:
+            logger.debug("Walking path", path=path)
         for _, name, is_package in pkgutil.walk_packages(path):
             if not is_package:
                 continue
-            logger.debug("Found additional package", name=name, parent=module_name)
+            if is_debug_enabled:
+                logger.debug("Found additional package", name=name, parent=module_name)
             module_names.append(f"{module_name}.{name}")
 
-    return tuple(registrations)
+def __import_scanned_modules(module_name: str, max_workers: int | None, logger: ILogger) -> bool:
+    if (search_locations := __get_search_locations(module_name, logger)) is None:
+        return False
+
+    source_files = dict(__get_source_files(module_name, search_locations))
+    __import_declaring_modules(source_files, max_workers, logger)
+    return True
+
+def __import_manifest_modules(
+    module_name: str,
+    manifest_path: str,
+    max_workers: int | None,
+    logger: ILogger
+) -> bool:
+    if (search_locations := __get_search_locations(module_name, logger)) is None:
+        return False
+
+    manifest = load_manifest(manifest_path, module_name)
+    recorded_files = {
+        source_file.path: source_file
+        for source_file in (manifest.source_files if manifest else ())
+    }
+    # Adding or removing a file changes the modification time of its directory,
+    # hence the recorded files can be used as they are, unless a directory has changed.
+    if manifest and all(
+        __get_modified_time(directory) == modified_time
+        for directory, modified_time in manifest.directories.items()
+    ):
+        directories = manifest.directories
+        source_files = {
+            path: source_file.module_name for path, source_file in recorded_files.items()
+        }
+    else:
+        source_files = dict(__get_source_files(module_name, search_locations))
+        directories = {
+            directory: __get_modified_time(directory)
+            for directory in {*search_locations, *map(os.path.dirname, source_files)}
+        }
+
+    fingerprints = {path: __get_fingerprint(path) for path in source_files}
+    changed_files = {
+        path: source_module_name
+        for path, source_module_name in source_files.items()
+        if (source_file := recorded_files.get(path)) is None
+        or (source_file.modified_time, source_file.size) != fingerprints[path]
+    }
+    logger.debug(
+        "Verified discovery manifest",
+        path=manifest_path, count=len(source_files), changed=len(changed_files)
+    )
+    is_debug_enabled = logger.is_debug_enabled
+    for path, source_file in recorded_files.items():
+        if source_file.registrations and path in source_files and path not in changed_files:
+            if is_debug_enabled:
+                logger.debug("Loading module", name=source_file.module_name)
+            importlib.import_module(source_file.module_name)
+
+    __import_declaring_modules(changed_files, max_workers, logger)
+    if (
+        not manifest
+        or changed_files
+        or len(recorded_files) != len(source_files)
+        or directories != manifest.directories
+    ):
+        __save_manifest(manifest_path, module_name, directories, source_files, fingerprints, logger)
+
+    return True
+
+def __get_search_locations(module_name: str, logger: ILogger) -> tuple[str, ...] | None:
+    spec = importlib.util.find_spec(module_name)
+    if spec is None or not spec.origin or not os.path.isfile(spec.origin):
+        logger.debug("Module sources unavailable, skipping scan", name=module_name)
+        return None
 
-def __get_registrations(module: ModuleType, logger: Any) -> tuple[InjectableRegistration, ...]:
-    registrations: list[InjectableRegistration] = []
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if local_registration := getattr(
-            obj, InjectableRegistration.PROPERTY_NAME, None
-        ):
-            logger.debug("Found injectable", type=local_registration.injectable_type)
-            registrations.append(local_registration)
+    importlib.import_module(module_name)
+    return tuple(spec.submodule_search_locations or ())
+
+def __import_declaring_modules(
+    source_files: dict[str, str],
+    max_workers: int | None,
+    logger: ILogger
+) -> None:
+    paths = tuple(source_files)
+    worker_count = min(max_workers or os.cpu_count() or 1, len(paths) // __MIN_PARALLEL_SCAN_SIZE)
+    logger.debug("Scanning module sources", count=len(paths), workers=worker_count)
+    if worker_count > 1:
+        # Imported on demand, since importing multiprocessing is relatively expensive.
+        from concurrent.futures import ProcessPoolExecutor # pylint: disable=import-outside-toplevel
+
+        with ProcessPoolExecutor(worker_count) as executor:
+            results = tuple(executor.map(
+                __is_declaring_injectables,
+                paths,
+                chunksize=max(1, len(paths) // (worker_count * 4))
+            ))
+    else:
+        results = tuple(map(__is_declaring_injectables, paths))
+
+    is_debug_enabled = logger.is_debug_enabled
+    for path, is_declaring_injectables in zip(paths, results):
+        if is_declaring_injectables:
+            if is_debug_enabled:
+                logger.debug("Loading module", name=source_files[path])
+            importlib.import_module(source_files[path])
+
+def __save_manifest(
+    manifest_path: str,
+    module_name: str,
+    directories: dict[str, int],
+    source_files: dict[str, str],
+    fingerprints: dict[str, tuple[int, int]],
+    logger: ILogger
+) -> None:
+    registrations_by_module: dict[str, list[ManifestRegistration]] = {}
+    for registration in get_registered_injectables(module_name):
+        manifest_registration = create_manifest_registration(registration)
+        registrations_by_module.setdefault(manifest_registration.module_name, []).append(
+            manifest_registration
+        )
+
+    # TODO https://github.com/PyCQA/pylint/issues/6550
+    manifest = DiscoveryManifest( # pylint: disable=unexpected-keyword-arg
+        module_name=module_name,
+        directories=directories,
+        source_files=tuple(
+            ManifestSourceFile( # pylint: disable=unexpected-keyword-arg
+                path=path,
+                module_name=source_module_name,
+                modified_time=fingerprints[path][0],
+                size=fingerprints[path][1],
+                registrations=tuple(registrations_by_module.get(source_module_name, ()))
+            )
+            for path, source_module_name in source_files.items()
+        )
+    )
+    try:
+        save_manifest(manifest_path, manifest)
+    except OSError as error:
+        logger.warning("Failed to save discovery manifest", path=manifest_path, error=str(error))
+        return
+
+    logger.debug("Saved discovery manifest", path=manifest_path, count=len(source_files))
+
+def __is_up_to_date(manifest: DiscoveryManifest) -> bool:
+    return all(
+        __get_modified_time(directory) == modified_time
+        for directory, modified_time in manifest.directories.items()
+    ) and all(
+        __get_fingerprint(source_file.path) == (source_file.modified_time, source_file.size)
+        for source_file in manifest.source_files
+    )
+
+def __get_modified_time(path: str) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+def __get_fingerprint(path: str) -> tuple[int, int]:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return -1, -1
+
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+def __get_source_files(
+    module_name: str,
+    search_locations: Iterable[str]
+) -> Iterable[tuple[str, str]]:
+    for location in search_locations:
+        for module_info in pkgutil.iter_modules((location,)):
+            child_name = f"{module_name}.{module_info.name}"
+            if not module_info.ispkg:
+                path = os.path.join(location, f"{module_info.name}.py")
+                if os.path.isfile(path):
+                    yield path, child_name
+                continue
+
+            package_path = os.path.join(location, module_info.name)
+            init_path = os.path.join(package_path, "__init__.py")
+            if os.path.isfile(init_path):
+                yield init_path, child_name
+            yield from __get_source_files(child_name, (package_path,))
+
+def __is_declaring_injectables(path: str) -> bool:
+    with open(path, "rb") as file:
+        source = file.read()
+
+    # Parsing is much slower than a substring search, hence skip the obvious cases.
+    if b"kanata" not in source:
+        return False
+
+    import ast # pylint: disable=import-outside-toplevel
+
+    try:
+        tree = ast.parse(source, path)
+    except (SyntaxError, ValueError):
+        return False
+
+    decorator_names: set[str] = set(__DECORATOR_NAMES)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("kanata"):
+            decorator_names.update(
+                alias.asname for alias in node.names
+                if alias.asname and alias.name in __DECORATOR_NAMES
+            )
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            function = decorator.func if isinstance(decorator, ast.Call) else decorator
+            if isinstance(function, ast.Name) and function.id in decorator_names:
+                return True
+            if isinstance(function, ast.Attribute) and function.attr in __DECORATOR_NAMES:
+                return True
 
-    return tuple(registrations)
+    return False
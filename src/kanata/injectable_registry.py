@@ -0,0 +1,73 @@
+"""A process-wide registry of the injectables declared via decorators."""
+
+import threading
+import weakref
+
+from .models import InjectableTypeRegistration
+from .utils import get_generic_type_parameters
+
+# The classes are keyed by their qualified names, so that reloading a module replaces them,
+# and referenced weakly, so that the ones created dynamically can still be collected.
+__types_by_module: dict[str, dict[str, weakref.ref[type]]] = {}
+__lock = threading.Lock()
+
+def get_or_add_registration(injectable_type: type) -> InjectableTypeRegistration:
+    """Gets the registration declared on the specified class, if exists;
+    otherwise declares a new registration and adds it to the registry.
+
+    Registrations inherited from the base classes are ignored,
+    so that decorating a subclass doesn't modify the registration of its base class.
+    A class replaces the one registered earlier with the same module and qualified name,
+    such as the previous version of a class of a reloaded module.
+
+    :param injectable_type: The type of the injectable class.
+    :type injectable_type: type
+    :return: The registration of the injectable class.
+    :rtype: InjectableTypeRegistration
+    """
+
+    registration: InjectableTypeRegistration | None = vars(injectable_type).get(
+        InjectableTypeRegistration.PROPERTY_NAME
+    )
+    if registration is not None:
+        return registration
+
+    # TODO https://github.com/PyCQA/pylint/issues/6550
+    registration = InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
+        injectable_type=injectable_type,
+        is_generic=bool(get_generic_type_parameters(injectable_type))
+    )
+    setattr(injectable_type, InjectableTypeRegistration.PROPERTY_NAME, registration)
+    with __lock:
+        __types_by_module.setdefault(injectable_type.__module__, {})[
+            injectable_type.__qualname__
+        ] = weakref.ref(injectable_type)
+
+    return registration
+
+def get_registered_injectables(module_name: str) -> tuple[InjectableTypeRegistration, ...]:
+    """Gets the registrations declared in the specified module and in its submodules.
+
+    Only the registrations of the modules that have already been imported
+    and of the classes that are still alive are returned.
+
+    :param module_name: The name of the root module.
+    :type module_name: str
+    :return: The registrations declared in the module and in its submodules.
+    :rtype: tuple[InjectableTypeRegistration, ...]
+    """
+
+    prefix = f"{module_name}."
+    with __lock:
+        injectable_types = tuple(
+            reference()
+            for name, references in __types_by_module.items()
+            if name == module_name or name.startswith(prefix)
+            for reference in references.values()
+        )
+
+    return tuple(
+        vars(injectable_type)[InjectableTypeRegistration.PROPERTY_NAME]
+        for injectable_type in injectable_types
+        if injectable_type is not None
+    )
@@ -0,0 +1,228 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from .ilifetime_scope import ILifetimeScope
+
+@dataclass(kw_only=True)
+class _CacheEntry:
+    scope: ILifetimeScope
+    sequence_number: int
+    last_accessed_at: float
+    # The disposal of evicted scopes is deferred until they're no longer leased.
+    lease_count: int = 0
+    is_evicted: bool = False
+
+class KeyedScopeCache:
+    """A thread-safe cache of lifetime scopes associated to keys
+    that evicts and disposes of the least recently used or expired scopes.
+
+    A scope may be evicted and disposed of while it's still in use by another thread,
+    unless it's leased via :meth:`lease`, in which case its disposal is deferred
+    until the last lease is released.
+    """
+
+    def __init__(
+        self,
+        capacity: int | None = None,
+        time_to_live: float | None = None
+    ) -> None:
+        """Initializes a new instance.
+
+        :param capacity: The maximum number of scopes kept alive at a time, defaults to None.
+        :type capacity: int | None, optional
+        :param time_to_live: The number of seconds after which an unused scope expires,
+            defaults to None.
+        :type time_to_live: float | None, optional
+        """
+
+        self.__capacity = capacity
+        self.__time_to_live = time_to_live
+        self.__lock = threading.Lock()
+        # Ordered from the least recently used to the most recently used entry.
+        self.__entries = OrderedDict[Hashable, _CacheEntry]()
+        self.__next_sequence_number = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_or_add(
+        self,
+        key: Hashable,
+        scope_factory: Callable[[], ILifetimeScope]
+    ) -> ILifetimeScope:
+        """Gets the scope associated to the specified key,
+        or creates and adds a new one if there is no such scope.
+
+        :param key: The key of the scope.
+        :type key: Hashable
+        :param scope_factory: A factory used to create the scope, if needed.
+        :type scope_factory: Callable[[], ILifetimeScope]
+        :return: The scope associated to the key.
+        :rtype: ILifetimeScope
+        """
+
+        return self.__get_or_add_entry(key, scope_factory, False).scope
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        scope_factory: Callable[[], ILifetimeScope]
+    ) -> Iterator[ILifetimeScope]:
+        """Gets the scope associated to the specified key, or creates and adds a new one
+        if there is no such scope, and keeps it from being disposed of until the lease ends.
+
+        :param key: The key of the scope.
+        :type key: Hashable
+        :param scope_factory: A factory used to create the scope, if needed.
+        :type scope_factory: Callable[[], ILifetimeScope]
+        :return: A context manager that returns the scope associated to the key.
+        :rtype: Iterator[ILifetimeScope]
+        """
+
+        entry = self.__get_or_add_entry(key, scope_factory, True)
+        try:
+            yield entry.scope
+        finally:
+            with self.__lock:
+                entry.lease_count -= 1
+                should_dispose = entry.is_evicted and not entry.lease_count
+
+            if should_dispose:
+                entry.scope.dispose()
+
+    def remove(self, key: Hashable) -> bool:
+        """Removes and disposes of the scope associated to the specified key.
+
+        :param key: The key of the scope.
+        :type key: Hashable
+        :return: True, if a scope has been removed; false, if there is no such scope.
+        :rtype: bool
+        """
+
+        with self.__lock:
+            if not (entry := self.__entries.pop(key, None)):
+                return False
+            evicted_entries = KeyedScopeCache.__mark_evicted([entry])
+
+        KeyedScopeCache.__dispose_entries(evicted_entries)
+        return True
+
+    def evict_expired(self) -> int:
+        """Evicts and disposes of the expired scopes.
+
+        :return: The number of evicted scopes.
+        :rtype: int
+        """
+
+        with self.__lock:
+            evicted_entries = self.__evict_expired_entries(time.monotonic())
+            disposable_entries = KeyedScopeCache.__mark_evicted(evicted_entries)
+
+        KeyedScopeCache.__dispose_entries(disposable_entries)
+        return len(evicted_entries)
+
+    def clear(self) -> None:
+        """Removes and disposes of all the scopes."""
+
+        with self.__lock:
+            entries = KeyedScopeCache.__mark_evicted(list(self.__entries.values()))
+            self.__entries.clear()
+
+        KeyedScopeCache.__dispose_entries(entries)
+
+    def __get_or_add_entry(
+        self,
+        key: Hashable,
+        scope_factory: Callable[[], ILifetimeScope],
+        is_leased: bool
+    ) -> _CacheEntry:
+        now = time.monotonic()
+        with self.__lock:
+            # Evicted first, so that an expired scope is replaced instead of being refreshed.
+            evicted_entries = KeyedScopeCache.__mark_evicted(self.__evict_expired_entries(now))
+            entry = self.__access_entry(key, now, is_leased)
+
+        KeyedScopeCache.__dispose_entries(evicted_entries)
+        if entry:
+            return entry
+
+        # Constructed without holding the lock, so that it doesn't block the other keys.
+        scope = scope_factory()
+        with self.__lock:
+            if entry := self.__access_entry(key, now, is_leased):
+                evicted_entries = []
+            else:
+                entry = self.__entries[key] = _CacheEntry(
+                    scope=scope,
+                    sequence_number=self.__next_sequence_number,
+                    last_accessed_at=now,
+                    lease_count=1 if is_leased else 0
+                )
+                self.__next_sequence_number += 1
+                evicted_entries = KeyedScopeCache.__mark_evicted(
+                    self.__evict_overflowing_entries()
+                )
+
+        # Another thread has added a scope for the same key meanwhile.
+        if entry.scope is not scope:
+            scope.dispose()
+        KeyedScopeCache.__dispose_entries(evicted_entries)
+        return entry
+
+    def __access_entry(self, key: Hashable, now: float, is_leased: bool) -> _CacheEntry | None:
+        if entry := self.__entries.get(key):
+            entry.last_accessed_at = now
+            self.__entries.move_to_end(key)
+            # Leased before releasing the lock, so that the scope cannot be disposed of meanwhile.
+            if is_leased:
+                entry.lease_count += 1
+
+        return entry
+
+    @staticmethod
+    def __mark_evicted(entries: list[_CacheEntry]) -> list[_CacheEntry]:
+        # Returns the entries that can be disposed of right away,
+        # while the leased ones are disposed of by the release of their last lease.
+        for entry in entries:
+            entry.is_evicted = True
+        return [entry for entry in entries if not entry.lease_count]
+
+    @staticmethod
+    def __dispose_entries(entries: list[_CacheEntry]) -> None:
+        # Dispose of the scopes in reverse order of their construction.
+        entries.sort(key=lambda i: i.sequence_number, reverse=True)
+        for entry in entries:
+            entry.scope.dispose()
+
+    def __evict_expired_entries(self, now: float) -> list[_CacheEntry]:
+        evicted_entries = list[_CacheEntry]()
+        if self.__time_to_live is None:
+            return evicted_entries
+
+        # Since the entries are ordered by their last access,
+        # the expired ones are always at the front.
+        expires_before = now - self.__time_to_live
+        while self.__entries:
+            key, entry = next(iter(self.__entries.items()))
+            if entry.last_accessed_at > expires_before:
+                break
+            del self.__entries[key]
+            evicted_entries.append(entry)
+
+        return evicted_entries
+
+    def __evict_overflowing_entries(self) -> list[_CacheEntry]:
+        evicted_entries = list[_CacheEntry]()
+        if self.__capacity is None:
+            return evicted_entries
+
+        while len(self.__entries) > self.__capacity:
+            _, entry = self.__entries.popitem(last=False)
+            evicted_entries.append(entry)
+
+        return evicted_entries
@@ -1,59 +1,429 @@
-import types
-from collections.abc import Iterable
-from typing import Any, get_args
-
-import structlog
+import functools
+import gc
+import inspect
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable, Iterable, Iterator
+from contextlib import AbstractContextManager
+from typing import TYPE_CHECKING, Any
 
 from kanata.catalogs import IInjectableCatalog
-from kanata.utils import get_dependent_contracts
-from .constants import LOGGER_NAME
-from .exceptions import DependencyResolutionException
-from .graphs import BidirectedGraph
-from .graphs.sorting import topological_sort
-from .ilifetime_scope import ILifetimeScope, TInjectable
+from .exceptions import ArgumentException, DependencyResolutionException
+from .factory import Factory
+from .ilifetime_scope import ILifetimeScope, TInjectable, TResult
+from .keyed_scope_cache import KeyedScopeCache
+from .lifetime_scope_options import LifetimeScopeOptions
+from .lifetime_scope_pool import LifetimeScopePool
+from .loggers import get_logger
 from .models import (
-    ClosedGenericTypeId, ClosedGenericTypeInfo, InjectableInstanceRegistration,
-    InjectableRegistration, InjectableScopeType, InjectableTypeRegistration, InstanceCollection
+    CallPlan, CompositeInstanceCollection, ContextInstanceCollection, DependencyKind,
+    ExcludingInstanceCollection, IDisposable, IForkAware, InjectableInstanceRegistration,
+    InjectableRegistration, InjectableScopeType, InjectableTypeRegistration, InstanceCollection,
+    ResolutionPlan, ResolutionStep, ThreadInstanceCollection
 )
+from .plans import ResolutionPlanner
+from .provider import Provider
 from .resolvers import DefaultResolver, IResolver, ResolverContext
 
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Future
+
+    from .metrics import MetricsRegistry
+    from .tracing import Tracer
+
 class LifetimeScope(ILifetimeScope):
     """An injectable lifetime scope
     that manages the lifetimes of injectables
     and provides access to them."""
 
+    __ROOT_SCOPE_TYPES = frozenset((
+        InjectableScopeType.SINGLETON,
+        InjectableScopeType.CONTEXT,
+        InjectableScopeType.THREAD
+    ))
+
+    # The scopes whose instances outlive the resolutions, hence they can be counted.
+    __OBSERVED_SCOPE_TYPES = (
+        InjectableScopeType.SINGLETON,
+        InjectableScopeType.SCOPED,
+        InjectableScopeType.CONTEXT,
+        InjectableScopeType.THREAD
+    )
+
+    # Keyed scope caches, scope pools and fork hooks are created rarely and lazily,
+    # hence they can share a single lock.
+    __KEYED_SCOPES_LOCK = threading.Lock()
+
     def __init__(
         self,
         catalog: IInjectableCatalog,
         resolvers: tuple[IResolver, ...] | None = None,
+        options: LifetimeScopeOptions | None = None,
         _parent: ILifetimeScope | None = None
     ) -> None:
         self.__catalog = catalog
         self.__resolvers: tuple[IResolver, ...] = resolvers or (DefaultResolver(),)
+        self.__options = options or LifetimeScopeOptions()
+        self.__tracer = self.__options.tracer
+        self.__metrics = self.__options.metrics
         self.__parent = _parent
-        self.__log = structlog.get_logger(logger_name=LOGGER_NAME)
+        self.__keyed_scopes: KeyedScopeCache | None = None
+        self.__scope_pool: LifetimeScopePool | None = None
+        self.__log = get_logger()
         self.__instances = InstanceCollection()
-        # The below dictionaries are used for tracking
-        # the dynamically created closed generic types.
-        self.__closed_generic_type_infos_by_id = dict[ClosedGenericTypeId, ClosedGenericTypeInfo]()
-        self.__closed_generic_type_infos_by_type = dict[type, ClosedGenericTypeInfo]()
+        if isinstance(_parent, LifetimeScope):
+            # Singletons, ambient instances and resolution plans
+            # are owned by the root and are shared by the whole tree.
+            self.__root: LifetimeScope = _parent.__root
+            self.__planner: ResolutionPlanner = self.__root.__planner
+            self.__resolvers_by_registration = (
+                _parent.__resolvers_by_registration
+                if self.__resolvers is _parent.__resolvers
+                else dict[int, tuple[InjectableRegistration, IResolver]]()
+            )
+        else:
+            self.__root = self
+            self.__planner = ResolutionPlanner.for_catalog(catalog)
+            # The resolver of each registration, looked up on its first construction.
+            self.__resolvers_by_registration = dict[int, tuple[InjectableRegistration, IResolver]]()
+            self.__context_instances = ContextInstanceCollection()
+            self.__thread_instances = ThreadInstanceCollection()
+            # Reentrant, since shared instances may resolve other shared instances on construction.
+            self.__shared_instances_lock = threading.RLock()
+            # The below fields are used for tracking the expiration of singletons.
+            self.__expiration_lock = threading.Lock()
+            self.__expiration_times = dict[type, float]()
+            self.__refreshing_injectables = set[type]()
+            self.__is_fork_hook_registered = False
+
+        if self.__metrics is not None:
+            self.__bind_metrics(self.__metrics)
+
+        root = self.__root
+        # Transient and per-resolve instances are tracked per resolution instead.
+        self.__instances_by_scope = {
+            InjectableScopeType.SCOPED: self.__instances,
+            InjectableScopeType.SINGLETON: root.__instances,
+            InjectableScopeType.CONTEXT: root.__context_instances,
+            InjectableScopeType.THREAD: root.__thread_instances
+        }
 
     def resolve(self, injectable: type[TInjectable]) -> TInjectable:
+        if (tracer := self.__tracer) is None:
+            return self.__resolve(injectable)
+
+        return LifetimeScope.__trace(tracer, "resolve", self.__resolve, injectable)
+
+    def try_resolve(self, injectable: type[TInjectable]) -> TInjectable | None:
+        if (tracer := self.__tracer) is None:
+            return self.__try_resolve(injectable)
+
+        return LifetimeScope.__trace(tracer, "try_resolve", self.__try_resolve, injectable)
+
+    def resolve_many(self, injectables: Iterable[type]) -> tuple[Any, ...]:
+        if (tracer := self.__tracer) is None:
+            return self.__resolve_many(injectables)
+
+        return LifetimeScope.__trace(tracer, "resolve_many", self.__resolve_many, tuple(injectables))
+
+    def call(self, func: Callable[..., TResult], /, *args: Any, **kwargs: Any) -> TResult:
+        if inspect.ismethod(func):
+            # Bound methods are created on each access, so their functions are planned instead.
+            plan = self.__planner.get_call_plan(func.__func__)
+            positional_count = len(args) + 1
+        else:
+            plan = self.__planner.get_call_plan(func)
+            positional_count = len(args)
+
+        injected_arguments = self.__get_injected_arguments(func, plan, positional_count, kwargs)
+        return func(*args, **kwargs, **injected_arguments)
+
+    async def call_async(self, func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        result = self.call(func, *args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def create_child_scope(self) -> ILifetimeScope:
+        return LifetimeScope(self.__catalog, self.__resolvers, self.__options, _parent=self)
+
+    def for_key(self, key: Hashable) -> ILifetimeScope:
+        return self.__get_keyed_scopes().get_or_add(key, self.create_child_scope)
+
+    def lease_key(self, key: Hashable) -> AbstractContextManager[ILifetimeScope]:
+        return self.__get_keyed_scopes().lease(key, self.create_child_scope)
+
+    def map(
+        self,
+        handler: type,
+        items: Iterable[Any],
+        concurrency: int = 1
+    ) -> Iterator[Any]:
+        LifetimeScope.__validate_concurrency(concurrency)
+        return self.__map(handler, items, concurrency)
+
+    def map_async(
+        self,
+        handler: type,
+        items: Iterable[Any] | AsyncIterable[Any],
+        concurrency: int = 1
+    ) -> AsyncIterator[Any]:
+        LifetimeScope.__validate_concurrency(concurrency)
+        return self.__map_async(handler, items, concurrency)
+
+    def dispose(self) -> None:
+        if self.__metrics is not None:
+            self.__scopes_disposed_counter.increment()
+        if self.__keyed_scopes:
+            self.__keyed_scopes.clear()
+
+        self.__instances.dispose()
+        if self.__root is self:
+            self.__context_instances.dispose()
+            self.__thread_instances.dispose()
+
+    async def dispose_async(self) -> None:
+        if self.__metrics is not None:
+            self.__scopes_disposed_counter.increment()
+        if self.__keyed_scopes:
+            self.__keyed_scopes.clear()
+
+        await self.__instances.dispose_async()
+        if self.__root is self:
+            self.__context_instances.dispose()
+            self.__thread_instances.dispose()
+
+    def prepare_for_fork(self) -> None:
+        root = self.__root
+        for registration in self.__catalog.get_registrations():
+            # Open generic injectables are planned along with their dependees.
+            if (
+                not isinstance(registration, InjectableTypeRegistration)
+                or registration.is_generic
+                or registration.is_external
+            ):
+                continue
+
+            injectable = registration.injectable_type
+            if not (plan := root.__planner.try_get_plan((injectable,))):
+                root.__log.debug("Skipping unsatisfiable injectable", injectable=injectable)
+                continue
+
+            if registration.scope == InjectableScopeType.SINGLETON:
+                root.__execute_plan(plan)
+
+        with LifetimeScope.__KEYED_SCOPES_LOCK:
+            if not root.__is_fork_hook_registered and hasattr(os, "register_at_fork"):
+                # Referenced weakly, since the hooks cannot be unregistered.
+                os.register_at_fork(after_in_child=functools.partial(
+                    LifetimeScope.__run_fork_hooks,
+                    weakref.ref(root)
+                ))
+                root.__is_fork_hook_registered = True
+
+        # Moving the surviving objects to the permanent generation prevents
+        # the collections of the forked processes from touching their memory pages.
+        gc.collect()
+        gc.freeze()
+        root.__log.debug("Prepared for fork", frozen_object_count=gc.get_freeze_count())
+
+    def add_instance(self, injectable: type, instance: Any) -> None:
+        self.__instances.add_instance(InjectableScopeType.SCOPED, injectable, instance)
+
+    @staticmethod
+    def __run_fork_hooks(root_reference: "weakref.ref[LifetimeScope]") -> None:
+        if not (root := root_reference()):
+            return
+
+        for instance in root.__instances.get_instances():
+            # Checking the attribute is much faster than checking against the protocol.
+            if after_fork := getattr(instance, IForkAware.after_fork.__name__, None):
+                after_fork()
+
+    @staticmethod
+    def __validate_concurrency(concurrency: int) -> None:
+        if concurrency < 1:
+            raise ArgumentException(
+                "concurrency",
+                concurrency,
+                "The concurrency must be a positive integer."
+            )
+
+    def __get_keyed_scopes(self) -> KeyedScopeCache:
+        if not (keyed_scopes := self.__keyed_scopes):
+            with LifetimeScope.__KEYED_SCOPES_LOCK:
+                if not (keyed_scopes := self.__keyed_scopes):
+                    self.__keyed_scopes = keyed_scopes = KeyedScopeCache(
+                        self.__options.keyed_scope_capacity,
+                        self.__options.keyed_scope_time_to_live
+                    )
+
+        return keyed_scopes
+
+    def __get_scope_pool(self) -> LifetimeScopePool:
+        if not (scope_pool := self.__scope_pool):
+            with LifetimeScope.__KEYED_SCOPES_LOCK:
+                if not (scope_pool := self.__scope_pool):
+                    self.__scope_pool = scope_pool = LifetimeScopePool(self.create_child_scope)
+
+        return scope_pool
+
+    def __map(
+        self,
+        handler: type,
+        items: Iterable[Any],
+        concurrency: int
+    ) -> Iterator[Any]:
+        # Imported on demand to keep the import of the framework inexpensive.
+        from concurrent.futures import ThreadPoolExecutor # pylint: disable=import-outside-toplevel
+
+        scope_pool = self.__get_scope_pool()
+        with ThreadPoolExecutor(concurrency, thread_name_prefix="kanata-map") as executor:
+            # The items are pulled only when there is room for them,
+            # hence at most "concurrency" items are in flight at a time.
+            pending_results: deque[Future] = deque()
+            try:
+                for item in items:
+                    if len(pending_results) >= concurrency:
+                        yield pending_results.popleft().result()
+                    pending_results.append(
+                        executor.submit(LifetimeScope.__handle_item, scope_pool, handler, item)
+                    )
+
+                while pending_results:
+                    yield pending_results.popleft().result()
+            finally:
+                for pending_result in pending_results:
+                    pending_result.cancel()
+
+    async def __map_async(
+        self,
+        handler: type,
+        items: Iterable[Any] | AsyncIterable[Any],
+        concurrency: int
+    ) -> AsyncIterator[Any]:
+        import asyncio # pylint: disable=import-outside-toplevel
+
+        scope_pool = self.__get_scope_pool()
+        # Each item is handled by its own task, hence context-bound
+        # injectables are also unique to each of the items.
+        pending_results: deque[asyncio.Task] = deque()
+        try:
+            async for item in LifetimeScope.__iterate_async(items):
+                if len(pending_results) >= concurrency:
+                    yield await pending_results.popleft()
+                pending_results.append(asyncio.ensure_future(
+                    LifetimeScope.__handle_item_async(scope_pool, handler, item)
+                ))
+
+            while pending_results:
+                yield await pending_results.popleft()
+        finally:
+            for pending_result in pending_results:
+                pending_result.cancel()
+            # Awaited so that the child scopes of the cancelled items are released
+            # and the exceptions of the items are retrieved.
+            await asyncio.gather(*pending_results, return_exceptions=True)
+
+    @staticmethod
+    async def __iterate_async(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield item
+        else:
+            for item in items:
+                yield item
+
+    @staticmethod
+    def __handle_item(scope_pool: LifetimeScopePool, handler: type, item: Any) -> Any:
+        scope = scope_pool.acquire()
+        try:
+            return scope.resolve(handler)(item)
+        finally:
+            scope_pool.release(scope)
+
+    @staticmethod
+    async def __handle_item_async(
+        scope_pool: LifetimeScopePool,
+        handler: type,
+        item: Any
+    ) -> Any:
+        scope = scope_pool.acquire()
+        try:
+            result = scope.resolve(handler)(item)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        finally:
+            await scope_pool.release_async(scope)
+
+    def __get_injected_arguments(
+        self,
+        func: Callable,
+        plan: CallPlan,
+        positional_count: int,
+        kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        missing_parameters = [
+            parameter
+            for parameter in plan.parameters
+            if parameter.name not in kwargs
+            and (parameter.position is None or parameter.position >= positional_count)
+        ]
+        if not missing_parameters:
+            return {}
+
+        injectable_types = list[type]()
+        for parameter in missing_parameters:
+            match parameter.kind:
+                case DependencyKind.INSTANCE | DependencyKind.OPTIONAL:
+                    injectable_types.extend(parameter.injectable_types[:1])
+                case DependencyKind.TUPLE:
+                    injectable_types.extend(parameter.injectable_types)
+
+        # Resolving the dependencies in a single batch shares
+        # the per-resolve instances between the parameters.
+        instances = dict(zip(injectable_types, self.resolve_many(injectable_types)))
+        injected_arguments = dict[str, Any]()
+        for parameter in missing_parameters:
+            if parameter.kind == DependencyKind.TUPLE:
+                injected_arguments[parameter.name] = tuple(
+                    instances[injectable_type]
+                    for injectable_type in parameter.injectable_types
+                )
+            elif not parameter.injectable_types:
+                if parameter.has_default:
+                    continue
+                if parameter.kind == DependencyKind.OPTIONAL:
+                    injected_arguments[parameter.name] = None
+                    continue
+                raise DependencyResolutionException(
+                    parameter.contract,
+                    f"Cannot satisfy the dependency of {func} on {parameter.contract}."
+                )
+            elif parameter.kind == DependencyKind.PROVIDER:
+                injected_arguments[parameter.name] = Provider(self, parameter.contract)
+            elif parameter.kind == DependencyKind.FACTORY:
+                injected_arguments[parameter.name] = Factory(self, parameter.injectable_types[0])
+            else:
+                injected_arguments[parameter.name] = instances[parameter.injectable_types[0]]
+
+        return injected_arguments
+
+    def __resolve(self, injectable: type[TInjectable]) -> TInjectable:
+        injectable = self.__planner.get_injectable_type(injectable)
         if self.__parent and self.__should_resolve_via_parent(injectable):
             return self.__parent.resolve(injectable)
 
-        dependency_graph = self.__build_dependency_graph_for(injectable)
-        resolver_context = ResolverContext(
-            catalog=self.__catalog,
-            closed_generic_types=self.__closed_generic_type_infos_by_id,
-            instances=self.__instances
-        )
-        instance = None
-        for current_injectable in topological_sort(dependency_graph, injectable):
-            self.__log.debug("Resolving injectable", type=current_injectable)
-            instance = self.__resolve_injectable(resolver_context, current_injectable)
-            self.__log.debug("Resolved injectable", type=current_injectable)
+        requested_types = (injectable,)
+        if self.__metrics is not None:
+            self.__count_plan_lookup(requested_types)
 
+        instance = self.__execute_plan(self.__planner.get_plan(requested_types))[0]
         if not isinstance(instance, injectable):
             raise DependencyResolutionException(
                 type(instance),
@@ -65,193 +435,341 @@ class LifetimeScope(ILifetimeScope):
 
         return instance
 
-    def create_child_scope(self) -> ILifetimeScope:
-        return LifetimeScope(self.__catalog, self.__resolvers, _parent=self)
+    def __try_resolve(self, injectable: type[TInjectable]) -> TInjectable | None:
+        # Closed generic types are created dynamically, hence they're unknown to the catalog.
+        is_registered = (
+            self.__catalog.is_registered(injectable)
+            or self.__planner.get_registration(injectable) is not None
+        )
+        if not is_registered:
+            return None
 
-    @staticmethod
-    def __get_injectable_scope_type(registration: InjectableRegistration) -> InjectableScopeType:
-        match registration:
-            case InjectableTypeRegistration():
-                return registration.scope
-            case InjectableInstanceRegistration():
-                return InjectableScopeType.SINGLETON
-            case _:
-                raise DependencyResolutionException(
-                    type(registration),
-                    "Unsupported type of injectable registration."
-                )
+        injectable = self.__planner.get_injectable_type(injectable)
+        if self.__parent and self.__should_resolve_via_parent(injectable):
+            return self.__parent.try_resolve(injectable)
 
-    def __build_dependency_graph_for(self, injectable: type) -> BidirectedGraph[type]:
-        graph: BidirectedGraph[type] = BidirectedGraph()
-        injectables_to_resolve: list[type] = [injectable]
-        while injectables_to_resolve:
-            dependee_injectable = injectables_to_resolve.pop()
-            if not graph.try_add_node(dependee_injectable):
-                # This type's dependency chain has already been mapped.
-                continue
+        requested_types = (injectable,)
+        if self.__metrics is not None:
+            self.__count_plan_lookup(requested_types)
 
-            self.__log.debug("Gathering dependent contracts", dependee=dependee_injectable)
-            dependent_contracts = get_dependent_contracts(dependee_injectable)
-            for dependent_contract, is_multi in dependent_contracts:
-                self.__log.debug(
-                    "Found dependent contract",
-                    dependee=dependee_injectable,
-                    dependent=dependent_contract,
-                    is_multi=is_multi
-                )
-                dependent_registrations = self.__catalog.get_registrations_by_contract(
-                    dependent_contract
+        if not (plan := self.__planner.try_get_plan(requested_types)):
+            return None
+
+        return self.__execute_plan(plan)[0]
+
+    def __resolve_many(self, injectables: Iterable[type]) -> tuple[Any, ...]:
+        requested_types = tuple(injectables)
+        if self.__metrics is not None:
+            self.__count_plan_lookup(requested_types)
+
+        return self.__execute_plan(self.__planner.get_plan(requested_types))
+
+    def __bind_metrics(self, metrics: "MetricsRegistry") -> None:
+        # The metrics are bound once per tree, so that updating them involves no lookups.
+        root = self.__root
+        if root is self:
+            self.__scopes_created_counter = metrics.get_counter("kanata_lifetime_scopes_created")
+            self.__scopes_disposed_counter = metrics.get_counter(
+                "kanata_lifetime_scopes_disposed"
+            )
+            self.__plan_cache_hit_counter = metrics.get_counter(
+                "kanata_plan_cache_lookups",
+                result="hit"
+            )
+            self.__plan_cache_miss_counter = metrics.get_counter(
+                "kanata_plan_cache_lookups",
+                result="miss"
+            )
+            self.__live_scopes = weakref.WeakSet[LifetimeScope]()
+            for scope_type in LifetimeScope.__OBSERVED_SCOPE_TYPES:
+                metrics.add_gauge(
+                    "kanata_live_instances",
+                    functools.partial(
+                        LifetimeScope.__observe_instance_count,
+                        weakref.ref(self),
+                        scope_type
+                    ),
+                    scope=scope_type.name.lower()
                 )
-                if len(dependent_registrations) == 0 and not is_multi:
-                    raise DependencyResolutionException(
-                        dependee_injectable,
-                        "Cannot satisfy the dependency"
-                        f" of {dependee_injectable} on {dependent_contract}."
-                    )
+        else:
+            self.__scopes_created_counter = root.__scopes_created_counter
+            self.__scopes_disposed_counter = root.__scopes_disposed_counter
+            self.__plan_cache_hit_counter = root.__plan_cache_hit_counter
+            self.__plan_cache_miss_counter = root.__plan_cache_miss_counter
+            root.__live_scopes.add(self)
 
-                injectables_to_resolve.extend(
-                    self.__mark_dependent_types(
-                        graph,
-                        dependee_injectable,
-                        dependent_contract,
-                        dependent_registrations
-                    )
+        self.__scopes_created_counter.increment()
+
+    def __count_plan_lookup(self, requested_types: tuple[type, ...]) -> None:
+        if self.__planner.is_planned(requested_types):
+            self.__plan_cache_hit_counter.increment()
+        else:
+            self.__plan_cache_miss_counter.increment()
+
+    @staticmethod
+    def __observe_instance_count(
+        root_reference: "weakref.ref[LifetimeScope]",
+        scope_type: InjectableScopeType
+    ) -> int | None:
+        if (root := root_reference()) is None:
+            return None
+
+        match scope_type:
+            case InjectableScopeType.SINGLETON:
+                return root.__instances.get_instance_count()
+            case InjectableScopeType.SCOPED:
+                return sum(
+                    scope.__instances.get_instance_count() for scope in tuple(root.__live_scopes)
                 )
+            case InjectableScopeType.CONTEXT:
+                return root.__context_instances.get_instance_count()
+            case _:
+                return root.__thread_instances.get_instance_count()
 
-        return graph
+    @staticmethod
+    def __trace(
+        tracer: "Tracer",
+        name: str,
+        func: Callable[[Any], TResult],
+        argument: Any
+    ) -> TResult:
+        span = tracer.start_span(name, "resolution", injectable=argument)
+        try:
+            return func(argument)
+        finally:
+            tracer.end_span(span)
+
+    def __execute_plan(self, plan: ResolutionPlan) -> tuple[Any, ...]:
+        resolution_instances = InstanceCollection()
+        instances = CompositeInstanceCollection({
+            **self.__instances_by_scope,
+            InjectableScopeType.TRANSIENT: resolution_instances,
+            InjectableScopeType.PER_RESOLVE: resolution_instances
+        })
+        resolver_context = ResolverContext(
+            catalog=self.__catalog,
+            closed_generic_types=self.__planner.closed_generic_types,
+            instances=instances,
+            lifetime_scope=self,
+            root_lifetime_scope=self.__root,
+            create_instance=self.__create_instance,
+            metrics=self.__metrics,
+            tracer=self.__tracer
+        )
+        requested_instances = dict[type, Any]()
+        is_debug_enabled = self.__log.is_debug_enabled
+        for step in plan.steps:
+            if is_debug_enabled:
+                self.__log.debug("Resolving injectable", type=step.injectable_type)
+            instance = self.__resolve_injectable(resolver_context, instances, step)
+            if step.is_requested:
+                requested_instances[step.injectable_type] = instance
+            if is_debug_enabled:
+                self.__log.debug("Resolved injectable", type=step.injectable_type)
+
+        return tuple(
+            requested_instances[injectable_type]
+            for injectable_type in plan.injectable_types
+        )
 
     def __resolve_injectable(
         self,
         resolver_context: ResolverContext,
-        injectable: type
+        instances: CompositeInstanceCollection,
+        step: ResolutionStep
     ) -> Any:
-        if closed_generic_type_info := self.__closed_generic_type_infos_by_type.get(injectable):
-            registration = closed_generic_type_info.origin_registration
+        injectable, registration, scope_type, _ = step
+        expiring_registration = (
+            registration
+            if isinstance(registration, InjectableTypeRegistration)
+            and registration.time_to_live is not None
+            else None
+        )
+        if expiring_registration is not None:
+            self.__root.__handle_expiration(expiring_registration, injectable)
+
+        # Instances registered as-is are owned by whoever registered them.
+        if isinstance(registration, InjectableInstanceRegistration):
+            instance = self.__create_instance(resolver_context, registration, injectable)
+        elif scope_type in LifetimeScope.__ROOT_SCOPE_TYPES:
+            instance = self.__create_shared_instance(resolver_context, instances, step)
         else:
-            registration = self.__catalog.get_registration_by_injectable(injectable)
-            if not registration:
-                raise DependencyResolutionException(
-                    injectable,
-                    f"Cannot find the registration for injectable '{injectable}'."
-                    " It is possible that this type is not an injectable."
-                )
+            instance = self.__create_instance(resolver_context, registration, injectable)
+            instances.add_instance(scope_type, injectable, instance)
+        if expiring_registration is not None:
+            self.__root.__track_expiration(expiring_registration, injectable)
 
-        for resolver in self.__resolvers:
-            if not (instance := resolver.resolve(resolver_context, registration, injectable)):
-                continue
+        return instance
+
+    def __create_shared_instance(
+        self,
+        resolver_context: ResolverContext,
+        instances: CompositeInstanceCollection,
+        step: ResolutionStep
+    ) -> Any:
+        # Concurrent resolutions, such as the ones of map, may all miss the same instance,
+        # hence it's looked up again and constructed while holding the lock of the root.
+        injectable, registration, scope_type, _ = step
+        instance = next(instances.get_instances_by_injectable(injectable, scope_type), None)
+        if instance is not None:
+            return instance
+
+        with self.__root.__shared_instances_lock:
+            instance = next(instances.get_instances_by_injectable(injectable, scope_type), None)
+            if instance is None:
+                instance = self.__create_instance(resolver_context, registration, injectable)
+                instances.add_instance(scope_type, injectable, instance)
+
+        return instance
+
+    def __create_instance(
+        self,
+        resolver_context: ResolverContext,
+        registration: InjectableRegistration,
+        injectable: type
+    ) -> Any:
+        resolver = self.__get_resolver(registration, injectable)
+        instance = resolver.resolve(resolver_context, registration, injectable)
+
+        if instance is None:
+            raise DependencyResolutionException(
+                injectable,
+                "The resolver of the specified type didn't resolve an instance."
+            )
 
+        if self.__log.is_debug_enabled:
             self.__log.debug("Instantiated injectable", injectable=injectable)
-            scope = LifetimeScope.__get_injectable_scope_type(registration)
-            self.__instances.add_instance(scope, injectable, instance)
+        return instance
 
-            return instance
+    def __get_resolver(self, registration: InjectableRegistration, injectable: type) -> IResolver:
+        # Registrations are unhashable, hence they're keyed by their identities,
+        # while the registrations themselves are kept to detect reused identities.
+        entry = self.__resolvers_by_registration.get(id(registration))
+        if entry is not None and entry[0] is registration:
+            return entry[1]
+
+        for resolver in self.__resolvers:
+            # Resolvers that conform to the protocol without subclassing it resolve everything.
+            can_resolve = getattr(resolver, "can_resolve", None)
+            if can_resolve is None or can_resolve(registration):
+                self.__resolvers_by_registration[id(registration)] = (registration, resolver)
+                return resolver
 
         raise DependencyResolutionException(
             injectable,
             "None of the resolvers could resolve an instance of the specified type."
         )
 
-    def __should_resolve_via_parent(
+    def __handle_expiration(
         self,
+        registration: InjectableTypeRegistration,
         injectable: type
-    ) -> bool:
-        registration = self.__catalog.get_registration_by_injectable(injectable)
-        match registration:
-            case InjectableTypeRegistration(scope=InjectableScopeType.SINGLETON): return True
-            case InjectableInstanceRegistration(): return True
-            case _: return False
-
-    def __mark_dependent_types(
-        self,
-        graph: BidirectedGraph[type],
-        dependee_injectable: type,
-        dependent_contract: type,
-        dependent_registrations: Iterable[InjectableRegistration]
-    ) -> Iterable[type]:
-        # Mark each implementation as a dependency. At this point,
-        # it is possible only one of them will be needed by
-        # this specific type. But we'll make sure all are initialized
-        # as they may be needed later.
-        dependent_types = []
-        for dependent_registration in dependent_registrations:
-            injectable_type = self.__get_injectable_type(
-                dependent_contract,
-                dependent_registration
-            )
+    ) -> None:
+        with self.__expiration_lock:
+            expiration_time = self.__expiration_times.get(injectable)
+            if expiration_time is None or time.monotonic() < expiration_time:
+                return
 
-            graph.try_add_node(dependee_injectable)
-            graph.try_add_edge(dependee_injectable, injectable_type)
-            dependent_types.append(injectable_type)
-            self.__log.debug(
-                "Identified dependent injectable",
-                dependee=dependee_injectable,
-                dependent=injectable_type
-            )
+            if not registration.refresh_in_background:
+                # Forget the expired instance so that it's rebuilt right away.
+                self.__log.debug("Rebuilding expired injectable", injectable=injectable)
+                del self.__expiration_times[injectable]
+                expired_instances = self.__instances.remove_instances(
+                    InjectableScopeType.SINGLETON,
+                    injectable
+                )
+            elif injectable in self.__refreshing_injectables:
+                return
+            else:
+                expired_instances = None
+                self.__refreshing_injectables.add(injectable)
 
-        return dependent_types
+        if expired_instances is not None:
+            LifetimeScope.__dispose_expired_instances(expired_instances)
+            return
 
-    def __get_injectable_type(
-        self,
-        dependent_contract: type,
-        dependent_registration: InjectableRegistration
-    ) -> type:
-        match dependent_registration:
-            case InjectableTypeRegistration():
-                generic_type = self.__get_or_create_generic_type(
-                    dependent_registration,
-                    dependent_contract
-                )
-                return (
-                    generic_type.closed_generic_type if generic_type
-                    else dependent_registration.injectable_type
-                )
-            case InjectableInstanceRegistration():
-                return type(dependent_registration.injectable_instance)
-            case _:
-                raise DependencyResolutionException(
-                    type(dependent_registration),
-                    "Unsupported type of injectable registration."
-                )
+        # Meanwhile, the stale instance is returned to the callers.
+        self.__log.debug("Refreshing expired injectable", injectable=injectable)
+        threading.Thread(
+            target=self.__refresh_expired_instance,
+            args=(registration, injectable),
+            name=f"kanata-refresh-{injectable.__name__}",
+            daemon=True
+        ).start()
 
-    def __get_or_create_generic_type(
+    def __track_expiration(
         self,
         registration: InjectableTypeRegistration,
-        contract: type
-    ) -> ClosedGenericTypeInfo | None:
-        if not registration.is_generic:
-            return None
+        injectable: type
+    ) -> None:
+        if registration.time_to_live is None:
+            return
 
-        type_arguments = get_args(contract)
-        if len(type_arguments) != 1:
-            raise DependencyResolutionException(
-                contract,
-                "The generic contract must have one single generic type argument."
+        with self.__expiration_lock:
+            self.__expiration_times.setdefault(
+                injectable,
+                time.monotonic() + registration.time_to_live
             )
 
-        type_argument = type_arguments[0]
-        generic_type_id = ClosedGenericTypeId(registration.injectable_type, type_argument)
-
-        # Avoid creating the same type multiple times.
-        if existing_type := self.__closed_generic_type_infos_by_id.get(generic_type_id):
-            return existing_type
-
-        closed_generic_type = types.new_class(
-            f"{registration.injectable_type.__name__}Of{type_argument.__name__}",
-            # Ignoring the type here, because the linter isn't aware this type is a Generic[T].
-            (registration.injectable_type[type_argument],), # type: ignore
-            None,
-            lambda ns: ns.update({
-                "generic_type_argument": property(lambda _: type_argument)
-            })
-        )
-        generic_type_info = ClosedGenericTypeInfo(
-            closed_generic_type=closed_generic_type,
-            generic_type_argument=type_argument,
-            origin_registration=registration
-        )
+    def __refresh_expired_instance(
+        self,
+        registration: InjectableTypeRegistration,
+        injectable: type
+    ) -> None:
+        try:
+            # Hide the expired instance to have the resolvers construct a new one.
+            resolver_context = ResolverContext(
+                catalog=self.__catalog,
+                closed_generic_types=self.__planner.closed_generic_types,
+                instances=ExcludingInstanceCollection(
+                    CompositeInstanceCollection(self.__instances_by_scope),
+                    injectable
+                ),
+                lifetime_scope=self,
+                root_lifetime_scope=self.__root,
+                create_instance=self.__create_instance,
+                metrics=self.__metrics,
+                tracer=self.__tracer
+            )
+            instance = self.__create_instance(resolver_context, registration, injectable)
+            with self.__expiration_lock:
+                expired_instances = self.__instances.replace_instances(
+                    InjectableScopeType.SINGLETON,
+                    injectable,
+                    instance
+                )
+                if registration.time_to_live is not None:
+                    self.__expiration_times[injectable] = (
+                        time.monotonic() + registration.time_to_live
+                    )
+            self.__log.debug("Refreshed expired injectable", injectable=injectable)
+            LifetimeScope.__dispose_expired_instances(expired_instances)
+        except Exception: # pylint: disable=broad-except
+            # The stale instance is kept and the refresh is retried on the next request.
+            self.__log.warning(
+                "Failed to refresh expired injectable",
+                injectable=injectable,
+                exc_info=True
+            )
+        finally:
+            with self.__expiration_lock:
+                self.__refreshing_injectables.discard(injectable)
 
-        # Save the newly created type to avoid recreating it if it's needed later.
-        self.__closed_generic_type_infos_by_id[generic_type_id] = generic_type_info
-        self.__closed_generic_type_infos_by_type[closed_generic_type] = generic_type_info
+    @staticmethod
+    def __dispose_expired_instances(instances: tuple[Any, ...]) -> None:
+        # The expired instances are no longer tracked by the collection,
+        # hence they're disposed of as soon as they're no longer handed out.
+        for instance in instances:
+            if dispose := getattr(instance, IDisposable.dispose.__name__, None):
+                dispose()
 
-        return generic_type_info
+    def __should_resolve_via_parent(
+        self,
+        injectable: type
+    ) -> bool:
+        registration = self.__planner.get_registration(injectable)
+        match registration:
+            case InjectableTypeRegistration(scope=scope_type):
+                return scope_type in LifetimeScope.__ROOT_SCOPE_TYPES
+            case InjectableInstanceRegistration(): return True
+            case _: return False
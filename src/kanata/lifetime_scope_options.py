@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kanata.metrics import MetricsRegistry
+    from kanata.tracing import Tracer
+
+@dataclass
+class LifetimeScopeOptions:
+    """Holds options for a lifetime scope."""
+
+    keyed_scope_capacity: int | None = 128
+    """Gets or sets the maximum number of keyed child scopes kept alive at a time.
+    When exceeded, the least recently used keyed scope is evicted and disposed of.
+    If None, the number of keyed scopes is unbounded.
+    """
+
+    keyed_scope_time_to_live: float | None = None
+    """Gets or sets the number of seconds after which a keyed child scope
+    that hasn't been accessed since is evicted and disposed of.
+    If None, keyed scopes don't expire.
+    """
+
+    tracer: Tracer | None = None
+    """Gets or sets the tracer that records the resolutions, the planning
+    and the constructions of injectables of the lifetime scope and its children.
+    If None, the operations aren't traced.
+    """
+
+    metrics: MetricsRegistry | None = None
+    """Gets or sets the registry of the metrics that the lifetime scope and its children,
+    and the resolvers called by them, update. If None, no metrics are recorded.
+    """
@@ -0,0 +1,68 @@
+import threading
+from collections.abc import Callable
+
+from .ilifetime_scope import ILifetimeScope
+
+class LifetimeScopePool:
+    """A thread-safe pool of lifetime scopes that are reused
+    after their instances have been disposed of.
+    """
+
+    def __init__(
+        self,
+        scope_factory: Callable[[], ILifetimeScope],
+        capacity: int | None = None
+    ) -> None:
+        """Initializes a new instance.
+
+        :param scope_factory: A factory used to create new scopes when the pool is empty.
+        :type scope_factory: Callable[[], ILifetimeScope]
+        :param capacity: The maximum number of idle scopes kept in the pool, defaults to None.
+        :type capacity: int | None, optional
+        """
+
+        self.__scope_factory = scope_factory
+        self.__capacity = capacity
+        self.__lock = threading.Lock()
+        self.__idle_scopes = list[ILifetimeScope]()
+
+    def __len__(self) -> int:
+        return len(self.__idle_scopes)
+
+    def acquire(self) -> ILifetimeScope:
+        """Takes an idle scope from the pool, or creates a new one if there is none.
+
+        :return: A scope without any instances of its own.
+        :rtype: ILifetimeScope
+        """
+
+        with self.__lock:
+            if self.__idle_scopes:
+                return self.__idle_scopes.pop()
+
+        return self.__scope_factory()
+
+    def release(self, scope: ILifetimeScope) -> None:
+        """Disposes of the instances of the specified scope
+        and returns the scope to the pool for later reuse.
+
+        :param scope: A scope previously acquired from the pool.
+        :type scope: ILifetimeScope
+        """
+
+        scope.dispose()
+        with self.__lock:
+            if self.__capacity is None or len(self.__idle_scopes) < self.__capacity:
+                self.__idle_scopes.append(scope)
+
+    async def release_async(self, scope: ILifetimeScope) -> None:
+        """Same as :meth:`release`, but asynchronously disposable instances are awaited.
+
+        :param scope: A scope previously acquired from the pool.
+        :type scope: ILifetimeScope
+        """
+
+        await scope.dispose_async()
+        with self.__lock:
+            if self.__capacity is None or len(self.__idle_scopes) < self.__capacity:
+                self.__idle_scopes.append(scope)
@@ -0,0 +1,16 @@
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .ilogger import ILogger
+    from .logger_registry import get_logger, set_logger
+    from .null_logger import NullLogger
+    from .structlog_logger import StructlogLogger
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "ilogger": ("ILogger",),
+    "logger_registry": ("get_logger", "set_logger"),
+    "null_logger": ("NullLogger",),
+    "structlog_logger": ("StructlogLogger",)
+})
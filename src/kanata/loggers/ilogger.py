@@ -0,0 +1,30 @@
+from typing import Any, Protocol
+
+class ILogger(Protocol):
+    """Interface for a sink of the log events of the framework."""
+
+    @property
+    def is_debug_enabled(self) -> bool:
+        """Gets whether debug events are logged.
+
+        The framework checks this before building debug events,
+        once per operation rather than once per event, hence
+        it's expected to be inexpensive.
+        """
+        ...
+
+    def debug(self, event: str, **kwargs: Any) -> None:
+        """Logs a debug event.
+
+        :param event: The description of the event.
+        :type event: str
+        """
+        ...
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        """Logs a warning event.
+
+        :param event: The description of the event.
+        :type event: str
+        """
+        ...
@@ -0,0 +1,29 @@
+"""Access to the logger used by the framework."""
+
+from .ilogger import ILogger
+from .null_logger import NullLogger
+
+__logger: ILogger = NullLogger()
+
+def get_logger() -> ILogger:
+    """Gets the logger used by the framework.
+
+    :return: The logger used by the framework.
+    :rtype: ILogger
+    """
+
+    return __logger
+
+def set_logger(logger: ILogger | None) -> None:
+    """Sets the logger used by the framework.
+
+    The components of the framework, such as the lifetime scopes and the planners,
+    retrieve the logger upon their construction, hence the logger
+    is expected to be set before the first lifetime scope is created.
+
+    :param logger: The logger to be used, or None to discard all events.
+    :type logger: ILogger | None
+    """
+
+    global __logger # pylint: disable=global-statement,invalid-name
+    __logger = logger or NullLogger()
@@ -0,0 +1,16 @@
+from typing import Any
+
+from .ilogger import ILogger
+
+class NullLogger(ILogger):
+    """A logger that discards all events. This is the default logger of the framework."""
+
+    @property
+    def is_debug_enabled(self) -> bool:
+        return False
+
+    def debug(self, event: str, **kwargs: Any) -> None:
+        pass
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        pass
@@ -0,0 +1,61 @@
+import logging
+from typing import Any
+
+from kanata.constants import LOGGER_NAME
+from .ilogger import ILogger
+
+class StructlogLogger(ILogger):
+    """A logger that forwards the events to [structlog](https://github.com/hynek/structlog).
+
+    structlog is an optional dependency of the framework, hence
+    it must be installed separately to use this logger.
+    """
+
+    def __init__(self, logger: Any | None = None, is_debug_enabled: bool | None = None) -> None:
+        """Initializes a new instance.
+
+        :param logger: The structlog logger to forward the events to, defaults to None.
+            If None, the logger is retrieved from structlog by the name of the framework.
+        :type logger: Any | None, optional
+        :param is_debug_enabled: Whether debug events are forwarded, defaults to None.
+            If None, it's derived from the level of the logger on the first use,
+            hence structlog should be configured before resolving anything.
+        :type is_debug_enabled: bool | None, optional
+        """
+
+        if logger is None:
+            import structlog # pylint: disable=import-outside-toplevel
+            logger = structlog.get_logger(logger_name=LOGGER_NAME)
+
+        self.__logger: Any = logger
+        self.__is_debug_enabled = is_debug_enabled
+
+    @property
+    def is_debug_enabled(self) -> bool:
+        if (is_debug_enabled := self.__is_debug_enabled) is None:
+            # Checked once, since binding lazy structlog loggers on each check is expensive.
+            self.__is_debug_enabled = is_debug_enabled = self.__is_debug_level_enabled()
+        return is_debug_enabled
+
+    def debug(self, event: str, **kwargs: Any) -> None:
+        self.__logger.debug(event, **kwargs)
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        self.__logger.warning(event, **kwargs)
+
+    def __is_debug_level_enabled(self) -> bool:
+        logger = self.__logger
+        # Standard library loggers, including the ones wrapped by structlog.stdlib.
+        if hasattr(logger, "isEnabledFor"):
+            return logger.isEnabledFor(logging.DEBUG)
+        if not hasattr(logger, "bind"):
+            return True
+
+        import structlog # pylint: disable=import-outside-toplevel
+
+        # The filtering bound loggers of structlog are distinct cached classes
+        # per minimum level, and binding a lazy logger reveals its actual class.
+        return type(logger.bind()) not in {
+            structlog.make_filtering_bound_logger(level)
+            for level in (logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+        }
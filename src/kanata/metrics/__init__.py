@@ -0,0 +1,26 @@
+"""Metrics of the operations of the framework."""
+
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .counter import Counter
+    from .counter_snapshot import CounterSnapshot
+    from .gauge_snapshot import GaugeSnapshot
+    from .histogram import Histogram
+    from .histogram_snapshot import HistogramSnapshot
+    from .metrics_registry import DEFAULT_DURATION_BOUNDS_NS, MetricsRegistry
+    from .metrics_snapshot import MetricsSnapshot
+    from .slow_construction import SlowConstruction
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "counter": ("Counter",),
+    "counter_snapshot": ("CounterSnapshot",),
+    "gauge_snapshot": ("GaugeSnapshot",),
+    "histogram": ("Histogram",),
+    "histogram_snapshot": ("HistogramSnapshot",),
+    "metrics_registry": ("DEFAULT_DURATION_BOUNDS_NS", "MetricsRegistry"),
+    "metrics_snapshot": ("MetricsSnapshot",),
+    "slow_construction": ("SlowConstruction",)
+})
@@ -0,0 +1,50 @@
+import threading
+
+class Counter:
+    """A thread-safe, monotonically increasing metric.
+
+    Counters are meant to be retrieved from a registry once and kept by their users,
+    so that updating them doesn't involve any lookups.
+    """
+
+    def __init__(self, name: str, labels: tuple[tuple[str, str], ...] = ()) -> None:
+        """Initializes a new instance.
+
+        :param name: The name of the metric.
+        :type name: str
+        :param labels: The labels of the metric, as name-value pairs, defaults to ().
+        :type labels: tuple[tuple[str, str], ...], optional
+        """
+
+        self.__name = name
+        self.__labels = labels
+        self.__lock = threading.Lock()
+        self.__value = 0
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the metric."""
+
+        return self.__name
+
+    @property
+    def labels(self) -> tuple[tuple[str, str], ...]:
+        """Gets the labels of the metric, as name-value pairs."""
+
+        return self.__labels
+
+    @property
+    def value(self) -> int:
+        """Gets the current value of the counter."""
+
+        return self.__value
+
+    def increment(self, amount: int = 1) -> None:
+        """Increments the counter by the specified amount.
+
+        :param amount: The amount to add, defaults to 1.
+        :type amount: int, optional
+        """
+
+        with self.__lock:
+            self.__value += amount
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class CounterSnapshot:
+    """A point-in-time view of a counter."""
+
+    name: str
+    """The name of the metric."""
+
+    labels: tuple[tuple[str, str], ...]
+    """The labels of the metric, as name-value pairs."""
+
+    value: int
+    """The value of the counter."""
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class GaugeSnapshot:
+    """A point-in-time view of a gauge."""
+
+    name: str
+    """The name of the metric."""
+
+    labels: tuple[tuple[str, str], ...]
+    """The labels of the metric, as name-value pairs."""
+
+    value: float
+    """The observed value of the gauge."""
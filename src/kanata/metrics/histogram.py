@@ -0,0 +1,78 @@
+import bisect
+import threading
+
+class Histogram:
+    """A thread-safe metric that counts the recorded values in buckets,
+    such as the durations of the constructions of an injectable.
+
+    Histograms are meant to be retrieved from a registry once and kept by their users,
+    so that updating them doesn't involve any lookups.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        bounds: tuple[int, ...],
+        labels: tuple[tuple[str, str], ...] = ()
+    ) -> None:
+        """Initializes a new instance.
+
+        :param name: The name of the metric.
+        :type name: str
+        :param bounds: The inclusive upper bounds of the buckets, in ascending order.
+            Values greater than the last bound are counted in an additional bucket.
+        :type bounds: tuple[int, ...]
+        :param labels: The labels of the metric, as name-value pairs, defaults to ().
+        :type labels: tuple[tuple[str, str], ...], optional
+        """
+
+        self.__name = name
+        self.__bounds = bounds
+        self.__labels = labels
+        self.__lock = threading.Lock()
+        self.__bucket_counts = [0] * (len(bounds) + 1)
+        self.__count = 0
+        self.__sum = 0
+        self.__max = 0
+
+    @property
+    def name(self) -> str:
+        """Gets the name of the metric."""
+
+        return self.__name
+
+    @property
+    def labels(self) -> tuple[tuple[str, str], ...]:
+        """Gets the labels of the metric, as name-value pairs."""
+
+        return self.__labels
+
+    @property
+    def bounds(self) -> tuple[int, ...]:
+        """Gets the inclusive upper bounds of the buckets, in ascending order."""
+
+        return self.__bounds
+
+    def record(self, value: int) -> None:
+        """Records the specified value.
+
+        :param value: The value to be recorded.
+        :type value: int
+        """
+
+        index = bisect.bisect_left(self.__bounds, value)
+        with self.__lock:
+            self.__bucket_counts[index] += 1
+            self.__count += 1
+            self.__sum += value
+            self.__max = max(self.__max, value)
+
+    def get_values(self) -> tuple[tuple[int, ...], int, int, int]:
+        """Gets a consistent view of the values recorded so far.
+
+        :return: The counts of the buckets, the number, the sum and the maximum of the values.
+        :rtype: tuple[tuple[int, ...], int, int, int]
+        """
+
+        with self.__lock:
+            return tuple(self.__bucket_counts), self.__count, self.__sum, self.__max
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class HistogramSnapshot:
+    """A point-in-time view of a histogram."""
+
+    name: str
+    """The name of the metric."""
+
+    labels: tuple[tuple[str, str], ...]
+    """The labels of the metric, as name-value pairs."""
+
+    bounds: tuple[int, ...]
+    """The inclusive upper bounds of the buckets, in ascending order."""
+
+    bucket_counts: tuple[int, ...]
+    """The number of values in each bucket. The last bucket counts
+    the values that are greater than the last bound.
+    """
+
+    count: int
+    """The number of recorded values."""
+
+    sum: int
+    """The sum of the recorded values."""
+
+    max: int
+    """The greatest recorded value."""
@@ -0,0 +1,225 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+from kanata.exceptions import ArgumentException
+from kanata.utils import get_type_name
+from .counter import Counter
+from .counter_snapshot import CounterSnapshot
+from .gauge_snapshot import GaugeSnapshot
+from .histogram import Histogram
+from .histogram_snapshot import HistogramSnapshot
+from .metrics_snapshot import MetricsSnapshot
+from .slow_construction import SlowConstruction
+
+DEFAULT_DURATION_BOUNDS_NS: tuple[int, ...] = (
+    1_000, 5_000, 10_000, 50_000, 100_000, 500_000,
+    1_000_000, 5_000_000, 10_000_000, 50_000_000, 100_000_000, 500_000_000, 1_000_000_000
+)
+"""The default upper bounds of the buckets of the histograms of durations, in nanoseconds."""
+
+_MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+class MetricsRegistry:
+    """A thread-safe registry of the metrics of the framework,
+    from which snapshots can be taken to be exported to any monitoring backend.
+
+    The metrics are created on their first retrieval and are meant to be kept
+    by their users, so that updating them involves neither lookups nor allocations.
+    """
+
+    def __init__(
+        self,
+        slow_construction_threshold_ns: int | None = None,
+        max_slow_construction_count: int = 100,
+        duration_bounds_ns: tuple[int, ...] = DEFAULT_DURATION_BOUNDS_NS
+    ) -> None:
+        """Initializes a new instance.
+
+        :param slow_construction_threshold_ns: The duration above which a construction
+            is recorded as a slow construction, in nanoseconds, defaults to None.
+            If None, slow constructions aren't recorded.
+        :type slow_construction_threshold_ns: int | None, optional
+        :param max_slow_construction_count: The maximum number of the most recent
+            slow constructions kept by the registry, defaults to 100.
+        :type max_slow_construction_count: int, optional
+        :param duration_bounds_ns: The upper bounds of the buckets of the histograms
+            of durations, in nanoseconds, defaults to DEFAULT_DURATION_BOUNDS_NS.
+        :type duration_bounds_ns: tuple[int, ...], optional
+        :raises ArgumentException: Raised when the bounds aren't in ascending order.
+        """
+
+        if list(duration_bounds_ns) != sorted(set(duration_bounds_ns)):
+            raise ArgumentException(
+                "duration_bounds_ns",
+                duration_bounds_ns,
+                "The bounds must be unique and in ascending order."
+            )
+
+        self.__slow_construction_threshold_ns = slow_construction_threshold_ns
+        self.__duration_bounds_ns = duration_bounds_ns
+        self.__lock = threading.Lock()
+        self.__counters = dict[_MetricKey, Counter]()
+        self.__histograms = dict[_MetricKey, Histogram]()
+        self.__gauges = dict[_MetricKey, list[Callable[[], float | None]]]()
+        self.__construction_histograms = dict[type, Histogram]()
+        self.__slow_constructions = deque[SlowConstruction](maxlen=max_slow_construction_count)
+
+    def get_counter(self, name: str, **labels: str) -> Counter:
+        """Gets the counter with the specified name and labels, creating it if necessary.
+
+        :param name: The name of the metric.
+        :type name: str
+        :return: The counter with the specified name and labels.
+        :rtype: Counter
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+        if counter := self.__counters.get(key):
+            return counter
+
+        with self.__lock:
+            if not (counter := self.__counters.get(key)):
+                self.__counters[key] = counter = Counter(name, key[1])
+
+        return counter
+
+    def get_histogram(self, name: str, **labels: str) -> Histogram:
+        """Gets the histogram of durations with the specified name and labels,
+        creating it if necessary.
+
+        :param name: The name of the metric.
+        :type name: str
+        :return: The histogram with the specified name and labels.
+        :rtype: Histogram
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+        if histogram := self.__histograms.get(key):
+            return histogram
+
+        with self.__lock:
+            if not (histogram := self.__histograms.get(key)):
+                self.__histograms[key] = histogram = Histogram(
+                    name,
+                    self.__duration_bounds_ns,
+                    key[1]
+                )
+
+        return histogram
+
+    def add_gauge(self, name: str, observer: Callable[[], float | None], **labels: str) -> None:
+        """Adds an observer of the gauge with the specified name and labels.
+
+        The observers are called only when a snapshot is taken, and the values
+        of the observers of the same gauge are summed, such as the numbers of instances
+        of multiple lifetime scopes. Observers that return None are removed,
+        such as the ones whose observed objects have been garbage collected.
+
+        :param name: The name of the metric.
+        :type name: str
+        :param observer: A callable that returns the current value of the gauge.
+        :type observer: Callable[[], float | None]
+        """
+
+        key = (name, tuple(sorted(labels.items())))
+        with self.__lock:
+            self.__gauges.setdefault(key, []).append(observer)
+
+    def record_construction(self, injectable_type: type, duration_ns: int) -> None:
+        """Records a construction of the specified injectable.
+
+        :param injectable_type: The type of the constructed injectable.
+        :type injectable_type: type
+        :param duration_ns: The duration of the construction, in nanoseconds.
+        :type duration_ns: int
+        """
+
+        if not (histogram := self.__construction_histograms.get(injectable_type)):
+            histogram = self.get_histogram(
+                "kanata_construction_duration_ns",
+                injectable=get_type_name(injectable_type)
+            )
+            with self.__lock:
+                histogram = self.__construction_histograms.setdefault(injectable_type, histogram)
+
+        histogram.record(duration_ns)
+        if (
+            self.__slow_construction_threshold_ns is not None
+            and duration_ns > self.__slow_construction_threshold_ns
+        ):
+            # TODO https://github.com/PyCQA/pylint/issues/6550
+            slow_construction = SlowConstruction( # pylint: disable=unexpected-keyword-arg
+                injectable_type=injectable_type,
+                duration_ns=duration_ns,
+                timestamp=time.time()
+            )
+            with self.__lock:
+                self.__slow_constructions.append(slow_construction)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Gets a view of the metrics recorded so far.
+
+        Each metric is consistent in itself, but the metrics
+        may be updated concurrently while the snapshot is taken.
+
+        :return: The metrics recorded so far.
+        :rtype: MetricsSnapshot
+        """
+
+        with self.__lock:
+            counters = tuple(self.__counters.values())
+            histograms = tuple(self.__histograms.values())
+            gauges = tuple((key, tuple(observers)) for key, observers in self.__gauges.items())
+            slow_constructions = tuple(self.__slow_constructions)
+
+        histogram_snapshots = []
+        for histogram in histograms:
+            bucket_counts, count, total, maximum = histogram.get_values()
+            # TODO https://github.com/PyCQA/pylint/issues/6550
+            histogram_snapshots.append(HistogramSnapshot( # pylint: disable=unexpected-keyword-arg
+                name=histogram.name,
+                labels=histogram.labels,
+                bounds=histogram.bounds,
+                bucket_counts=bucket_counts,
+                count=count,
+                sum=total,
+                max=maximum
+            ))
+
+        return MetricsSnapshot( # pylint: disable=unexpected-keyword-arg
+            counters=tuple(
+                CounterSnapshot( # pylint: disable=unexpected-keyword-arg
+                    name=counter.name,
+                    labels=counter.labels,
+                    value=counter.value
+                )
+                for counter in counters
+            ),
+            gauges=tuple(
+                GaugeSnapshot( # pylint: disable=unexpected-keyword-arg
+                    name=name,
+                    labels=labels,
+                    value=self.__observe_gauge((name, labels), observers)
+                )
+                for (name, labels), observers in gauges
+            ),
+            histograms=tuple(histogram_snapshots),
+            slow_constructions=slow_constructions
+        )
+
+    def __observe_gauge(
+        self,
+        key: _MetricKey,
+        observers: tuple[Callable[[], float | None], ...]
+    ) -> float:
+        value = 0.0
+        for observer in observers:
+            if (observed_value := observer()) is None:
+                with self.__lock:
+                    self.__gauges[key].remove(observer)
+                continue
+            value += observed_value
+
+        return value
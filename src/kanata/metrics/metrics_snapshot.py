@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+from .counter_snapshot import CounterSnapshot
+from .gauge_snapshot import GaugeSnapshot
+from .histogram_snapshot import HistogramSnapshot
+from .slow_construction import SlowConstruction
+
+@dataclass(frozen=True, kw_only=True)
+class MetricsSnapshot:
+    """A point-in-time view of the metrics of a registry."""
+
+    counters: tuple[CounterSnapshot, ...]
+    """The counters of the registry."""
+
+    gauges: tuple[GaugeSnapshot, ...]
+    """The observed gauges of the registry."""
+
+    histograms: tuple[HistogramSnapshot, ...]
+    """The histograms of the registry."""
+
+    slow_constructions: tuple[SlowConstruction, ...]
+    """The most recent slow constructions, in the order of their occurrence."""
+
+    def get_counter_value(self, name: str, **labels: str) -> int:
+        """Gets the value of the counter with the specified name and labels.
+
+        :param name: The name of the metric.
+        :type name: str
+        :return: The value of the counter, or zero if there is no such counter.
+        :rtype: int
+        """
+
+        key = tuple(sorted(labels.items()))
+        return next(
+            (
+                counter.value for counter in self.counters
+                if counter.name == name and counter.labels == key
+            ),
+            0
+        )
+
+    def get_gauge_value(self, name: str, **labels: str) -> float:
+        """Gets the observed value of the gauge with the specified name and labels.
+
+        :param name: The name of the metric.
+        :type name: str
+        :return: The value of the gauge, or zero if there is no such gauge.
+        :rtype: float
+        """
+
+        key = tuple(sorted(labels.items()))
+        return next(
+            (
+                gauge.value for gauge in self.gauges
+                if gauge.name == name and gauge.labels == key
+            ),
+            0.0
+        )
+
+    def get_histogram(self, name: str, **labels: str) -> HistogramSnapshot | None:
+        """Gets the histogram with the specified name and labels.
+
+        :param name: The name of the metric.
+        :type name: str
+        :return: If exists, the histogram with the specified name and labels.
+        :rtype: HistogramSnapshot | None
+        """
+
+        key = tuple(sorted(labels.items()))
+        return next(
+            (
+                histogram for histogram in self.histograms
+                if histogram.name == name and histogram.labels == key
+            ),
+            None
+        )
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class SlowConstruction:
+    """Describes a construction of an injectable that took longer than the configured threshold."""
+
+    injectable_type: type
+    """The type of the constructed injectable."""
+
+    duration_ns: int
+    """The duration of the construction, in nanoseconds."""
+
+    timestamp: float
+    """The time of the end of the construction, in seconds since the epoch."""
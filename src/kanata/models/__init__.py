@@ -1,10 +1,72 @@
 """Models."""
 
-from .closed_generic_type_id import ClosedGenericTypeId
-from .closed_generic_type_info import ClosedGenericTypeInfo
-from .iinstance_collection import IInstanceCollection
-from .injectable_instance_registration import InjectableInstanceRegistration
-from .injectable_registration import InjectableRegistration
-from .injectable_scope_type import InjectableScopeType
-from .injectable_type_registration import InjectableTypeRegistration
-from .instance_collection import InstanceCollection
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .ambient_instance_collection import AmbientInstanceCollection
+    from .call_plan import CallPlan
+    from .closed_generic_type_id import ClosedGenericTypeId
+    from .closed_generic_type_info import ClosedGenericTypeInfo
+    from .compiled_container import CompiledContainer
+    from .compiled_registration import CompiledRegistration
+    from .compiled_resolution_plan import CompiledResolutionPlan
+    from .compiled_resolution_step import CompiledResolutionStep
+    from .composite_instance_collection import CompositeInstanceCollection
+    from .context_instance_collection import ContextInstanceCollection
+    from .dependency_kind import DependencyKind
+    from .dependency_report import DependencyReport
+    from .dependent_contract import DependentContract
+    from .discovery_manifest import DiscoveryManifest
+    from .excluding_instance_collection import ExcludingInstanceCollection
+    from .iasync_disposable import IAsyncDisposable
+    from .idisposable import IDisposable
+    from .ifork_aware import IForkAware
+    from .iinstance_collection import IInstanceCollection
+    from .injectable_analysis import InjectableAnalysis
+    from .injectable_instance_registration import InjectableInstanceRegistration
+    from .injectable_registration import InjectableRegistration
+    from .injectable_scope_type import InjectableScopeType
+    from .injectable_type_registration import InjectableTypeRegistration
+    from .injected_parameter import InjectedParameter
+    from .instance_collection import InstanceCollection
+    from .manifest_registration import ManifestRegistration
+    from .manifest_source_file import ManifestSourceFile
+    from .resolution_plan import ResolutionPlan
+    from .resolution_step import ResolutionStep
+    from .thread_instance_collection import ThreadInstanceCollection
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "ambient_instance_collection": ("AmbientInstanceCollection",),
+    "call_plan": ("CallPlan",),
+    "closed_generic_type_id": ("ClosedGenericTypeId",),
+    "closed_generic_type_info": ("ClosedGenericTypeInfo",),
+    "compiled_container": ("CompiledContainer",),
+    "compiled_registration": ("CompiledRegistration",),
+    "compiled_resolution_plan": ("CompiledResolutionPlan",),
+    "compiled_resolution_step": ("CompiledResolutionStep",),
+    "composite_instance_collection": ("CompositeInstanceCollection",),
+    "context_instance_collection": ("ContextInstanceCollection",),
+    "dependency_kind": ("DependencyKind",),
+    "dependency_report": ("DependencyReport",),
+    "dependent_contract": ("DependentContract",),
+    "discovery_manifest": ("DiscoveryManifest",),
+    "excluding_instance_collection": ("ExcludingInstanceCollection",),
+    "iasync_disposable": ("IAsyncDisposable",),
+    "idisposable": ("IDisposable",),
+    "ifork_aware": ("IForkAware",),
+    "iinstance_collection": ("IInstanceCollection",),
+    "injectable_analysis": ("InjectableAnalysis",),
+    "injectable_instance_registration": ("InjectableInstanceRegistration",),
+    "injectable_registration": ("InjectableRegistration",),
+    "injectable_scope_type": ("InjectableScopeType",),
+    "injectable_type_registration": ("InjectableTypeRegistration",),
+    "injected_parameter": ("InjectedParameter",),
+    "instance_collection": ("InstanceCollection",),
+    "manifest_registration": ("ManifestRegistration",),
+    "manifest_source_file": ("ManifestSourceFile",),
+    "resolution_plan": ("ResolutionPlan",),
+    "resolution_step": ("ResolutionStep",),
+    "thread_instance_collection": ("ThreadInstanceCollection",)
+})
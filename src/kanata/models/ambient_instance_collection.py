@@ -0,0 +1,117 @@
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator
+from typing import Any
+
+from .iinstance_collection import IInstanceCollection
+from .injectable_scope_type import InjectableScopeType
+from .instance_collection import InstanceCollection
+
+class AmbientInstanceCollection(ABC, IInstanceCollection):
+    """Abstract base class for a container of resolved instances
+    that are bound to an ambient context, such as the current thread.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__finalizers = dict[int, Callable[[], Any]]()
+        self.__bound_instances = dict[int, InstanceCollection]()
+
+    def get_instances_by_injectable(
+        self,
+        injectable_type: type,
+        scope_type: InjectableScopeType | None = None
+    ) -> Generator[Any, None, None]:
+        if (instances := self._get_bound_instances()) is None:
+            return
+
+        yield from instances.get_instances_by_injectable(injectable_type, scope_type)
+
+    def add_instance(
+        self,
+        scope_type: InjectableScopeType,
+        injectable_type: type,
+        instance: Any
+    ) -> None:
+        """Adds the specified instance to the collection bound to the current context.
+
+        :param scope_type: The scope of the injectable.
+        :type scope_type: InjectableScopeType
+        :param injectable_type: The type of the injectable.
+        :type injectable_type: type
+        :param instance: The injectable instance to be added.
+        :type instance: Any
+        """
+
+        if (instances := self._get_bound_instances()) is None:
+            instances = InstanceCollection()
+            self._bind_instances(instances)
+        instances.add_instance(scope_type, injectable_type, instance)
+
+    def get_instance_count(self) -> int:
+        """Gets the number of instances bound to any of the still alive contexts.
+
+        :return: The number of instances.
+        :rtype: int
+        """
+
+        with self.__lock:
+            bound_instances = tuple(self.__bound_instances.values())
+        return sum(instances.get_instance_count() for instances in bound_instances)
+
+    def dispose(self) -> None:
+        """Disposes of the instances bound to any of the still alive contexts."""
+
+        with self.__lock:
+            finalizers = tuple(self.__finalizers.values())
+            self.__finalizers.clear()
+            self.__bound_instances.clear()
+        for finalizer in finalizers:
+            finalizer()
+
+    @abstractmethod
+    def _get_bound_instances(self) -> InstanceCollection | None:
+        """Gets the instances bound to the current context.
+
+        :return: If exists, the collection bound to the current context.
+        :rtype: InstanceCollection | None
+        """
+
+    @abstractmethod
+    def _bind_instances(self, instances: InstanceCollection) -> None:
+        """Binds the specified collection to the current context.
+
+        Implementations are expected to call :meth:`_track_binding`
+        to have the instances disposed of when the context ends.
+
+        :param instances: The collection to be bound.
+        :type instances: InstanceCollection
+        """
+
+    def _track_binding(self, binding: object, instances: InstanceCollection) -> Callable[[], Any]:
+        """Tracks the specified binding so that its instances are disposed of
+        either when the binding is garbage collected or when the returned
+        callable is invoked, whichever happens first.
+
+        :param binding: The object that binds the instances to the context.
+        :type binding: object
+        :param instances: The collection bound to the context.
+        :type instances: InstanceCollection
+        :return: A callable that disposes of the instances. Invoking it more than once is a no-op.
+        :rtype: Callable[[], Any]
+        """
+
+        # The finalizer mustn't reference the binding itself,
+        # otherwise it would keep the binding alive forever.
+        finalizer = weakref.finalize(binding, self.__release, id(instances), instances)
+        with self.__lock:
+            self.__finalizers[id(instances)] = finalizer
+            self.__bound_instances[id(instances)] = instances
+        return finalizer
+
+    def __release(self, key: int, instances: InstanceCollection) -> None:
+        with self.__lock:
+            self.__finalizers.pop(key, None)
+            self.__bound_instances.pop(key, None)
+        instances.dispose()
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from .injected_parameter import InjectedParameter
+
+@dataclass(frozen=True, kw_only=True)
+class CallPlan:
+    """Describes how to fill in the parameters of a callable from a lifetime scope."""
+
+    parameters: tuple[InjectedParameter, ...]
+    """The parameters that may be filled in, in the order of the signature."""
+
+    contracts: frozenset[type]
+    """The contracts the plan depends on."""
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from .compiled_registration import CompiledRegistration
+from .compiled_resolution_plan import CompiledResolutionPlan
+
+@dataclass(frozen=True, kw_only=True)
+class CompiledContainer:
+    """A picklable form of a catalog and of its resolution plans,
+    from which a lifetime scope can be restored without discovery and planning,
+    such as in the worker processes of a process pool.
+    """
+
+    registrations: tuple[CompiledRegistration, ...]
+    """The registrations of the catalog."""
+
+    closed_generic_types: tuple[tuple[int, str], ...]
+    """The closed generic types used by the plans, each described by the index
+    of the registration of its origin and by the name of its generic type argument.
+    """
+
+    plans: tuple[CompiledResolutionPlan, ...]
+    """The resolution plans of the catalog."""
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+from typing import Any
+
+from .injectable_scope_type import InjectableScopeType
+
+@dataclass(frozen=True, kw_only=True)
+class CompiledRegistration:
+    """A picklable form of an injectable registration
+    that refers to the types by their qualified names.
+    """
+
+    injectable_type: str | None
+    """The name of the type of the injectable, or None for an instance registration."""
+
+    injectable_instance: Any = None
+    """The registered instance, in case of an instance registration."""
+
+    contract_types: tuple[str, ...]
+    """The names of the contracts the registration is associated to."""
+
+    scope: InjectableScopeType = InjectableScopeType.TRANSIENT
+    """The lifetime scope type of the created instances."""
+
+    is_generic: bool = False
+    """Whether the injectable is a generic type."""
+
+    time_to_live: float | None = None
+    """The number of seconds after which the instance expires, if any."""
+
+    refresh_in_background: bool = True
+    """Whether an expired instance is rebuilt in the background."""
+
+    is_external: bool = False
+    """Whether the instances are added to lifetime scopes explicitly."""
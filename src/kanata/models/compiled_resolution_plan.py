@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from .compiled_resolution_step import CompiledResolutionStep
+
+@dataclass(frozen=True, kw_only=True)
+class CompiledResolutionPlan:
+    """A picklable form of a resolution plan
+    that refers to the types by their qualified names.
+    """
+
+    requested_types: tuple[str | int, ...]
+    """The names of the types that have been requested to be resolved or,
+    for generic injectables, the indexes of the closed generic types.
+    """
+
+    injectable_types: tuple[str | int, ...]
+    """The names of the injectable types associated to the requested types or,
+    for generic injectables, the indexes of the closed generic types.
+    """
+
+    steps: tuple[CompiledResolutionStep, ...]
+    """The steps to be executed in order."""
+
+    contracts: tuple[str, ...]
+    """The names of the contracts the plan depends on."""
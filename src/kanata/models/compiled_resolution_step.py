@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+from .injectable_scope_type import InjectableScopeType
+
+class CompiledResolutionStep(NamedTuple):
+    """A named tuple that describes a picklable form of a resolution step."""
+
+    injectable_type: str | int
+    """The name of the type of the injectable to be resolved or, for generic injectables,
+    the index of the closed generic type within the compiled container.
+    """
+
+    registration: int
+    """The index of the registration of the injectable within the compiled container."""
+
+    scope_type: InjectableScopeType
+    """The lifetime scope type of the injectable."""
+
+    is_requested: bool
+    """Whether the injectable has been requested explicitly."""
@@ -0,0 +1,61 @@
+from collections.abc import Generator
+from typing import Any
+
+from .ambient_instance_collection import AmbientInstanceCollection
+from .iinstance_collection import IInstanceCollection
+from .injectable_scope_type import InjectableScopeType
+from .instance_collection import InstanceCollection
+
+class CompositeInstanceCollection(IInstanceCollection):
+    """A container for resolved instances that delegates
+    to a separate collection for each scope type.
+    """
+
+    def __init__(
+        self,
+        collections: dict[InjectableScopeType, InstanceCollection | AmbientInstanceCollection]
+    ) -> None:
+        """Initializes a new instance.
+
+        :param collections: The collections to delegate to by scope type.
+        :type collections: dict[InjectableScopeType, InstanceCollection | AmbientInstanceCollection]
+        """
+
+        self.__collections = collections
+
+    def get_instances_by_injectable(
+        self,
+        injectable_type: type,
+        scope_type: InjectableScopeType | None = None
+    ) -> Generator[Any, None, None]:
+        if scope_type is None:
+            for current_scope_type, collection in self.__collections.items():
+                yield from collection.get_instances_by_injectable(
+                    injectable_type,
+                    current_scope_type
+                )
+            return
+
+        if not (collection := self.__collections.get(scope_type)):
+            return
+
+        yield from collection.get_instances_by_injectable(injectable_type, scope_type)
+
+    def add_instance(
+        self,
+        scope_type: InjectableScopeType,
+        injectable_type: type,
+        instance: Any
+    ) -> None:
+        """Adds the specified instance to the collection associated to
+        the specified scope type.
+
+        :param scope_type: The scope of the injectable.
+        :type scope_type: InjectableScopeType
+        :param injectable_type: The type of the injectable.
+        :type injectable_type: type
+        :param instance: The injectable instance to be added.
+        :type instance: Any
+        """
+
+        self.__collections[scope_type].add_instance(scope_type, injectable_type, instance)
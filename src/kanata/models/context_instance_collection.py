@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import sys
+import weakref
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from .ambient_instance_collection import AmbientInstanceCollection
+from .instance_collection import InstanceCollection
+
+if TYPE_CHECKING:
+    import asyncio
+
+class _ContextBinding:
+    __slots__ = ("instances", "owner", "__weakref__")
+
+    def __init__(
+        self,
+        instances: InstanceCollection,
+        owner: weakref.ReferenceType[asyncio.Task] | None
+    ) -> None:
+        self.instances = instances
+        self.owner = owner
+
+class ContextInstanceCollection(AmbientInstanceCollection):
+    """A container for resolved instances that are bound to the current asyncio task
+    or, outside of tasks, to the current :class:`contextvars.Context`.
+
+    The instances are disposed of when the task they are bound to is done,
+    or when the context they are bound to is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__binding = ContextVar[_ContextBinding | None](
+            f"kanata_context_instances_{id(self)}",
+            default=None
+        )
+
+    def _get_bound_instances(self) -> InstanceCollection | None:
+        if (binding := self.__binding.get()) is None:
+            return None
+
+        # Tasks inherit a copy of the context of their creator,
+        # hence the binding must be checked against its owner.
+        owner = binding.owner() if binding.owner is not None else None
+        if owner is not ContextInstanceCollection.__get_current_task():
+            return None
+
+        return binding.instances
+
+    def _bind_instances(self, instances: InstanceCollection) -> None:
+        task = ContextInstanceCollection.__get_current_task()
+        binding = _ContextBinding(instances, weakref.ref(task) if task is not None else None)
+        finalizer = self._track_binding(binding, instances)
+        if task is not None:
+            task.add_done_callback(lambda _: finalizer())
+        self.__binding.set(binding)
+
+    @staticmethod
+    def __get_current_task() -> asyncio.Task | None:
+        # There cannot be a running task until asyncio is imported by someone else,
+        # hence it isn't imported for the applications that don't use it.
+        if (asyncio_module := sys.modules.get("asyncio")) is None:
+            return None
+
+        try:
+            return asyncio_module.current_task()
+        except RuntimeError:
+            return None
@@ -0,0 +1,26 @@
+from enum import IntEnum
+
+class DependencyKind(IntEnum):
+    """Defines the ways a dependency on a contract can be injected."""
+
+    INSTANCE = 0
+    """A single instance associated to the contract is injected."""
+
+    TUPLE = 1
+    """A tuple of all the instances associated to the contract is injected."""
+
+    PROVIDER = 2
+    """A provider is injected that resolves an instance
+    associated to the contract on each request.
+    """
+
+    FACTORY = 3
+    """A factory is injected that constructs a new instance
+    of the injectable associated to the contract on each call,
+    using the arguments of the call for the rest of the parameters.
+    """
+
+    OPTIONAL = 4
+    """A single instance associated to the contract is injected,
+    or None, if there is no injectable associated to the contract.
+    """
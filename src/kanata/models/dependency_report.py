@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from .injectable_analysis import InjectableAnalysis
+
+@dataclass(frozen=True, kw_only=True)
+class DependencyReport:
+    """Describes the costs of the dependency graph of a catalog."""
+
+    injectables: tuple[InjectableAnalysis, ...]
+    """The analyses of the injectables, ordered by the sizes of their closures
+    in descending order, then by their names.
+    """
+
+    critical_path: tuple[str, ...]
+    """The most expensive chain of constructions of the whole catalog,
+    which bounds the time of a parallel startup.
+    """
+
+    critical_path_time_ns: float | None
+    """The total construction time of the injectables on the critical path,
+    in nanoseconds, or None without timing data.
+    """
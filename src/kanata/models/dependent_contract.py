@@ -0,0 +1,12 @@
+from typing import NamedTuple
+
+from .dependency_kind import DependencyKind
+
+class DependentContract(NamedTuple):
+    """A named tuple that describes a dependency of an injectable on a contract."""
+
+    contract: type
+    """The type of the contract depended on."""
+
+    kind: DependencyKind
+    """The way the dependency is injected."""
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+from .manifest_source_file import ManifestSourceFile
+
+@dataclass(frozen=True, kw_only=True)
+class DiscoveryManifest:
+    """Describes the results of discovering the injectables of a package,
+    along with the fingerprints of the sources they have been discovered from.
+    """
+
+    module_name: str
+    """The name of the root module of the package."""
+
+    directories: dict[str, int]
+    """The times of the last modification of the directories of the package,
+    in nanoseconds, by which added and removed source files are detected.
+    """
+
+    source_files: tuple[ManifestSourceFile, ...]
+    """The source files of the package."""
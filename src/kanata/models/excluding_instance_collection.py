@@ -0,0 +1,32 @@
+from collections.abc import Generator
+from typing import Any
+
+from .iinstance_collection import IInstanceCollection
+from .injectable_scope_type import InjectableScopeType
+
+class ExcludingInstanceCollection(IInstanceCollection):
+    """A read-only view of a container for resolved instances
+    that hides the instances of a specific injectable.
+    """
+
+    def __init__(self, instances: IInstanceCollection, excluded_injectable_type: type) -> None:
+        """Initializes a new instance.
+
+        :param instances: The underlying container of resolved instances.
+        :type instances: IInstanceCollection
+        :param excluded_injectable_type: The injectable type whose instances are hidden.
+        :type excluded_injectable_type: type
+        """
+
+        self.__instances = instances
+        self.__excluded_injectable_type = excluded_injectable_type
+
+    def get_instances_by_injectable(
+        self,
+        injectable_type: type,
+        scope_type: InjectableScopeType | None = None
+    ) -> Generator[Any, None, None]:
+        if injectable_type is self.__excluded_injectable_type:
+            return
+
+        yield from self.__instances.get_instances_by_injectable(injectable_type, scope_type)
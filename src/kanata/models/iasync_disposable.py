@@ -0,0 +1,11 @@
+from typing import Protocol, runtime_checkable
+
+@runtime_checkable
+class IAsyncDisposable(Protocol):
+    """Interface for an object that holds resources
+    that need to be released explicitly and asynchronously.
+    """
+
+    async def dispose_async(self) -> None:
+        """Releases the resources held by the object."""
+        ...
@@ -0,0 +1,11 @@
+from typing import Protocol, runtime_checkable
+
+@runtime_checkable
+class IDisposable(Protocol):
+    """Interface for an object that holds resources
+    that need to be released explicitly.
+    """
+
+    def dispose(self) -> None:
+        """Releases the resources held by the object."""
+        ...
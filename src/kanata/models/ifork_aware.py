@@ -0,0 +1,12 @@
+from typing import Protocol, runtime_checkable
+
+@runtime_checkable
+class IForkAware(Protocol):
+    """Interface for an object that needs to reinitialize some of its state
+    in a child process forked from the process that constructed it,
+    such as the sockets it owns.
+    """
+
+    def after_fork(self) -> None:
+        """Reinitializes the state of the object in the forked child process."""
+        ...
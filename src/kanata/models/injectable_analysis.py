@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class InjectableAnalysis:
+    """Describes the cost of constructing an injectable along with its dependencies."""
+
+    name: str
+    """The qualified name of the injectable type."""
+
+    scope: str
+    """The name of the scope of the injectable."""
+
+    closure_size: int
+    """The number of injectables the injectable depends on, directly or transitively."""
+
+    depth: int
+    """The number of dependencies in the longest chain of dependencies of the injectable."""
+
+    fan_in: int
+    """The number of injectables that depend on the injectable directly."""
+
+    fan_out: int
+    """The number of injectables the injectable depends on directly."""
+
+    scope_counts: dict[str, int]
+    """The number of injectables in the closure, including the injectable itself,
+    keyed by the names of their scopes.
+    """
+
+    critical_path: tuple[str, ...]
+    """The names of the injectables on the most expensive chain of constructions,
+    starting with the injectable itself, or its longest chain without timing data.
+    """
+
+    critical_path_time_ns: float | None
+    """The total construction time of the injectables on the critical path,
+    in nanoseconds, or None without timing data.
+    """
@@ -20,3 +20,25 @@ class InjectableScopeType(IntEnum):
     meaning a new instance is created for each lifetime scope,
     even the children of a parent lifetime scope (contrary to singletons).
     """
+
+    CONTEXT = 3
+    """Marks the injectable as bound to the current execution context,
+    meaning a new instance is created for each asyncio task
+    (or :class:`contextvars.Context` outside of tasks)
+    and it is shared by all lifetime scopes of the same tree.
+    The instance is disposed of when the task ends.
+    """
+
+    THREAD = 4
+    """Marks the injectable as bound to the current thread,
+    meaning a new instance is created for each thread
+    and it is shared by all lifetime scopes of the same tree.
+    The instance is disposed of when the thread ends.
+    """
+
+    PER_RESOLVE = 5
+    """Marks the injectable as bound to a single resolution,
+    meaning a new instance is created for each request made to a lifetime scope
+    and it is shared by all the dependees within the resolved object graph.
+    The instance is released when the request completes.
+    """
@@ -22,3 +22,23 @@ class InjectableTypeRegistration(InjectableRegistration):
 
     scope: InjectableScopeType = InjectableScopeType.TRANSIENT
     """Gets or sets the lifetime scope type of the created instances."""
+
+    time_to_live: float | None = None
+    """Gets or sets the number of seconds after which the instance
+    of a singleton injectable expires and is rebuilt.
+
+    If None, the instance never expires. Only singletons may expire.
+    """
+
+    refresh_in_background: bool = True
+    """Gets or sets whether an expired instance is rebuilt in the background,
+    during which the stale instance is still returned to callers,
+    as opposed to rebuilding it on the resolving thread.
+    """
+
+    is_external: bool = False
+    """Gets or sets whether the instances are added to lifetime scopes explicitly,
+    such as the object of the request handled by a scope, instead of being constructed.
+
+    Only scoped injectables may be external.
+    """
@@ -0,0 +1,26 @@
+from typing import NamedTuple
+
+from .dependency_kind import DependencyKind
+
+class InjectedParameter(NamedTuple):
+    """A named tuple that describes a parameter of a callable
+    that may be filled in from a lifetime scope.
+    """
+
+    name: str
+    """The name of the parameter."""
+
+    position: int | None
+    """The position of the parameter, if it may be passed positionally."""
+
+    contract: type
+    """The type of the contract the parameter is annotated with."""
+
+    kind: DependencyKind
+    """The way the dependency is injected."""
+
+    injectable_types: tuple[type, ...]
+    """The types of the injectables associated to the contract."""
+
+    has_default: bool
+    """Whether the parameter has a default value."""
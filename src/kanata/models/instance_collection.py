@@ -1,6 +1,8 @@
 from collections.abc import Generator
 from typing import Any
 
+from .iasync_disposable import IAsyncDisposable
+from .idisposable import IDisposable
 from .iinstance_collection import IInstanceCollection
 from .injectable_scope_type import InjectableScopeType
 
@@ -9,6 +11,9 @@ class InstanceCollection(IInstanceCollection):
 
     def __init__(self) -> None:
         self.__instances = dict[InjectableScopeType, dict[type, set]]()
+        # Keyed by the identity of the instances to keep track of
+        # the order of construction, which is needed for disposal.
+        self.__instances_in_order = dict[int, Any]()
 
     def get_instances_by_injectable(
         self,
@@ -25,6 +30,24 @@ class InstanceCollection(IInstanceCollection):
 
         yield from injectables_by_contract.get(injectable_type, ())
 
+    def get_instances(self) -> tuple[Any, ...]:
+        """Gets all instances of the collection in the order of their addition.
+
+        :return: The instances of the collection.
+        :rtype: tuple[Any, ...]
+        """
+
+        return tuple(self.__instances_in_order.values())
+
+    def get_instance_count(self) -> int:
+        """Gets the number of instances of the collection.
+
+        :return: The number of instances.
+        :rtype: int
+        """
+
+        return len(self.__instances_in_order)
+
     def add_instance(
         self,
         scope_type: InjectableScopeType,
@@ -47,3 +70,93 @@ class InstanceCollection(IInstanceCollection):
         if not (instances := instances_by_scope.get(injectable_type)):
             instances_by_scope[injectable_type] = instances = set()
         instances.add(instance)
+        self.__instances_in_order.setdefault(id(instance), instance)
+
+    def replace_instances(
+        self,
+        scope_type: InjectableScopeType,
+        injectable_type: type,
+        instance: Any
+    ) -> tuple[Any, ...]:
+        """Replaces the instances associated to the specified injectable type and scope
+        with the specified instance in a single step, so that readers observe
+        either the previous instances or the new one, but never a mix of them.
+
+        The replaced instances are no longer disposed of along with the collection,
+        hence disposing of them is up to the caller.
+
+        :param scope_type: The scope of the injectable.
+        :type scope_type: InjectableScopeType
+        :param injectable_type: The type of the injectable.
+        :type injectable_type: type
+        :param instance: The injectable instance to be added.
+        :type instance: Any
+        :return: The replaced instances.
+        :rtype: tuple[Any, ...]
+        """
+
+        if not (instances_by_scope := self.__instances.get(scope_type)):
+            self.__instances[scope_type] = instances_by_scope = {}
+        replaced_instances = instances_by_scope.get(injectable_type, set())
+        instances_by_scope[injectable_type] = {instance}
+        for replaced_instance in replaced_instances:
+            self.__instances_in_order.pop(id(replaced_instance), None)
+        self.__instances_in_order.setdefault(id(instance), instance)
+
+        return tuple(replaced_instances)
+
+    def remove_instances(
+        self,
+        scope_type: InjectableScopeType,
+        injectable_type: type
+    ) -> tuple[Any, ...]:
+        """Removes the instances associated to the specified injectable type and scope
+        without disposing of them, hence disposing of them is up to the caller.
+
+        :param scope_type: The scope of the injectable.
+        :type scope_type: InjectableScopeType
+        :param injectable_type: The type of the injectable.
+        :type injectable_type: type
+        :return: The removed instances.
+        :rtype: tuple[Any, ...]
+        """
+
+        if not (instances_by_scope := self.__instances.get(scope_type)):
+            return ()
+
+        removed_instances = instances_by_scope.pop(injectable_type, set())
+        for removed_instance in removed_instances:
+            self.__instances_in_order.pop(id(removed_instance), None)
+
+        return tuple(removed_instances)
+
+    def dispose(self) -> None:
+        """Removes all instances from the collection and disposes of
+        the ones that are disposable, in reverse order of their addition.
+        """
+
+        instances = tuple(self.__instances_in_order.values())
+        self.__instances = {}
+        self.__instances_in_order = {}
+        for instance in reversed(instances):
+            # Checking the attribute is an order of magnitude faster
+            # than checking against the runtime-checkable protocol.
+            if dispose := getattr(instance, IDisposable.dispose.__name__, None):
+                dispose()
+
+    async def dispose_async(self) -> None:
+        """Removes all instances from the collection and disposes of
+        the ones that are disposable, in reverse order of their addition.
+
+        Asynchronously disposable instances are awaited, while
+        the rest of the disposable instances are disposed of as usual.
+        """
+
+        instances = tuple(self.__instances_in_order.values())
+        self.__instances = {}
+        self.__instances_in_order = {}
+        for instance in reversed(instances):
+            if dispose_async := getattr(instance, IAsyncDisposable.dispose_async.__name__, None):
+                await dispose_async()
+            elif dispose := getattr(instance, IDisposable.dispose.__name__, None):
+                dispose()
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from .injectable_scope_type import InjectableScopeType
+
+@dataclass(frozen=True, kw_only=True)
+class ManifestRegistration:
+    """Describes an injectable type registration recorded in a discovery manifest,
+    without referencing the type itself.
+    """
+
+    module_name: str
+    """The name of the module that declares the injectable."""
+
+    qualname: str
+    """The qualified name of the injectable within its module."""
+
+    contract_types: tuple[str, ...]
+    """The names of the contracts of the injectable."""
+
+    scope: InjectableScopeType
+    """The lifetime scope type of the created instances."""
+
+    is_generic: bool
+    """Whether the injectable is a generic type."""
+
+    time_to_live: float | None
+    """The number of seconds after which the instance expires, if any."""
+
+    refresh_in_background: bool
+    """Whether an expired instance is rebuilt in the background."""
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from .manifest_registration import ManifestRegistration
+
+@dataclass(frozen=True, kw_only=True)
+class ManifestSourceFile:
+    """Describes a source file recorded in a discovery manifest."""
+
+    path: str
+    """The path of the source file."""
+
+    module_name: str
+    """The name of the module loaded from the source file."""
+
+    modified_time: int
+    """The time of the last modification of the file, in nanoseconds."""
+
+    size: int
+    """The size of the file, in bytes."""
+
+    registrations: tuple[ManifestRegistration, ...]
+    """The registrations of the injectables declared in the module."""
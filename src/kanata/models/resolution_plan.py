@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from .resolution_step import ResolutionStep
+
+@dataclass(frozen=True, kw_only=True)
+class ResolutionPlan:
+    """Describes how to resolve a set of injectables along with all of their dependencies."""
+
+    requested_types: tuple[type, ...]
+    """The types that have been requested to be resolved, in the order of the request."""
+
+    injectable_types: tuple[type, ...]
+    """The injectable types associated to the requested types, in the order of the request."""
+
+    steps: tuple[ResolutionStep, ...]
+    """The steps to be executed in order.
+    Dependencies always precede their dependees.
+    """
+
+    contracts: frozenset[type]
+    """The contracts the plan depends on."""
@@ -0,0 +1,23 @@
+from typing import NamedTuple
+
+from .injectable_registration import InjectableRegistration
+from .injectable_scope_type import InjectableScopeType
+
+class ResolutionStep(NamedTuple):
+    """A named tuple that describes the resolution of a single injectable within a plan."""
+
+    injectable_type: type
+    """The type of the injectable to be resolved.
+    For generic injectables, this is the closed generic type.
+    """
+
+    registration: InjectableRegistration
+    """The registration of the injectable."""
+
+    scope_type: InjectableScopeType
+    """The lifetime scope type of the injectable."""
+
+    is_requested: bool
+    """Whether the injectable has been requested explicitly,
+    as opposed to being a dependency of a requested injectable.
+    """
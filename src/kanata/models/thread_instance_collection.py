@@ -0,0 +1,31 @@
+import threading
+
+from .ambient_instance_collection import AmbientInstanceCollection
+from .instance_collection import InstanceCollection
+
+class _ThreadBinding:
+    __slots__ = ("instances", "__weakref__")
+
+    def __init__(self, instances: InstanceCollection) -> None:
+        self.instances = instances
+
+class ThreadInstanceCollection(AmbientInstanceCollection):
+    """A container for resolved instances that are bound to the current thread.
+
+    The instances are disposed of when the thread they are bound to ends.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__local = threading.local()
+
+    def _get_bound_instances(self) -> InstanceCollection | None:
+        binding: _ThreadBinding | None = getattr(self.__local, "binding", None)
+        return binding.instances if binding is not None else None
+
+    def _bind_instances(self, instances: InstanceCollection) -> None:
+        # When the thread ends, its thread-local storage is released,
+        # which in turn triggers the finalizer of the binding.
+        binding = _ThreadBinding(instances)
+        self._track_binding(binding, instances)
+        self.__local.binding = binding
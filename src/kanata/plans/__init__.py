@@ -0,0 +1,12 @@
+"""Planning the resolution of injectables."""
+
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .resolution_planner import ResolutionPlanner
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "resolution_planner": ("ResolutionPlanner",)
+})
@@ -0,0 +1,747 @@
+from __future__ import annotations
+
+import inspect
+import sys
+import threading
+import types
+import weakref
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Iterable, Mapping, MutableMapping
+from typing import TYPE_CHECKING, get_args, get_origin
+
+from kanata.catalogs import (
+    IInjectableCatalog, MutableInjectableCatalog, OverlayInjectableCatalog
+)
+from kanata.exceptions import DependencyResolutionException
+from kanata.graphs import BidirectedGraph
+from kanata.graphs.sorting import topological_sort_many
+from kanata.loggers import get_logger
+from kanata.models import (
+    CallPlan, ClosedGenericTypeId, ClosedGenericTypeInfo, DependencyKind,
+    InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType,
+    InjectableTypeRegistration, InjectedParameter, ResolutionPlan, ResolutionStep
+)
+from kanata.utils import get_dependent_contract, get_dependent_contracts
+
+if TYPE_CHECKING:
+    from kanata.tracing import Tracer
+
+# The kinds of dependencies that are fulfilled even without any registrations.
+_FULFILLABLE_KINDS = frozenset((DependencyKind.TUPLE, DependencyKind.OPTIONAL))
+
+class ResolutionPlanner:
+    """Plans the resolution of injectables by building and sorting
+    their dependency graphs, and caches the resulting plans.
+
+    A planner is bound to a single catalog and may be shared
+    by any number of lifetime scopes that use the same catalog.
+    The planner of an overlay catalog reuses the plans of the planner
+    of its base catalog that don't depend on any of the overridden contracts.
+    """
+
+    __PLANNERS = weakref.WeakKeyDictionary[IInjectableCatalog, "ResolutionPlanner"]()
+    __PLANNERS_LOCK = threading.Lock()
+    # Unlike single injectables, batches may be requested in any number of combinations,
+    # hence only the plans of the most recently used batches are kept.
+    __MAX_BATCH_PLAN_COUNT = 256
+
+    def __init__(
+        self,
+        catalog: IInjectableCatalog,
+        base: ResolutionPlanner | None = None
+    ) -> None:
+        """Initializes a new instance.
+
+        :param catalog: The catalog of injectables used for planning.
+        :type catalog: IInjectableCatalog
+        :param base: The planner of the base catalog of an overlay catalog, defaults to None.
+        :type base: ResolutionPlanner | None, optional
+        """
+
+        self.__catalog = catalog
+        self.__base = base
+        self.__log = get_logger()
+        self.__lock = threading.RLock()
+        self.__plans = dict[tuple[type, ...], ResolutionPlan]()
+        # A reverse-dependency index of the types the plans depend on, for invalidation.
+        self.__plan_keys_by_type = dict[type, set[tuple[type, ...]]]()
+        # The keys of the plans of batches, from the least recently used to the most recently used.
+        self.__batch_plan_keys = OrderedDict[tuple[type, ...], None]()
+        # The requests that are known to be unsatisfiable, for answering probes quickly.
+        self.__unsatisfiable_requests = set[tuple[type, ...]]()
+        # Weak keys, so that the plans of short-lived callables don't keep them alive.
+        self.__call_plans = weakref.WeakKeyDictionary[Callable, CallPlan]()
+        # The below dictionaries are used for tracking
+        # the dynamically created closed generic types.
+        self.__closed_generic_type_infos_by_id = dict[ClosedGenericTypeId, ClosedGenericTypeInfo]()
+        self.__closed_generic_type_infos_by_type = dict[type, ClosedGenericTypeInfo]()
+        # Only the first map of a chain is written to, hence the bases are never modified.
+        self.__closed_generic_types: MutableMapping[ClosedGenericTypeId, ClosedGenericTypeInfo] = (
+            ChainMap(self.__closed_generic_type_infos_by_id, self.__base.__closed_generic_types)
+            if self.__base
+            else self.__closed_generic_type_infos_by_id
+        )
+
+    @staticmethod
+    def for_catalog(catalog: IInjectableCatalog) -> ResolutionPlanner:
+        """Gets the planner shared by all lifetime scopes that use the specified catalog.
+
+        :param catalog: The catalog of injectables used for planning.
+        :type catalog: IInjectableCatalog
+        :return: The planner associated to the catalog.
+        :rtype: ResolutionPlanner
+        """
+
+        base = (
+            ResolutionPlanner.for_catalog(catalog.base)
+            if isinstance(catalog, OverlayInjectableCatalog)
+            else None
+        )
+        try:
+            if planner := ResolutionPlanner.__PLANNERS.get(catalog):
+                return planner
+
+            with ResolutionPlanner.__PLANNERS_LOCK:
+                if not (planner := ResolutionPlanner.__PLANNERS.get(catalog)):
+                    # The planner refers to its catalog weakly to let both of them be collected.
+                    planner = ResolutionPlanner(weakref.proxy(catalog), base)
+                    ResolutionPlanner.__PLANNERS[catalog] = planner
+                    if isinstance(catalog, MutableInjectableCatalog):
+                        catalog.add_change_listener(planner.invalidate)
+        except TypeError:
+            # The catalog cannot be weakly referenced, hence the planner cannot be shared.
+            planner = ResolutionPlanner(catalog, base)
+            if isinstance(catalog, MutableInjectableCatalog):
+                catalog.add_change_listener(planner.invalidate)
+
+        return planner
+
+    @property
+    def catalog(self) -> IInjectableCatalog:
+        """Gets the catalog of injectables used for planning.
+
+        :return: The catalog of injectables used for planning.
+        :rtype: IInjectableCatalog
+        """
+
+        return self.__catalog
+
+    @property
+    def closed_generic_types(self) -> Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo]:
+        """Gets the map of closed generic types created so far.
+
+        :return: The map of closed generic types created so far.
+        :rtype: Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo]
+        """
+
+        return self.__closed_generic_types
+
+    def get_plan(self, requested_types: tuple[type, ...]) -> ResolutionPlan:
+        """Gets the plan for resolving the specified types,
+        building and caching the plan on the first request.
+
+        :param requested_types: The injectables or contracts to be resolved.
+        :type requested_types: tuple[type, ...]
+        :raises DependencyResolutionException: Raised when a dependency cannot be satisfied.
+        :return: The plan for resolving the specified types.
+        :rtype: ResolutionPlan
+        """
+
+        if plan := self.__plans.get(requested_types):
+            if len(requested_types) > 1:
+                self.__touch_batch_plan(requested_types)
+            return plan
+
+        with self.__lock:
+            if not (plan := self.__plans.get(requested_types)):
+                plan = self.__get_base_plan(requested_types) or self.__build_plan(requested_types)
+                self.__add_plan(plan)
+
+        return plan
+
+    def is_planned(self, requested_types: tuple[type, ...]) -> bool:
+        """Determines whether the plan for resolving the specified types has been built already.
+
+        :param requested_types: The injectables or contracts to be resolved.
+        :type requested_types: tuple[type, ...]
+        :return: True, if the plan is cached.
+        :rtype: bool
+        """
+
+        return requested_types in self.__plans
+
+    def get_plans(self) -> tuple[ResolutionPlan, ...]:
+        """Gets the plans built so far.
+
+        :return: The plans built so far.
+        :rtype: tuple[ResolutionPlan, ...]
+        """
+
+        with self.__lock:
+            return tuple(self.__plans.values())
+
+    def add_plan(self, plan: ResolutionPlan) -> None:
+        """Adds a plan built in advance, such as one restored from a compiled container,
+        replacing the plan of the same request, if there is one.
+
+        :param plan: The plan to be added.
+        :type plan: ResolutionPlan
+        """
+
+        with self.__lock:
+            self.__remove_plan(plan.requested_types)
+            self.__add_plan(plan)
+
+    def try_get_plan(self, requested_types: tuple[type, ...]) -> ResolutionPlan | None:
+        """Same as :meth:`get_plan`, but returns None instead of raising
+        when a dependency cannot be satisfied.
+
+        The unsatisfiable requests are remembered, so that repeated probes are cheap.
+
+        :param requested_types: The injectables or contracts to be resolved.
+        :type requested_types: tuple[type, ...]
+        :return: If possible, the plan for resolving the specified types.
+        :rtype: ResolutionPlan | None
+        """
+
+        if plan := self.__plans.get(requested_types):
+            return plan
+
+        if requested_types in self.__unsatisfiable_requests:
+            return None
+
+        try:
+            return self.get_plan(requested_types)
+        except DependencyResolutionException:
+            with self.__lock:
+                self.__unsatisfiable_requests.add(requested_types)
+            return None
+
+    def invalidate(self, changed_types: Iterable[type]) -> None:
+        """Invalidates the cached plans and closed generic types
+        that depend on any of the specified contracts or injectables.
+
+        :param changed_types: The contracts and injectables whose registrations have changed.
+        :type changed_types: Iterable[type]
+        """
+
+        changed_types = frozenset(changed_types)
+        with self.__lock:
+            for changed_type in changed_types:
+                for plan_key in self.__plan_keys_by_type.get(changed_type, set()).copy():
+                    self.__remove_plan(plan_key)
+
+            # New registrations may satisfy any of the requests, while the probes are cheap.
+            self.__unsatisfiable_requests.clear()
+            for func, call_plan in tuple(self.__call_plans.items()):
+                if ResolutionPlanner.__depends_on(call_plan.contracts, changed_types):
+                    del self.__call_plans[func]
+
+            for generic_type_id, generic_type_info in tuple(
+                self.__closed_generic_type_infos_by_id.items()
+            ):
+                if generic_type_id.origin_type in changed_types:
+                    del self.__closed_generic_type_infos_by_id[generic_type_id]
+                    del self.__closed_generic_type_infos_by_type[
+                        generic_type_info.closed_generic_type
+                    ]
+
+        self.__log.debug("Invalidated cached plans", changed_types=changed_types)
+
+    def get_call_plan(self, func: Callable) -> CallPlan:
+        """Gets the plan for filling in the parameters of the specified callable,
+        building and caching the plan on the first request.
+
+        Positional-only and variadic parameters, as well as parameters
+        that aren't annotated with a valid contract, are never filled in.
+
+        :param func: The callable for which to get the plan.
+        :type func: Callable
+        :return: The plan for filling in the parameters of the callable.
+        :rtype: CallPlan
+        """
+
+        try:
+            if plan := self.__call_plans.get(func):
+                return plan
+        except TypeError:
+            # The callable cannot be weakly referenced, hence it cannot be cached.
+            return self.__get_base_call_plan(func) or self.__build_call_plan(func)
+
+        with self.__lock:
+            if not (plan := self.__call_plans.get(func)):
+                self.__call_plans[func] = plan = (
+                    self.__get_base_call_plan(func)
+                    or self.__build_call_plan(func)
+                )
+
+        return plan
+
+    def get_registration(self, injectable: type) -> InjectableRegistration | None:
+        """Gets the registration associated to the specified injectable,
+        including dynamically created closed generic types.
+
+        :param injectable: The injectable for which to get the registration.
+        :type injectable: type
+        :return: If exists, the registration associated to the injectable.
+        :rtype: InjectableRegistration | None
+        """
+
+        if closed_generic_type_info := self.__get_closed_generic_type_info(injectable):
+            return closed_generic_type_info.origin_registration
+
+        return self.__catalog.get_registration_by_injectable(injectable)
+
+    def get_injectable_type(self, requested_type: type) -> type:
+        """Gets the injectable type associated to the specified type.
+
+        If the specified type is a registered injectable, it is returned as-is;
+        otherwise, it is considered a contract and the type of one of the
+        injectables associated to the contract is returned.
+
+        :param requested_type: An injectable or a contract.
+        :type requested_type: type
+        :return: The associated injectable type, or the specified type, if there is none.
+        :rtype: type
+        """
+
+        if (
+            self.get_registration(requested_type)
+            or not (registrations := self.__catalog.get_registrations_by_contract(requested_type))
+        ):
+            return requested_type
+
+        # Same as with dependencies, it's unspecified which one is picked
+        # when there are multiple injectables associated to the contract.
+        with self.__lock:
+            return self.__get_injectable_type(requested_type, registrations[0])
+
+    def get_injectable_types(self, contract: type) -> tuple[type, ...]:
+        """Gets the types of all injectables associated to the specified contract.
+
+        :param contract: The contract for which to get the injectable types.
+        :type contract: type
+        :return: The types of the injectables associated to the contract.
+        :rtype: tuple[type, ...]
+        """
+
+        if not (registrations := self.__catalog.get_registrations_by_contract(contract)):
+            return ()
+
+        with self.__lock:
+            return tuple(
+                self.__get_injectable_type(contract, registration)
+                for registration in registrations
+            )
+
+    def get_factory_type(self, contract: type) -> type | None:
+        """Gets the type of the injectable constructed by a factory of the specified contract.
+
+        Factories construct the injectable associated to the contract or,
+        if there is none, the contract itself, given that it's a concrete class.
+
+        :param contract: The contract for which to get the type constructed by a factory.
+        :type contract: type
+        :return: If exists, the type constructed by a factory of the contract.
+        :rtype: type | None
+        """
+
+        if injectable_types := self.get_injectable_types(contract):
+            registration = self.get_registration(injectable_types[0])
+            is_type_registration = isinstance(registration, InjectableTypeRegistration)
+            return injectable_types[0] if is_type_registration else None
+
+        if (
+            not isinstance(contract, type)
+            or inspect.isabstract(contract)
+            or getattr(contract, "_is_protocol", False)
+        ):
+            return None
+
+        return contract
+
+    def get_closed_generic_type(
+        self,
+        registration: InjectableTypeRegistration,
+        type_argument: type
+    ) -> ClosedGenericTypeInfo:
+        """Gets the closed generic type of the specified generic registration
+        for the specified generic type argument, creating the type on the first request.
+
+        :param registration: The registration of the generic injectable.
+        :type registration: InjectableTypeRegistration
+        :param type_argument: The generic type argument.
+        :type type_argument: type
+        :return: Information about the closed generic type.
+        :rtype: ClosedGenericTypeInfo
+        """
+
+        with self.__lock:
+            generic_type_id = ClosedGenericTypeId(registration.injectable_type, type_argument)
+
+            # Avoid creating the same type multiple times.
+            if existing_type := self.__closed_generic_types.get(generic_type_id):
+                if self.__is_current(existing_type):
+                    return existing_type
+
+            closed_generic_type = types.new_class(
+                f"{registration.injectable_type.__name__}Of{type_argument.__name__}",
+                # Ignoring the type here, because the linter isn't aware this type is a Generic[T].
+                (registration.injectable_type[type_argument],), # type: ignore
+                None,
+                lambda ns: ns.update({
+                    "generic_type_argument": property(lambda _: type_argument)
+                })
+            )
+            generic_type_info = ClosedGenericTypeInfo(
+                closed_generic_type=closed_generic_type,
+                generic_type_argument=type_argument,
+                origin_registration=registration
+            )
+
+            # Save the newly created type to avoid recreating it if it's needed later.
+            self.__closed_generic_type_infos_by_id[generic_type_id] = generic_type_info
+            self.__closed_generic_type_infos_by_type[closed_generic_type] = generic_type_info
+
+            return generic_type_info
+
+    @staticmethod
+    def __get_current_tracer() -> Tracer | None:
+        # There cannot be a current tracer until the tracing module is imported by someone else,
+        # hence it isn't imported for the applications that don't trace.
+        if (tracer_module := sys.modules.get("kanata.tracing.tracer")) is None:
+            return None
+
+        return tracer_module.Tracer.get_current_tracer()
+
+    def __build_plan(self, requested_types: tuple[type, ...]) -> ResolutionPlan:
+        injectable_types = tuple(
+            self.get_injectable_type(requested_type)
+            for requested_type in requested_types
+        )
+        # Planning is rare, hence the tracer is looked up only when a plan is built.
+        if tracer := ResolutionPlanner.__get_current_tracer():
+            span = tracer.start_span("build_graph", "planning", injectables=injectable_types)
+            try:
+                graph, contracts = self.__build_dependency_graph_for(injectable_types)
+            finally:
+                tracer.end_span(span)
+            span = tracer.start_span("sort", "planning", node_count=len(graph.nodes))
+            try:
+                sorted_injectable_types = topological_sort_many(graph, injectable_types)
+            finally:
+                tracer.end_span(span)
+        else:
+            graph, contracts = self.__build_dependency_graph_for(injectable_types)
+            sorted_injectable_types = topological_sort_many(graph, injectable_types)
+
+        requested_injectable_types = set(injectable_types)
+        steps = list[ResolutionStep]()
+        for injectable_type in sorted_injectable_types:
+            if not (registration := self.get_registration(injectable_type)):
+                raise DependencyResolutionException(
+                    injectable_type,
+                    f"Cannot find the registration for injectable '{injectable_type}'."
+                    " It is possible that this type is not an injectable."
+                )
+
+            scope_type = ResolutionPlanner.__get_injectable_scope_type(registration)
+            is_requested = injectable_type in requested_injectable_types
+            # Each dependee constructs its own instance of a transient dependency.
+            if scope_type == InjectableScopeType.TRANSIENT and not is_requested:
+                continue
+
+            steps.append(ResolutionStep(injectable_type, registration, scope_type, is_requested))
+
+        return ResolutionPlan(
+            requested_types=requested_types,
+            injectable_types=injectable_types,
+            steps=tuple(steps),
+            contracts=frozenset(contracts)
+        )
+
+    def __add_plan(self, plan: ResolutionPlan) -> None:
+        self.__plans[plan.requested_types] = plan
+        for dependency in ResolutionPlanner.__get_plan_dependencies(plan):
+            self.__plan_keys_by_type.setdefault(dependency, set()).add(plan.requested_types)
+
+        if len(plan.requested_types) > 1:
+            self.__batch_plan_keys[plan.requested_types] = None
+            if len(self.__batch_plan_keys) > ResolutionPlanner.__MAX_BATCH_PLAN_COUNT:
+                self.__remove_plan(next(iter(self.__batch_plan_keys)))
+
+    def __touch_batch_plan(self, plan_key: tuple[type, ...]) -> None:
+        with self.__lock:
+            if plan_key in self.__batch_plan_keys:
+                self.__batch_plan_keys.move_to_end(plan_key)
+
+    def __remove_plan(self, plan_key: tuple[type, ...]) -> None:
+        if not (plan := self.__plans.pop(plan_key, None)):
+            return
+
+        self.__batch_plan_keys.pop(plan_key, None)
+
+        for dependency in ResolutionPlanner.__get_plan_dependencies(plan):
+            if plan_keys := self.__plan_keys_by_type.get(dependency):
+                plan_keys.discard(plan_key)
+                if not plan_keys:
+                    del self.__plan_keys_by_type[dependency]
+
+    @staticmethod
+    def __get_plan_dependencies(plan: ResolutionPlan) -> set[type]:
+        dependencies = set[type]((*plan.requested_types, *plan.injectable_types))
+        for contract in plan.contracts:
+            dependencies.add(contract)
+            # Changes of open generic registrations affect the closed contracts, too.
+            if origin := get_origin(contract):
+                dependencies.add(origin)
+        for step in plan.steps:
+            dependencies.add(step.injectable_type)
+            if isinstance(step.registration, InjectableTypeRegistration):
+                dependencies.add(step.registration.injectable_type)
+
+        return dependencies
+
+    @staticmethod
+    def __depends_on(contracts: Iterable[type], changed_types: frozenset[type]) -> bool:
+        return any(
+            contract in changed_types or get_origin(contract) in changed_types
+            for contract in contracts
+        )
+
+    def __get_base_plan(self, requested_types: tuple[type, ...]) -> ResolutionPlan | None:
+        if not self.__base or not (plan := self.__base.try_get_plan(requested_types)):
+            return None
+
+        catalog: OverlayInjectableCatalog = self.__catalog # type: ignore
+        is_affected = (
+            any(map(catalog.is_overridden, plan.requested_types))
+            or any(map(catalog.is_overridden, plan.contracts))
+            or any(catalog.is_overridden(step.injectable_type) for step in plan.steps)
+        )
+        return None if is_affected else plan
+
+    def __get_base_call_plan(self, func: Callable) -> CallPlan | None:
+        if not self.__base:
+            return None
+
+        plan = self.__base.get_call_plan(func)
+        catalog: OverlayInjectableCatalog = self.__catalog # type: ignore
+        return None if any(map(catalog.is_overridden, plan.contracts)) else plan
+
+    def __get_closed_generic_type_info(self, injectable: type) -> ClosedGenericTypeInfo | None:
+        if closed_generic_type_info := self.__closed_generic_type_infos_by_type.get(injectable):
+            return closed_generic_type_info
+
+        if not self.__base:
+            return None
+
+        # The closed generic types of the base are valid as long as their origins aren't overridden.
+        closed_generic_type_info = self.__base.__get_closed_generic_type_info(injectable)
+        return (
+            closed_generic_type_info
+            if closed_generic_type_info and self.__is_current(closed_generic_type_info)
+            else None
+        )
+
+    def __is_current(self, closed_generic_type_info: ClosedGenericTypeInfo) -> bool:
+        origin_registration = closed_generic_type_info.origin_registration
+        return origin_registration is self.__catalog.get_registration_by_injectable(
+            origin_registration.injectable_type
+        )
+
+    def __build_call_plan(self, func: Callable) -> CallPlan:
+        parameters = list[InjectedParameter]()
+        position = 0
+        for name, descriptor in inspect.signature(func).parameters.items():
+            match descriptor.kind:
+                case inspect.Parameter.POSITIONAL_ONLY:
+                    position += 1
+                    continue
+                case inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                    parameter_position: int | None = position
+                    position += 1
+                case inspect.Parameter.KEYWORD_ONLY:
+                    parameter_position = None
+                case _:
+                    continue
+
+            if descriptor.annotation == inspect.Parameter.empty:
+                continue
+
+            try:
+                contract, kind = get_dependent_contract(descriptor.annotation)
+            except DependencyResolutionException:
+                # Such parameters are left to be passed by the caller.
+                continue
+
+            if kind == DependencyKind.FACTORY:
+                factory_type = self.get_factory_type(contract)
+                injectable_types = (factory_type,) if factory_type else ()
+            else:
+                injectable_types = self.get_injectable_types(contract)
+
+            parameters.append(InjectedParameter(
+                name=name,
+                position=parameter_position,
+                contract=contract,
+                kind=kind,
+                injectable_types=injectable_types,
+                has_default=descriptor.default != inspect.Parameter.empty
+            ))
+
+        return CallPlan(
+            parameters=tuple(parameters),
+            contracts=frozenset(parameter.contract for parameter in parameters)
+        )
+
+    @staticmethod
+    def __get_injectable_scope_type(registration: InjectableRegistration) -> InjectableScopeType:
+        match registration:
+            case InjectableTypeRegistration():
+                return registration.scope
+            case InjectableInstanceRegistration():
+                return InjectableScopeType.SINGLETON
+            case _:
+                raise DependencyResolutionException(
+                    type(registration),
+                    "Unsupported type of injectable registration."
+                )
+
+    def __build_dependency_graph_for(
+        self,
+        injectables: tuple[type, ...]
+    ) -> tuple[BidirectedGraph[type], set[type]]:
+        graph: BidirectedGraph[type] = BidirectedGraph()
+        contracts = set[type]()
+        injectables_to_resolve: list[type] = list(injectables)
+        is_debug_enabled = self.__log.is_debug_enabled
+        while injectables_to_resolve:
+            dependee_injectable = injectables_to_resolve.pop()
+            if not graph.try_add_node(dependee_injectable):
+                # This type's dependency chain has already been mapped.
+                continue
+
+            registration = self.get_registration(dependee_injectable)
+            if isinstance(registration, InjectableTypeRegistration) and registration.is_external:
+                # The instances of external injectables are never constructed.
+                continue
+
+            if is_debug_enabled:
+                self.__log.debug("Gathering dependent contracts", dependee=dependee_injectable)
+            dependent_contracts = get_dependent_contracts(dependee_injectable)
+            for dependent_contract, kind in dependent_contracts:
+                if is_debug_enabled:
+                    self.__log.debug(
+                        "Found dependent contract",
+                        dependee=dependee_injectable,
+                        dependent=dependent_contract,
+                        kind=kind
+                    )
+                contracts.add(dependent_contract)
+                dependent_registrations = self.__catalog.get_registrations_by_contract(
+                    dependent_contract
+                )
+                if kind == DependencyKind.FACTORY:
+                    # Factories construct their instances on demand, if possible at all.
+                    if not self.get_factory_type(dependent_contract):
+                        raise DependencyResolutionException(
+                            dependee_injectable,
+                            "Cannot create a factory"
+                            f" for {dependee_injectable} of {dependent_contract}."
+                        )
+                    continue
+
+                if len(dependent_registrations) == 0 and kind not in _FULFILLABLE_KINDS:
+                    raise DependencyResolutionException(
+                        dependee_injectable,
+                        "Cannot satisfy the dependency"
+                        f" of {dependee_injectable} on {dependent_contract}."
+                    )
+
+                # Providers resolve their instances on demand.
+                if kind == DependencyKind.PROVIDER:
+                    continue
+
+                injectables_to_resolve.extend(
+                    self.__mark_dependent_types(
+                        graph,
+                        dependee_injectable,
+                        dependent_contract,
+                        dependent_registrations,
+                        is_debug_enabled
+                    )
+                )
+
+        return graph, contracts
+
+    def __mark_dependent_types(
+        self,
+        graph: BidirectedGraph[type],
+        dependee_injectable: type,
+        dependent_contract: type,
+        dependent_registrations: Iterable[InjectableRegistration],
+        is_debug_enabled: bool
+    ) -> Iterable[type]:
+        # Mark each implementation as a dependency. At this point,
+        # it is possible only one of them will be needed by
+        # this specific type. But we'll make sure all are initialized
+        # as they may be needed later.
+        dependent_types = []
+        for dependent_registration in dependent_registrations:
+            injectable_type = self.__get_injectable_type(
+                dependent_contract,
+                dependent_registration
+            )
+
+            graph.try_add_node(dependee_injectable)
+            graph.try_add_edge(dependee_injectable, injectable_type)
+            dependent_types.append(injectable_type)
+            if is_debug_enabled:
+                self.__log.debug(
+                    "Identified dependent injectable",
+                    dependee=dependee_injectable,
+                    dependent=injectable_type
+                )
+
+        return dependent_types
+
+    def __get_injectable_type(
+        self,
+        dependent_contract: type,
+        dependent_registration: InjectableRegistration
+    ) -> type:
+        match dependent_registration:
+            case InjectableTypeRegistration():
+                generic_type = self.__get_or_create_generic_type(
+                    dependent_registration,
+                    dependent_contract
+                )
+                return (
+                    generic_type.closed_generic_type if generic_type
+                    else dependent_registration.injectable_type
+                )
+            case InjectableInstanceRegistration():
+                return type(dependent_registration.injectable_instance)
+            case _:
+                raise DependencyResolutionException(
+                    type(dependent_registration),
+                    "Unsupported type of injectable registration."
+                )
+
+    def __get_or_create_generic_type(
+        self,
+        registration: InjectableTypeRegistration,
+        contract: type
+    ) -> ClosedGenericTypeInfo | None:
+        if not registration.is_generic:
+            return None
+
+        type_arguments = get_args(contract)
+        if len(type_arguments) != 1:
+            raise DependencyResolutionException(
+                contract,
+                "The generic contract must have one single generic type argument."
+            )
+
+        return self.get_closed_generic_type(registration, type_arguments[0])
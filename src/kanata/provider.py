@@ -0,0 +1,48 @@
+from typing import Generic, TypeVar
+
+from .ilifetime_scope import ILifetimeScope
+
+T = TypeVar("T")
+
+class Provider(Generic[T]):
+    """Provides instances associated to a contract on demand.
+
+    By depending on ``Provider[IContract]`` instead of ``IContract``,
+    an injectable resolves its dependency lazily and observes any
+    instance that is rebuilt later, such as an expired singleton.
+    The instances are resolved from the lifetime scope that owns the dependee,
+    which is the root scope for singletons, context-bound and thread-bound injectables,
+    and the scope that has resolved the dependee otherwise.
+    """
+
+    def __init__(self, lifetime_scope: ILifetimeScope, contract: type[T]) -> None:
+        """Initializes a new instance.
+
+        :param lifetime_scope: The lifetime scope used to resolve the instances.
+        :type lifetime_scope: ILifetimeScope
+        :param contract: The contract for which to resolve the instances.
+        :type contract: type[T]
+        """
+
+        self.__lifetime_scope = lifetime_scope
+        self.__contract = contract
+
+    @property
+    def contract(self) -> type[T]:
+        """Gets the contract for which the instances are resolved.
+
+        :return: The contract for which the instances are resolved.
+        :rtype: type[T]
+        """
+
+        return self.__contract
+
+    def get(self) -> T:
+        """Resolves the current instance associated to the contract.
+
+        :raises DependencyResolutionException: Raised when dependency resolution fails.
+        :return: The current instance associated to the contract.
+        :rtype: T
+        """
+
+        return self.__lifetime_scope.resolve(self.__contract)
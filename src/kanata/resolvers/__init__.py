@@ -1,5 +1,18 @@
-from .default_resolver import DefaultResolver
-from .default_resolver_options import DefaultResolverOptions
-from .iresolver import IResolver
-from .resolver_base import ResolverBase
-from .resolver_context import ResolverContext
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .default_resolver import DefaultResolver
+    from .default_resolver_options import DefaultResolverOptions
+    from .iresolver import IResolver
+    from .resolver_base import ResolverBase
+    from .resolver_context import ResolverContext
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "default_resolver": ("DefaultResolver",),
+    "default_resolver_options": ("DefaultResolverOptions",),
+    "iresolver": ("IResolver",),
+    "resolver_base": ("ResolverBase",),
+    "resolver_context": ("ResolverContext",)
+})
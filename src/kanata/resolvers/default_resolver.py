@@ -1,9 +1,8 @@
+import time
 from typing import Any, TypeVar
 
-import structlog
-
-from kanata.constants import LOGGER_NAME
 from kanata.exceptions import DependencyResolutionException
+from kanata.loggers import get_logger
 from kanata.models import (
     InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType,
     InjectableTypeRegistration
@@ -14,6 +13,14 @@ from .resolver_context import ResolverContext
 
 TInjectable = TypeVar("TInjectable")
 
+_SHARED_SCOPE_TYPES = frozenset((
+    InjectableScopeType.SINGLETON,
+    InjectableScopeType.SCOPED,
+    InjectableScopeType.CONTEXT,
+    InjectableScopeType.THREAD,
+    InjectableScopeType.PER_RESOLVE
+))
+
 class DefaultResolver(ResolverBase):
     """Default implementation of a resolver."""
 
@@ -23,7 +30,13 @@ class DefaultResolver(ResolverBase):
     ) -> None:
         super().__init__()
         self.__options = options or DefaultResolverOptions()
-        self.__log = structlog.get_logger(logger_name=LOGGER_NAME)
+        self.__log = get_logger()
+
+    def can_resolve(self, registration: InjectableRegistration) -> bool:
+        return isinstance(
+            registration,
+            (InjectableInstanceRegistration, InjectableTypeRegistration)
+        )
 
     def resolve(
         self,
@@ -39,26 +52,45 @@ class DefaultResolver(ResolverBase):
                 "Unsupported type of injectable registration."
             )
 
-        # For singleton and scoped injectables, we know that there exists one and only one
+        # For injectables other than transients, we know that there exists one and only one
         # instance for all of the associated contracts, therefore we can find and return
         # that specific one if it is created already.
-        if (
-            registration.scope in (InjectableScopeType.SINGLETON, InjectableScopeType.SCOPED)
-            and (matching_instances := context.instances.get_instances_by_injectable(
+        if registration.scope in _SHARED_SCOPE_TYPES:
+            matching_instances = context.instances.get_instances_by_injectable(
                 injectable_type,
                 registration.scope
-            ))
-            and (instance := next(iter(matching_instances), None))
-        ):
-            return instance
+            )
+            # Falsy instances, such as empty containers, are valid instances, too.
+            if (instance := next(iter(matching_instances), None)) is not None:
+                return instance
 
-        return injectable_type(
-            *self._get_dependencies(
-                context,
+        if registration.is_external:
+            raise DependencyResolutionException(
                 injectable_type,
-                registration.scope
+                f"The instance of external injectable '{injectable_type}'"
+                " must be added to the lifetime scope explicitly."
             )
-        )
+
+        dependencies = self._get_dependencies(context, injectable_type, registration.scope)
+        metrics, tracer = context.metrics, context.tracer
+        if metrics is None and tracer is None:
+            return injectable_type(*dependencies)
+
+        # Only the constructor is measured, since the dependencies are constructed separately.
+        if tracer is None:
+            start_time = time.perf_counter_ns()
+            instance = injectable_type(*dependencies)
+        else:
+            span = tracer.start_span("construct", "resolution", injectable=injectable_type)
+            start_time = time.perf_counter_ns()
+            try:
+                instance = injectable_type(*dependencies)
+            finally:
+                tracer.end_span(span)
+
+        if metrics is not None:
+            metrics.record_construction(injectable_type, time.perf_counter_ns() - start_time)
+        return instance
 
     def _on_captive_dependency_detected(
         self,
@@ -72,6 +104,6 @@ class DefaultResolver(ResolverBase):
             f" Singleton '{injectable}' depends on transient '{contract}'."
         )
         if not self.__options.suppress_captive_dependency_warnings:
-            self.__log.warn(error_message)
+            self.__log.warning(error_message)
         if self.__options.raise_on_captive_dependency:
             raise DependencyResolutionException(injectable, error_message)
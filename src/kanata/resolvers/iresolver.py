@@ -4,7 +4,25 @@ from kanata.models import InjectableRegistration
 from .resolver_context import ResolverContext
 
 class IResolver(Protocol):
-    """Interface for a service that can resolve instances of injectables."""
+    """Interface for a service that can resolve instances of injectables.
+
+    For each registration, the lifetime scopes call the first resolver
+    that can resolve the registration, and only that one.
+    """
+
+    def can_resolve(self, registration: InjectableRegistration) -> bool:
+        """Determines whether the resolver can resolve instances of the specified registration.
+
+        The result is cached by the lifetime scopes, hence it must not change over time.
+        By default, all registrations are resolved.
+
+        :param registration: The registration of the injectable.
+        :type registration: InjectableRegistration
+        :return: True, if the resolver can resolve instances of the registration.
+        :rtype: bool
+        """
+
+        return True
 
     def resolve(
         self,
@@ -18,7 +36,7 @@ class IResolver(Protocol):
         :type context: ResolverContext
         :param injectable_type: The injectable that needs to be resolved. For generic injectables, this is the closed generic type.
         :type injectable_type: type
-        :return: The resolved injectable instance.
+        :return: The resolved injectable instance, which mustn't be None.
         :rtype: TInjectable
         """
         ...
@@ -1,22 +1,37 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any, get_args
 
 from kanata.exceptions import DependencyResolutionException
+from kanata.ilifetime_scope import ILifetimeScope
 from kanata.models import (
-    ClosedGenericTypeId, ClosedGenericTypeInfo, IInstanceCollection, InjectableInstanceRegistration,
-    InjectableRegistration, InjectableScopeType, InjectableTypeRegistration
+    ClosedGenericTypeId, ClosedGenericTypeInfo, DependencyKind, IInstanceCollection,
+    InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType,
+    InjectableTypeRegistration
 )
+from kanata.factory import Factory
+from kanata.provider import Provider
 from kanata.utils import get_dependent_contracts
 from .iresolver import IResolver
 from .resolver_context import ResolverContext
 
 _SCOPE_TYPE_RANKS: dict[InjectableScopeType, int] = {
     InjectableScopeType.TRANSIENT: 0,
-    InjectableScopeType.SCOPED: 1,
-    InjectableScopeType.SINGLETON: 2
+    InjectableScopeType.PER_RESOLVE: 1,
+    InjectableScopeType.SCOPED: 2,
+    InjectableScopeType.CONTEXT: 3,
+    InjectableScopeType.THREAD: 3,
+    InjectableScopeType.SINGLETON: 4
 }
 
+# The scopes whose instances are shared by the whole tree of lifetime scopes,
+# hence they mustn't capture the child scope that happened to construct them.
+_ROOT_SCOPE_TYPES = frozenset((
+    InjectableScopeType.SINGLETON,
+    InjectableScopeType.CONTEXT,
+    InjectableScopeType.THREAD
+))
+
 class ResolverBase(ABC, IResolver):
     """Abstract base class for a resolver."""
 
@@ -89,7 +104,20 @@ class ResolverBase(ABC, IResolver):
 
         dependent_contracts = get_dependent_contracts(injectable)
         dependent_injectables = list[Any]()
-        for dependent_contract, is_multi in dependent_contracts:
+        for dependent_contract, kind in dependent_contracts:
+            if kind == DependencyKind.PROVIDER:
+                dependent_injectables.append(Provider(
+                    ResolverBase.__get_owner_scope(context, dependee_scope),
+                    dependent_contract
+                ))
+                continue
+            if kind == DependencyKind.FACTORY:
+                dependent_injectables.append(Factory(
+                    ResolverBase.__get_owner_scope(context, dependee_scope),
+                    ResolverBase.__get_factory_type(context, injectable, dependent_contract)
+                ))
+                continue
+
             candidate_instances = self.__get_candidate_dependent_instances(
                 context,
                 injectable,
@@ -97,10 +125,12 @@ class ResolverBase(ABC, IResolver):
                 dependent_contract
             )
 
-            if is_multi:
+            if kind == DependencyKind.TUPLE:
                 dependent_injectables.append(tuple(candidate_instances))
             elif len(candidate_instances) > 0:
                 dependent_injectables.append(candidate_instances[0])
+            elif kind == DependencyKind.OPTIONAL:
+                dependent_injectables.append(None)
             else:
                 raise DependencyResolutionException(
                     injectable,
@@ -112,9 +142,40 @@ class ResolverBase(ABC, IResolver):
 
         return dependent_injectables
 
+    @staticmethod
+    def __get_owner_scope(
+        context: ResolverContext,
+        dependee_scope: InjectableScopeType
+    ) -> ILifetimeScope:
+        if dependee_scope in _ROOT_SCOPE_TYPES and context.root_lifetime_scope is not None:
+            return context.root_lifetime_scope
+
+        return context.lifetime_scope
+
+    @staticmethod
+    def __get_factory_type(
+        context: ResolverContext,
+        injectable: type,
+        dependent_contract: type
+    ) -> type:
+        if not (registrations := context.catalog.get_registrations_by_contract(dependent_contract)):
+            return dependent_contract
+
+        if not isinstance(registration := registrations[0], InjectableTypeRegistration):
+            raise DependencyResolutionException(
+                injectable,
+                f"Cannot create a factory for {injectable} of {dependent_contract}."
+            )
+
+        return ResolverBase.__get_injectable_type(
+            context.closed_generic_types,
+            registration,
+            dependent_contract
+        )
+
     @staticmethod
     def __get_candidates_by_type_registration(
-        closed_generic_types: dict[ClosedGenericTypeId, ClosedGenericTypeInfo],
+        closed_generic_types: Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo],
         instances: IInstanceCollection,
         registration: InjectableTypeRegistration,
         dependent_contract: type
@@ -133,9 +194,28 @@ class ResolverBase(ABC, IResolver):
             )
         )
 
+    @staticmethod
+    def __get_injectable_type(
+        closed_generic_types: Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo],
+        registration: InjectableTypeRegistration,
+        dependent_contract: type
+    ) -> type:
+        if not registration.is_generic:
+            return registration.injectable_type
+
+        type_argument = get_args(dependent_contract)[0]
+        generic_type_id = ClosedGenericTypeId(registration.injectable_type, type_argument)
+        if not (closed_generic_type_info := closed_generic_types.get(generic_type_id)):
+            raise DependencyResolutionException(
+                registration.injectable_type,
+                f"The closed generic type for contract '{dependent_contract}' doesn't exist."
+            )
+
+        return closed_generic_type_info.closed_generic_type
+
     @staticmethod
     def __get_closed_generic_instances(
-        closed_generic_types: dict[ClosedGenericTypeId, ClosedGenericTypeInfo],
+        closed_generic_types: Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo],
         instances: IInstanceCollection,
         origin_registration: InjectableTypeRegistration,
         contract_type: type
@@ -150,6 +230,19 @@ class ResolverBase(ABC, IResolver):
             origin_registration.scope
         )
 
+    def __create_transient_instance(
+        self,
+        context: ResolverContext,
+        registration: InjectableTypeRegistration,
+        injectable_type: type
+    ) -> Any:
+        # The lifetime scope dispatches the registration to its own resolver,
+        # which isn't necessarily the resolver of the dependee.
+        if (create_instance := context.create_instance) is None:
+            return self.resolve(context, registration, injectable_type)
+
+        return create_instance(context, registration, injectable_type)
+
     def __get_candidate_dependent_instances(
         self,
         context: ResolverContext,
@@ -164,6 +257,19 @@ class ResolverBase(ABC, IResolver):
                 if ResolverBase._is_captive_dependency(dependee_scope, registration.scope):
                     self._on_captive_dependency_detected(injectable, dependent_contract)
 
+                # Each dependee gets its own instance of a transient injectable.
+                if registration.scope == InjectableScopeType.TRANSIENT:
+                    candidate_instances.append(self.__create_transient_instance(
+                        context,
+                        registration,
+                        ResolverBase.__get_injectable_type(
+                            context.closed_generic_types,
+                            registration,
+                            dependent_contract
+                        )
+                    ))
+                    continue
+
                 candidate_instances.extend(
                     ResolverBase.__get_candidates_by_type_registration(
                         context.closed_generic_types,
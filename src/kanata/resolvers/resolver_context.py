@@ -1,7 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from kanata.catalogs import IInjectableCatalog
-from kanata.models import ClosedGenericTypeId, ClosedGenericTypeInfo, IInstanceCollection
+from kanata.ilifetime_scope import ILifetimeScope
+from kanata.models import (
+    ClosedGenericTypeId, ClosedGenericTypeInfo, IInstanceCollection, InjectableRegistration
+)
+
+if TYPE_CHECKING:
+    from kanata.metrics import MetricsRegistry
+    from kanata.tracing import Tracer
 
 @dataclass(frozen=True, kw_only=True)
 class ResolverContext:
@@ -10,8 +21,28 @@ class ResolverContext:
     catalog: IInjectableCatalog
     """The catalog of injectables."""
 
-    closed_generic_types: dict[ClosedGenericTypeId, ClosedGenericTypeInfo]
+    closed_generic_types: Mapping[ClosedGenericTypeId, ClosedGenericTypeInfo]
     """A map of closed generic types available for injection."""
 
     instances: IInstanceCollection
     """The already resolved instances of injectables."""
+
+    lifetime_scope: ILifetimeScope
+    """The lifetime scope that requested the resolution."""
+
+    root_lifetime_scope: ILifetimeScope | None = None
+    """The root of the tree of the lifetime scope that requested the resolution,
+    which owns the injectables shared by the whole tree. If None, it's the same scope.
+    """
+
+    create_instance: Callable[[ResolverContext, InjectableRegistration, type], Any] | None = None
+    """Creates an instance of a dependency via the resolver of its registration,
+    such as a transient dependency that's constructed for each of its dependees.
+    If None, the resolver constructs the dependency itself.
+    """
+
+    metrics: MetricsRegistry | None = None
+    """The registry of the metrics to be updated, if any."""
+
+    tracer: Tracer | None = None
+    """The tracer that records the constructions of instances, if any."""
@@ -0,0 +1,20 @@
+"""Tracing of the operations of the framework."""
+
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .chrome_trace_exporter import ChromeTraceExporter
+    from .in_memory_span_collector import InMemorySpanCollector
+    from .itrace_listener import ITraceListener
+    from .trace_span import TraceSpan
+    from .tracer import Tracer
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "chrome_trace_exporter": ("ChromeTraceExporter",),
+    "in_memory_span_collector": ("InMemorySpanCollector",),
+    "itrace_listener": ("ITraceListener",),
+    "trace_span": ("TraceSpan",),
+    "tracer": ("Tracer",)
+})
@@ -0,0 +1,74 @@
+import json
+import os
+import threading
+from typing import Any
+
+from .itrace_listener import ITraceListener
+from .trace_span import TraceSpan
+
+class ChromeTraceExporter(ITraceListener):
+    """A thread-safe trace listener that records the ended spans as complete events
+    of the Chrome trace event format, which can be opened in chrome://tracing or Perfetto.
+    """
+
+    def __init__(self, max_event_count: int | None = 100_000) -> None:
+        """Initializes a new instance.
+
+        :param max_event_count: The maximum number of events kept in memory,
+            after which further spans are dropped, defaults to 100 000.
+            If None, the number of events is unbounded.
+        :type max_event_count: int | None, optional
+        """
+
+        self.__max_event_count = max_event_count
+        self.__lock = threading.Lock()
+        self.__events = list[dict[str, Any]]()
+
+    def get_trace(self) -> dict[str, Any]:
+        """Gets the trace document of the events recorded so far.
+
+        :return: The JSON-serializable trace document.
+        :rtype: dict[str, Any]
+        """
+
+        with self.__lock:
+            return {"traceEvents": list(self.__events), "displayTimeUnit": "ns"}
+
+    def write(self, path: str) -> None:
+        """Writes the trace document of the events recorded so far to the specified file.
+
+        :param path: The path of the trace file.
+        :type path: str
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.get_trace(), file)
+
+    def clear(self) -> None:
+        """Discards the events recorded so far."""
+
+        with self.__lock:
+            self.__events.clear()
+
+    def on_span_started(self, span: TraceSpan) -> None:
+        pass
+
+    def on_span_ended(self, span: TraceSpan) -> None:
+        # The timestamps of the format are in microseconds.
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.start_time_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": span.thread_id,
+            "args": {
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **{name: str(value) for name, value in span.attributes.items()}
+            }
+        }
+        with self.__lock:
+            if self.__max_event_count is None or len(self.__events) < self.__max_event_count:
+                self.__events.append(event)
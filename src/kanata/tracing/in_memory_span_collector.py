@@ -0,0 +1,44 @@
+import threading
+
+from .itrace_listener import ITraceListener
+from .trace_span import TraceSpan
+
+class InMemorySpanCollector(ITraceListener):
+    """A thread-safe trace listener that keeps the ended spans in memory,
+    such as for making assertions on them in tests."""
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__spans = list[TraceSpan]()
+
+    @property
+    def spans(self) -> tuple[TraceSpan, ...]:
+        """Gets the spans ended so far, in the order of their ends."""
+
+        with self.__lock:
+            return tuple(self.__spans)
+
+    def get_spans_by_name(self, name: str) -> tuple[TraceSpan, ...]:
+        """Gets the spans of the operations with the specified name.
+
+        :param name: The name of the operations.
+        :type name: str
+        :return: The matching spans, in the order of their ends.
+        :rtype: tuple[TraceSpan, ...]
+        """
+
+        with self.__lock:
+            return tuple(span for span in self.__spans if span.name == name)
+
+    def clear(self) -> None:
+        """Discards the spans collected so far."""
+
+        with self.__lock:
+            self.__spans.clear()
+
+    def on_span_started(self, span: TraceSpan) -> None:
+        pass
+
+    def on_span_ended(self, span: TraceSpan) -> None:
+        with self.__lock:
+            self.__spans.append(span)
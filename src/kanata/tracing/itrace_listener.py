@@ -0,0 +1,26 @@
+from typing import Protocol
+
+from .trace_span import TraceSpan
+
+class ITraceListener(Protocol):
+    """Interface for a listener that receives the spans of the traced operations.
+
+    The listeners are called on the threads executing the operations,
+    hence they're expected to be thread-safe and inexpensive.
+    """
+
+    def on_span_started(self, span: TraceSpan) -> None:
+        """Called when a sampled operation starts.
+
+        :param span: The span of the operation.
+        :type span: TraceSpan
+        """
+        ...
+
+    def on_span_ended(self, span: TraceSpan) -> None:
+        """Called when a sampled operation ends.
+
+        :param span: The span of the operation, with its end time set.
+        :type span: TraceSpan
+        """
+        ...
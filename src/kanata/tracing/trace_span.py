@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+@dataclass(kw_only=True)
+class TraceSpan:
+    """Describes a traced operation of the framework, such as the resolution of an injectable."""
+
+    span_id: int
+    """The process-wide unique identifier of the span."""
+
+    parent: TraceSpan | None = field(default=None, repr=False, compare=False)
+    """The span of the operation that encloses this operation, if any."""
+
+    name: str
+    """The name of the operation."""
+
+    category: str
+    """The category of the operation, such as resolution or planning."""
+
+    attributes: dict[str, Any] = field(default_factory=dict)
+    """The attributes describing the operation, such as the injectable being resolved."""
+
+    thread_id: int
+    """The identifier of the thread the operation was executed on."""
+
+    start_time_ns: int
+    """The value of the performance counter when the operation started, in nanoseconds."""
+
+    end_time_ns: int | None = None
+    """The value of the performance counter when the operation ended, in nanoseconds,
+    or None if the operation is still in progress.
+    """
+
+    @property
+    def parent_id(self) -> int | None:
+        """Gets the identifier of the parent span, if any.
+
+        :return: The identifier of the parent span, if any.
+        :rtype: int | None
+        """
+
+        return self.parent.span_id if self.parent is not None else None
+
+    @property
+    def duration_ns(self) -> int:
+        """Gets the duration of the operation, in nanoseconds.
+
+        :return: The duration of the operation, or zero if it's still in progress.
+        :rtype: int
+        """
+
+        return self.end_time_ns - self.start_time_ns if self.end_time_ns is not None else 0
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from collections.abc import Iterable
+from contextvars import ContextVar
+from typing import Any
+
+from kanata.exceptions import ArgumentException
+from .itrace_listener import ITraceListener
+from .trace_span import TraceSpan
+
+class Tracer:
+    """Creates the spans of the traced operations and forwards them to its listeners.
+
+    The spans of nested operations, such as the construction of the dependencies
+    of a resolved injectable, are children of the span of the enclosing operation.
+    Whether a tree of spans is recorded is decided when its root span is started,
+    hence either all or none of the spans of an operation are recorded.
+    """
+
+    __SPAN_IDS = itertools.count(1)
+    __CURRENT_SPAN = ContextVar[TraceSpan | None]("kanata_current_span", default=None)
+    # The tracer of the root span, which records the nested spans, too.
+    __CURRENT_TRACER = ContextVar["Tracer | None"]("kanata_current_tracer", default=None)
+    # Marks the operations that aren't sampled, so that their nested operations aren't either.
+    __UNSAMPLED_SPAN = TraceSpan(span_id=0, name="", category="", thread_id=0, start_time_ns=0)
+
+    def __init__(
+        self,
+        listeners: Iterable[ITraceListener],
+        sample_rate: float = 1.0
+    ) -> None:
+        """Initializes a new instance.
+
+        :param listeners: The listeners that receive the spans.
+        :type listeners: Iterable[ITraceListener]
+        :param sample_rate: The ratio of the root operations to be recorded,
+            between zero and one, defaults to 1.0.
+        :type sample_rate: float, optional
+        :raises ArgumentException: Raised when the sample rate is out of range.
+        """
+
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ArgumentException(
+                "sample_rate",
+                sample_rate,
+                "The sample rate must be between zero and one."
+            )
+
+        self.__listeners = tuple(listeners)
+        self.__sample_rate = sample_rate
+
+    @property
+    def sample_rate(self) -> float:
+        """Gets the ratio of the root operations that are recorded."""
+
+        return self.__sample_rate
+
+    @staticmethod
+    def get_current_tracer() -> Tracer | None:
+        """Gets the tracer of the sampled operation in progress in the current context, if any.
+
+        This allows the components that aren't bound to a tracer,
+        such as the planners shared by multiple lifetime scopes,
+        to record the spans of their nested operations.
+
+        :return: The tracer of the operation in progress, if it's sampled; otherwise, None.
+        :rtype: Tracer | None
+        """
+
+        return Tracer.__CURRENT_TRACER.get()
+
+    def start_span(self, name: str, category: str, **attributes: Any) -> TraceSpan | None:
+        """Starts the span of an operation in the current context.
+
+        Each started span must be ended via :meth:`end_span` in the same context.
+
+        :param name: The name of the operation.
+        :type name: str
+        :param category: The category of the operation.
+        :type category: str
+        :return: The started span, which is None for the nested operations
+            of the root operations that aren't sampled.
+        :rtype: TraceSpan | None
+        """
+
+        parent = Tracer.__CURRENT_SPAN.get()
+        if parent is Tracer.__UNSAMPLED_SPAN:
+            return None
+
+        if parent is None and self.__sample_rate < 1.0 and random.random() >= self.__sample_rate:
+            Tracer.__CURRENT_SPAN.set(Tracer.__UNSAMPLED_SPAN)
+            return Tracer.__UNSAMPLED_SPAN
+
+        # TODO https://github.com/PyCQA/pylint/issues/6550
+        span = TraceSpan( # pylint: disable=unexpected-keyword-arg
+            span_id=next(Tracer.__SPAN_IDS),
+            parent=parent,
+            name=name,
+            category=category,
+            attributes=attributes,
+            thread_id=threading.get_ident(),
+            start_time_ns=time.perf_counter_ns()
+        )
+        Tracer.__CURRENT_SPAN.set(span)
+        if parent is None:
+            Tracer.__CURRENT_TRACER.set(self)
+        for listener in self.__listeners:
+            listener.on_span_started(span)
+
+        return span
+
+    def end_span(self, span: TraceSpan | None) -> None:
+        """Ends the specified span, making its parent the current span again.
+
+        :param span: The span returned by :meth:`start_span`.
+        :type span: TraceSpan | None
+        """
+
+        if span is None:
+            return
+
+        if span is Tracer.__UNSAMPLED_SPAN:
+            Tracer.__CURRENT_SPAN.set(None)
+            return
+
+        span.end_time_ns = time.perf_counter_ns()
+        Tracer.__CURRENT_SPAN.set(span.parent)
+        if span.parent is None:
+            Tracer.__CURRENT_TRACER.set(None)
+        for listener in self.__listeners:
+            listener.on_span_ended(span)
@@ -1,4 +1,20 @@
 """Utilities for various types."""
 
-from .dict_utils import get_or_add
-from .type_utils import get_dependent_contracts, get_generic_type_parameters, get_or_add_attribute
+from typing import TYPE_CHECKING
+
+from .module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .dict_utils import get_or_add
+    from .type_utils import (
+        get_dependent_contract, get_dependent_contracts, get_generic_type_parameters,
+        get_or_add_attribute, get_type_by_name, get_type_name
+    )
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "dict_utils": ("get_or_add",),
+    "type_utils": (
+        "get_dependent_contract", "get_dependent_contracts", "get_generic_type_parameters",
+        "get_or_add_attribute", "get_type_by_name", "get_type_name"
+    )
+})
@@ -0,0 +1,45 @@
+"""Utility methods for modules."""
+
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+def create_lazy_exports(
+    package_name: str,
+    exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Creates the module-level ``__getattr__`` and ``__dir__`` functions of a package
+    that import the modules of its public members only when the members are first accessed.
+
+    The imported members are stored in the package, hence they're looked up only once.
+
+    :param package_name: The name of the package.
+    :type package_name: str
+    :param exports: The names of the public members keyed by the names
+        of their modules, relative to the package.
+    :type exports: Mapping[str, Iterable[str]]
+    :return: The ``__getattr__`` and the ``__dir__`` functions of the package.
+    :rtype: tuple[Callable[[str], Any], Callable[[], list[str]]]
+    """
+
+    module_names = {
+        member_name: module_name
+        for module_name, member_names in exports.items()
+        for member_name in member_names
+    }
+
+    def get_attribute(name: str) -> Any:
+        if (module_name := module_names.get(name)) is None:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        # Unlike importlib, the built-in import function reports the import to "-X importtime".
+        module_name = f"{package_name}.{module_name}"
+        __import__(module_name)
+        value = getattr(sys.modules[module_name], name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def get_attribute_names() -> list[str]:
+        return sorted({*vars(sys.modules[package_name]), *module_names})
+
+    return get_attribute, get_attribute_names
@@ -1,10 +1,17 @@
 """Utility methods for types."""
 
+import collections.abc
+import functools
+import importlib
 import inspect
+import types
 from collections.abc import Callable, Generator
-from typing import Generic, Protocol, TypeVar, get_args, get_origin
+from typing import Generic, Protocol, TypeVar, Union, get_args, get_origin
 
-from kanata.exceptions import DependencyResolutionException
+from kanata.exceptions import ArgumentException, DependencyResolutionException
+from kanata.factory import Factory
+from kanata.models import DependencyKind, DependentContract
+from kanata.provider import Provider
 
 TAttribute = TypeVar("TAttribute")
 
@@ -32,14 +39,14 @@ def get_or_add_attribute(
         setattr(clazz, name, attribute)
     return attribute
 
-def get_dependent_contracts(injectable: type) -> Generator[tuple[type, bool], None, None]:
+def get_dependent_contracts(injectable: type) -> Generator[DependentContract, None, None]:
     """Gets the types of contracts the specified injectable depends on.
 
     :param injectable: The injectable for which to get the contracts.
     :type injectable: type
     :raises DependencyResolutionException: Raised when the type is not a valid injectable.
-    :yield: The type of the contract and whether multiple instances are allowed.
-    :rtype: Generator[tuple[type, bool], None, None]
+    :yield: The type of the contract and the way it is injected.
+    :rtype: Generator[DependentContract, None, None]
     """
 
     constructor = getattr(injectable, "__init__", None)
@@ -56,6 +63,18 @@ def get_dependent_contracts(injectable: type) -> Generator[tuple[type, bool], No
             )
         yield __unpack_dependent_intf(descriptor.annotation)
 
+def get_dependent_contract(annotation: type) -> DependentContract:
+    """Gets the contract described by the specified type annotation.
+
+    :param annotation: The type annotation of a parameter.
+    :type annotation: type
+    :raises DependencyResolutionException: Raised when the annotation is not a valid contract.
+    :return: The type of the contract and the way it is injected.
+    :rtype: DependentContract
+    """
+
+    return __unpack_dependent_intf(annotation)
+
 def get_generic_type_parameters(typ: type) -> tuple[type, ...]:
     """Gets the generic type parameters of the specified type, if there are any.
 
@@ -75,13 +94,83 @@ def get_generic_type_parameters(typ: type) -> tuple[type, ...]:
         for generic_type_parameter in get_args(orig_base)
     ))
 
-def __unpack_dependent_intf(contract: type) -> tuple[type, bool]:
+def get_type_name(typ: type) -> str:
+    """Gets the fully qualified name of the specified type,
+    including the names of its generic type arguments, if there are any.
+
+    :param typ: The type to get the name of.
+    :type typ: type
+    :return: The name of the type in the format of ``module:qualname[arguments]``.
+    :rtype: str
+    """
+
+    if origin := get_origin(typ):
+        arguments = ", ".join(get_type_name(argument) for argument in get_args(typ))
+        return f"{get_type_name(origin)}[{arguments}]"
+
+    if not (qualname := getattr(typ, "__qualname__", None)):
+        return repr(typ)
+
+    return f"{typ.__module__}:{qualname}"
+
+def get_type_by_name(name: str) -> type:
+    """Gets the type with the specified fully qualified name,
+    importing its module if necessary. This is the inverse of :func:`get_type_name`.
+
+    :param name: The name of the type in the format of ``module:qualname[arguments]``.
+    :type name: str
+    :raises ArgumentException: Raised when the type cannot be found.
+    :return: The type with the specified name.
+    :rtype: type
+    """
+
+    if name.endswith("]") and (start := name.find("[")) != -1:
+        origin = get_type_by_name(name[:start])
+        arguments = tuple(map(get_type_by_name, __split_type_arguments(name[start + 1:-1])))
+        # Ignoring the type here, because the linter isn't aware the origin is a Generic[T].
+        return origin[arguments if len(arguments) > 1 else arguments[0]] # type: ignore
+
+    module_name, separator, qualname = name.partition(":")
+    if not separator:
+        raise ArgumentException("name", name, "The type name is missing the module name.")
+
+    try:
+        module = importlib.import_module(module_name)
+        return functools.reduce(getattr, qualname.split("."), module)
+    except (ImportError, AttributeError) as error:
+        raise ArgumentException("name", name, f"The type '{name}' cannot be found.") from error
+
+def __split_type_arguments(arguments: str) -> Generator[str, None, None]:
+    depth = 0
+    start = 0
+    for index, character in enumerate(arguments):
+        if character == "[":
+            depth += 1
+        elif character == "]":
+            depth -= 1
+        elif character == "," and depth == 0:
+            yield arguments[start:index].strip()
+            start = index + 1
+    yield arguments[start:].strip()
+
+def __unpack_dependent_intf(contract: type) -> DependentContract:
+    generic_origin = get_origin(contract)
+    if generic_origin is Provider:
+        return DependentContract(get_args(contract)[0], DependencyKind.PROVIDER)
+
+    # The type arguments of a Callable are the parameters followed by the return type.
+    if generic_origin is Factory or generic_origin is collections.abc.Callable:
+        return DependentContract(get_args(contract)[-1], DependencyKind.FACTORY)
+
+    if generic_origin is Union or generic_origin is types.UnionType:
+        return __unpack_optional_dependent_intf(contract)
+
     if (
         getattr(contract, "_is_protocol", False) # typing.Protocol
         or getattr(contract, "__abstractmethods__", None) # abc.ABCMeta
         or (origin := getattr(contract, "__origin__", None)) is None
     ):
-        return (contract, False)
+        return DependentContract(contract, DependencyKind.INSTANCE)
 
     if origin is not tuple:
         raise DependencyResolutionException(
@@ -95,4 +184,21 @@ def __unpack_dependent_intf(contract: type) -> tuple[type, bool]:
             contract,
             "Expected a tuple with two arguments, the second being an ellipsis."
         )
-    return (args[0], True)
+    return DependentContract(args[0], DependencyKind.TUPLE)
+
+def __unpack_optional_dependent_intf(contract: type) -> DependentContract:
+    args = tuple(arg for arg in get_args(contract) if arg is not type(None))
+    if len(args) != 1 or len(get_args(contract)) != 2:
+        raise DependencyResolutionException(
+            contract,
+            "Expected an optional contract, with None being the only alternative."
+        )
+
+    dependent_contract = __unpack_dependent_intf(args[0])
+    if dependent_contract.kind != DependencyKind.INSTANCE:
+        raise DependencyResolutionException(
+            contract,
+            "Only the dependencies on single instances may be optional."
+        )
+
+    return DependentContract(dependent_contract.contract, DependencyKind.OPTIONAL)
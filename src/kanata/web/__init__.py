@@ -0,0 +1,24 @@
+"""Framework-agnostic ASGI and WSGI integration."""
+
+from typing import TYPE_CHECKING
+
+from kanata.utils.module_utils import create_lazy_exports
+
+if TYPE_CHECKING:
+    from .asgi_middleware import LifetimeScopeAsgiMiddleware
+    from .asgi_request import AsgiRequest
+    from .request_scope import LIFETIME_SCOPE_KEY, get_request_scope
+    from .request_scope_metrics import RequestScopeMetrics
+    from .request_scope_metrics_snapshot import RequestScopeMetricsSnapshot
+    from .wsgi_middleware import LifetimeScopeWsgiMiddleware
+    from .wsgi_request import WsgiRequest
+
+__getattr__, __dir__ = create_lazy_exports(__name__, {
+    "asgi_middleware": ("LifetimeScopeAsgiMiddleware",),
+    "asgi_request": ("AsgiRequest",),
+    "request_scope": ("LIFETIME_SCOPE_KEY", "get_request_scope"),
+    "request_scope_metrics": ("RequestScopeMetrics",),
+    "request_scope_metrics_snapshot": ("RequestScopeMetricsSnapshot",),
+    "wsgi_middleware": ("LifetimeScopeWsgiMiddleware",),
+    "wsgi_request": ("WsgiRequest",)
+})
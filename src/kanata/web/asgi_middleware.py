@@ -0,0 +1,80 @@
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from typing import Any
+
+from kanata.ilifetime_scope import ILifetimeScope
+from kanata.lifetime_scope_pool import LifetimeScopePool
+from .asgi_request import AsgiRequest
+from .request_scope import LIFETIME_SCOPE_KEY, reset_request_scope, set_request_scope
+from .request_scope_metrics import RequestScopeMetrics
+
+AsgiReceive = Callable[[], Awaitable[MutableMapping[str, Any]]]
+AsgiSend = Callable[[MutableMapping[str, Any]], Awaitable[None]]
+AsgiApp = Callable[[MutableMapping[str, Any], AsgiReceive, AsgiSend], Awaitable[None]]
+
+class LifetimeScopeAsgiMiddleware:
+    """ASGI middleware that handles each HTTP and WebSocket connection
+    in its own child lifetime scope.
+
+    The child scopes are pooled, the request is added to its scope
+    as an instance of :class:`AsgiRequest`, and the scope is disposed of
+    asynchronously once the connection has been handled.
+    """
+
+    __SCOPE_TYPES = frozenset(("http", "websocket"))
+
+    def __init__(
+        self,
+        app: AsgiApp,
+        lifetime_scope: ILifetimeScope,
+        pool_capacity: int | None = None
+    ) -> None:
+        """Initializes a new instance.
+
+        :param app: The ASGI application to be wrapped.
+        :type app: AsgiApp
+        :param lifetime_scope: The lifetime scope the per-request scopes are children of.
+        :type lifetime_scope: ILifetimeScope
+        :param pool_capacity: The maximum number of idle scopes kept for reuse, defaults to None.
+        :type pool_capacity: int | None, optional
+        """
+
+        self.__app = app
+        self.__scope_pool = LifetimeScopePool(lifetime_scope.create_child_scope, pool_capacity)
+        self.__metrics = RequestScopeMetrics()
+
+    @property
+    def metrics(self) -> RequestScopeMetrics:
+        """Gets the metrics of the overhead of the per-request scopes.
+
+        :return: The metrics of the overhead of the per-request scopes.
+        :rtype: RequestScopeMetrics
+        """
+
+        return self.__metrics
+
+    async def __call__(
+        self,
+        scope: MutableMapping[str, Any],
+        receive: AsgiReceive,
+        send: AsgiSend
+    ) -> None:
+        if scope["type"] not in LifetimeScopeAsgiMiddleware.__SCOPE_TYPES:
+            await self.__app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter_ns()
+        request_scope = self.__scope_pool.acquire()
+        # Middleware must not modify the scope it receives, hence the copy.
+        scope = {**scope, LIFETIME_SCOPE_KEY: request_scope}
+        request = AsgiRequest(scope=scope, receive=receive, send=send)
+        request_scope.add_instance(AsgiRequest, request)
+        token = set_request_scope(request_scope)
+        overhead_ns = time.perf_counter_ns() - started_at
+        try:
+            await self.__app(scope, receive, send)
+        finally:
+            reset_request_scope(token)
+            disposal_started_at = time.perf_counter_ns()
+            await self.__scope_pool.release_async(request_scope)
+            self.__metrics.record(overhead_ns + time.perf_counter_ns() - disposal_started_at)
@@ -0,0 +1,19 @@
+from collections.abc import Awaitable, Callable, MutableMapping
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass(frozen=True, kw_only=True, eq=False)
+class AsgiRequest:
+    """The ASGI request handled by a per-request lifetime scope.
+
+    To be injectable, it must be registered as a scoped injectable.
+    """
+
+    scope: MutableMapping[str, Any]
+    """The ASGI connection scope."""
+
+    receive: Callable[[], Awaitable[MutableMapping[str, Any]]]
+    """The ASGI callable used for receiving messages."""
+
+    send: Callable[[MutableMapping[str, Any]], Awaitable[None]]
+    """The ASGI callable used for sending messages."""
@@ -0,0 +1,45 @@
+"""Access to the lifetime scope of the current request."""
+
+from contextvars import ContextVar, Token
+
+from kanata.ilifetime_scope import ILifetimeScope
+
+LIFETIME_SCOPE_KEY = "kanata.lifetime_scope"
+"""The key of the per-request lifetime scope in the ASGI scope and the WSGI environment."""
+
+_CURRENT_SCOPE = ContextVar[ILifetimeScope | None]("kanata_request_scope", default=None)
+
+def get_request_scope() -> ILifetimeScope:
+    """Gets the lifetime scope of the request being handled in the current context.
+
+    Typically used with the ``@inject(get_request_scope)`` decorator.
+
+    :raises LookupError: Raised when no request is being handled in the current context.
+    :return: The lifetime scope of the current request.
+    :rtype: ILifetimeScope
+    """
+
+    if (lifetime_scope := _CURRENT_SCOPE.get()) is None:
+        raise LookupError("There is no request being handled in the current context.")
+
+    return lifetime_scope
+
+def set_request_scope(lifetime_scope: ILifetimeScope | None) -> Token:
+    """Sets the lifetime scope of the request being handled in the current context.
+
+    :param lifetime_scope: The lifetime scope of the current request.
+    :type lifetime_scope: ILifetimeScope | None
+    :return: A token that can be used for restoring the previous lifetime scope.
+    :rtype: Token
+    """
+
+    return _CURRENT_SCOPE.set(lifetime_scope)
+
+def reset_request_scope(token: Token) -> None:
+    """Restores the lifetime scope that was current before the specified token was issued.
+
+    :param token: The token issued when the lifetime scope was set.
+    :type token: Token
+    """
+
+    _CURRENT_SCOPE.reset(token)
@@ -0,0 +1,50 @@
+import threading
+
+from .request_scope_metrics_snapshot import RequestScopeMetricsSnapshot
+
+class RequestScopeMetrics:
+    """Thread-safe metrics of the overhead of per-request lifetime scopes.
+
+    The overhead consists of acquiring the scope of a request, registering the request
+    in it, and disposing of the scope, but not of resolving any of the injectables.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__request_count = 0
+        self.__total_overhead_ns = 0
+        self.__max_overhead_ns = 0
+
+    def record(self, overhead_ns: int) -> None:
+        """Records the overhead of managing the scope of a single request.
+
+        :param overhead_ns: The overhead of the request, in nanoseconds.
+        :type overhead_ns: int
+        """
+
+        with self.__lock:
+            self.__request_count += 1
+            self.__total_overhead_ns += overhead_ns
+            self.__max_overhead_ns = max(self.__max_overhead_ns, overhead_ns)
+
+    def snapshot(self) -> RequestScopeMetricsSnapshot:
+        """Gets a consistent view of the metrics recorded so far.
+
+        :return: The metrics recorded so far.
+        :rtype: RequestScopeMetricsSnapshot
+        """
+
+        with self.__lock:
+            return RequestScopeMetricsSnapshot(
+                request_count=self.__request_count,
+                total_overhead_ns=self.__total_overhead_ns,
+                max_overhead_ns=self.__max_overhead_ns
+            )
+
+    def reset(self) -> None:
+        """Discards the metrics recorded so far."""
+
+        with self.__lock:
+            self.__request_count = 0
+            self.__total_overhead_ns = 0
+            self.__max_overhead_ns = 0
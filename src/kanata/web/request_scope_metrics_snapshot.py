@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True, kw_only=True)
+class RequestScopeMetricsSnapshot:
+    """A point-in-time view of the overhead of per-request lifetime scopes."""
+
+    request_count: int
+    """The number of handled requests."""
+
+    total_overhead_ns: int
+    """The total time spent on managing the per-request scopes, in nanoseconds."""
+
+    max_overhead_ns: int
+    """The longest time spent on managing the scope of a single request, in nanoseconds."""
+
+    @property
+    def average_overhead_ns(self) -> float:
+        """Gets the average time spent on managing the scope of a request, in nanoseconds.
+
+        :return: The average overhead per request, or zero if there were no requests.
+        :rtype: float
+        """
+
+        return self.total_overhead_ns / self.request_count if self.request_count else 0.0
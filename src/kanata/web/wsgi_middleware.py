@@ -0,0 +1,129 @@
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from kanata.ilifetime_scope import ILifetimeScope
+from kanata.lifetime_scope_pool import LifetimeScopePool
+from .request_scope import LIFETIME_SCOPE_KEY, reset_request_scope, set_request_scope
+from .request_scope_metrics import RequestScopeMetrics
+from .wsgi_request import WsgiRequest
+
+WsgiApp = Callable[[dict[str, Any], Callable[..., Any]], Iterable[bytes]]
+
+class _ScopedResponse:
+    # WSGI servers call close() on the response even if it's never iterated,
+    # unlike the cleanup of a generator that would run only once started.
+    def __init__(
+        self,
+        response: Iterable[bytes],
+        request_scope: ILifetimeScope,
+        on_close: Callable[[], None]
+    ) -> None:
+        self.__response = response
+        self.__request_scope = request_scope
+        self.__on_close: Callable[[], None] | None = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        # The body may be produced lazily, possibly in another context than the one
+        # of the application, hence the scope of the request is set for each chunk.
+        token = set_request_scope(self.__request_scope)
+        try:
+            iterator = iter(self.__response)
+        finally:
+            reset_request_scope(token)
+
+        while True:
+            token = set_request_scope(self.__request_scope)
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                reset_request_scope(token)
+            yield chunk
+
+    def close(self) -> None:
+        """Closes the wrapped response while the scope of the request is set,
+        then releases the scope of the request.
+        """
+
+        token = set_request_scope(self.__request_scope)
+        try:
+            if close := getattr(self.__response, "close", None):
+                close()
+        finally:
+            reset_request_scope(token)
+            if on_close := self.__on_close:
+                self.__on_close = None
+                on_close()
+
+class LifetimeScopeWsgiMiddleware:
+    """WSGI middleware that handles each request in its own child lifetime scope.
+
+    The child scopes are pooled, the request is added to its scope
+    as an instance of :class:`WsgiRequest`, and the scope is disposed of
+    once the response has been sent and closed. The scope is returned by
+    :func:`get_request_scope` while the application is called, and also
+    while the body of the response is produced and closed.
+    """
+
+    def __init__(
+        self,
+        app: WsgiApp,
+        lifetime_scope: ILifetimeScope,
+        pool_capacity: int | None = None
+    ) -> None:
+        """Initializes a new instance.
+
+        :param app: The WSGI application to be wrapped.
+        :type app: WsgiApp
+        :param lifetime_scope: The lifetime scope the per-request scopes are children of.
+        :type lifetime_scope: ILifetimeScope
+        :param pool_capacity: The maximum number of idle scopes kept for reuse, defaults to None.
+        :type pool_capacity: int | None, optional
+        """
+
+        self.__app = app
+        self.__scope_pool = LifetimeScopePool(lifetime_scope.create_child_scope, pool_capacity)
+        self.__metrics = RequestScopeMetrics()
+
+    @property
+    def metrics(self) -> RequestScopeMetrics:
+        """Gets the metrics of the overhead of the per-request scopes.
+
+        :return: The metrics of the overhead of the per-request scopes.
+        :rtype: RequestScopeMetrics
+        """
+
+        return self.__metrics
+
+    def __call__(
+        self,
+        environ: dict[str, Any],
+        start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        started_at = time.perf_counter_ns()
+        request_scope = self.__scope_pool.acquire()
+        environ[LIFETIME_SCOPE_KEY] = request_scope
+        request_scope.add_instance(WsgiRequest, WsgiRequest(environ=environ))
+        token = set_request_scope(request_scope)
+        overhead_ns = time.perf_counter_ns() - started_at
+        try:
+            response = self.__app(environ, start_response)
+        except BaseException:
+            self.__release(request_scope, overhead_ns)
+            raise
+        finally:
+            reset_request_scope(token)
+
+        # The body may be produced lazily, hence the scope is kept until it's closed.
+        return _ScopedResponse(
+            response,
+            request_scope,
+            lambda: self.__release(request_scope, overhead_ns)
+        )
+
+    def __release(self, request_scope: ILifetimeScope, overhead_ns: int) -> None:
+        disposal_started_at = time.perf_counter_ns()
+        self.__scope_pool.release(request_scope)
+        self.__metrics.record(overhead_ns + time.perf_counter_ns() - disposal_started_at)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Any
+
+@dataclass(frozen=True, kw_only=True, eq=False)
+class WsgiRequest:
+    """The WSGI request handled by a per-request lifetime scope.
+
+    To be injectable, it must be registered as a scoped injectable.
+    """
+
+    environ: dict[str, Any]
+    """The WSGI environment of the request."""
@@ -0,0 +1,28 @@
+import unittest
+
+from benchmarks.resolution_benchmarks import compare_results, run_benchmarks
+from benchmarks.synthetic_graphs import GRAPH_FACTORIES
+
+class BenchmarkTests(unittest.TestCase):
+    """Unit tests for the benchmarks of the resolution of synthetic graphs."""
+
+    def test_run_benchmarks_should_resolve_every_synthetic_graph(self):
+        """Asserts that the root of each synthetic graph is resolvable
+        and that the results of a run can be compared to themselves.
+        """
+
+        results = run_benchmarks(sizes=(10,), time_budget=0.0)
+
+        self.assertEqual(
+            tuple(result["graph"] for result in results["results"]),
+            tuple(GRAPH_FACTORIES)
+        )
+        for result in results["results"]:
+            self.assertGreater(result["plan_step_count"], 0)
+            self.assertGreater(result["resolve_ns"]["count"], 0)
+            self.assertGreater(result["requests_per_second"], 0)
+
+        lines, has_regression = compare_results(results, results)
+
+        self.assertFalse(has_regression)
+        self.assertEqual(len(lines), 1 + 3 * len(GRAPH_FACTORIES))
@@ -0,0 +1,94 @@
+import json
+import unittest
+
+from kanata import Provider, analyze_dependencies
+from kanata.catalogs import InjectableCatalogBuilder
+from kanata.dependency_analysis import format_report_as_json, format_report_as_text
+from kanata.models import InjectableScopeType
+from kanata.utils import get_type_name
+
+class _Settings:
+    pass
+
+class _Left:
+    def __init__(self, settings: _Settings) -> None:
+        pass
+
+class _Right:
+    def __init__(self, settings: _Settings) -> None:
+        pass
+
+class _Lazy:
+    pass
+
+class _Root:
+    def __init__(self, left: _Left, right: _Right, lazy: Provider[_Lazy]) -> None:
+        pass
+
+def _create_catalog():
+    return (InjectableCatalogBuilder()
+        .register_instance(_Settings(), (_Settings,))
+        .register_type(_Left, (_Left,), InjectableScopeType.SINGLETON)
+        .register_type(_Right, (_Right,))
+        .register_type(_Lazy, (_Lazy,))
+        .register_type(_Root, (_Root,))
+        .build()
+    )
+
+class DependencyAnalysisTests(unittest.TestCase):
+    """Unit tests for analyzing the dependency graphs of catalogs."""
+
+    def test_analyze_dependencies_should_report_the_shape_of_the_graph(self):
+        """Asserts that the closures, the depths, the fan-ins, the fan-outs
+        and the scopes of a diamond-shaped graph are reported,
+        excluding the dependencies injected via providers.
+        """
+
+        report = analyze_dependencies(_create_catalog())
+        analyses = {analysis.name: analysis for analysis in report.injectables}
+
+        root = analyses[get_type_name(_Root)]
+        self.assertIs(report.injectables[0], root)
+        self.assertEqual(root.closure_size, 3)
+        self.assertEqual(root.depth, 2)
+        self.assertEqual(root.fan_in, 0)
+        self.assertEqual(root.fan_out, 2)
+        self.assertEqual(root.scope_counts, {"singleton": 2, "transient": 2})
+        settings = analyses[get_type_name(_Settings)]
+        self.assertEqual(settings.fan_in, 2)
+        self.assertEqual(settings.closure_size, 0)
+        self.assertEqual(analyses[get_type_name(_Lazy)].fan_in, 0)
+        self.assertEqual(len(report.critical_path), 3)
+        self.assertIsNone(report.critical_path_time_ns)
+
+    def test_analyze_dependencies_should_weigh_the_critical_path_by_the_timings(self):
+        """Asserts that the critical path is the most expensive chain of constructions."""
+
+        construction_times_ns = {
+            get_type_name(_Root): 10.0,
+            get_type_name(_Left): 20.0,
+            get_type_name(_Right): 500.0
+        }
+
+        report = analyze_dependencies(_create_catalog(), construction_times_ns)
+
+        self.assertEqual(
+            report.critical_path,
+            (get_type_name(_Root), get_type_name(_Right), get_type_name(_Settings))
+        )
+        self.assertEqual(report.critical_path_time_ns, 510.0)
+
+    def test_format_report_should_produce_stable_text_and_json(self):
+        """Asserts that the reports of the same graph are formatted identically."""
+
+        report = analyze_dependencies(_create_catalog())
+
+        document = json.loads(format_report_as_json(report))
+        self.assertEqual(len(document["injectables"]), 5)
+        self.assertEqual(
+            format_report_as_json(report),
+            format_report_as_json(analyze_dependencies(_create_catalog()))
+        )
+        text = format_report_as_text(report)
+        self.assertIn(get_type_name(_Root), text)
+        self.assertIn("Longest chain (3 injectables):", text)
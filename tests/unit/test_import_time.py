@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# The cumulative import time of the root package, in microseconds.
+# Importing everything eagerly took about 100 milliseconds.
+_IMPORT_TIME_BUDGET = 50_000
+
+# The modules that are expected to be imported only when their features are used.
+_DEFERRED_MODULES = frozenset((
+    "asyncio",
+    "ast",
+    "concurrent.futures",
+    "kanata.graphs",
+    "kanata.injectable_discovery",
+    "kanata.lifetime_scope",
+    "kanata.tracing",
+    "pkgutil",
+    "structlog"
+))
+
+def _measure_import(statement: str) -> dict[str, int]:
+    result = subprocess.run(
+        (sys.executable, "-X", "importtime", "-c", statement),
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+        text=True
+    )
+    cumulative_times = dict[str, int]()
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self> | <cumulative> | <indented module name>"
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        _, cumulative_time, module_name = line.split("|")
+        if (module_name := module_name.strip()) and cumulative_time.strip().isdigit():
+            cumulative_times[module_name] = int(cumulative_time)
+
+    return cumulative_times
+
+class ImportTimeTests(unittest.TestCase):
+    """Regression tests for the cost of importing the framework."""
+
+    def test_import_should_defer_the_modules_of_unused_features(self):
+        """Asserts that importing the root package doesn't import
+        the modules of the features that aren't used.
+        """
+
+        cumulative_times = _measure_import("import kanata")
+
+        self.assertIn("kanata", cumulative_times)
+        self.assertFalse(_DEFERRED_MODULES.intersection(cumulative_times))
+
+    def test_import_should_stay_within_budget(self):
+        """Asserts that importing the root package stays within the import time budget."""
+
+        # The best of a few runs, to tolerate the noise of the machine.
+        import_time = min(_measure_import("import kanata")["kanata"] for _ in range(3))
+
+        self.assertLess(import_time, _IMPORT_TIME_BUDGET)
+
+    def test_attribute_access_should_import_the_member_on_demand(self):
+        """Asserts that the members of the packages are imported on their first access."""
+
+        cumulative_times = _measure_import("from kanata import load_container")
+
+        self.assertIn("kanata.container_compiler", cumulative_times)
+        self.assertNotIn("kanata.injectable_discovery", cumulative_times)
+        self.assertNotIn("asyncio", cumulative_times)
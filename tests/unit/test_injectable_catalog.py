@@ -1,12 +1,20 @@
+import sys
 import unittest
 from typing import cast
 
 from tests.sdk import assert_contains, assert_contains_all
 
-from kanata import find_injectables
-from kanata.catalogs import InjectableCatalog, InjectableCatalogBuilder
-from kanata.models import InjectableInstanceRegistration, InjectableTypeRegistration
+from kanata import LifetimeScope, find_injectables
+from kanata.catalogs import (
+    InjectableCatalog, InjectableCatalogBuilder, LazyInjectableCatalog, OverlayInjectableCatalog
+)
+from kanata.models import (
+    InjectableInstanceRegistration, InjectableScopeType, InjectableTypeRegistration,
+    ManifestRegistration
+)
+from kanata.utils import get_type_name
 from .test_injectables import ISingleton, ITransient1, Singleton, Transient1
+from .test_lazy_injectables.ilazy_service import ILazyService
 
 class _TestInstanceService(ISingleton):
     pass
@@ -68,5 +76,67 @@ class InjectableCatalogTests(unittest.TestCase):
         )
         assert_contains(instance_registrations, lambda i: isinstance(i.injectable_instance, _TestInstanceService))
 
+    def test_is_registered_should_return_whether_there_are_matching_registrations(self):
+        """Asserts that the catalog tells whether a contract or an injectable is registered."""
+
+        registrations = find_injectables("tests.unit.test_injectables")
+        catalog = InjectableCatalog(registrations)
+
+        self.assertTrue(catalog.is_registered(ISingleton))
+        self.assertTrue(catalog.is_registered(Singleton))
+        self.assertFalse(catalog.is_registered(_TestInstanceService))
+
+    def test_overlay_should_serve_overridden_contracts_from_the_overrides(self):
+        """Asserts that an overlay catalog serves the overridden contracts
+        exclusively from the overrides and the rest of them from the base catalog.
+        """
+
+        base = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        override = InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
+            injectable_type=_TestInstanceService,
+            contract_types={ISingleton},
+            scope=InjectableScopeType.SINGLETON
+        )
+        catalog = OverlayInjectableCatalog(base, (override,))
+
+        self.assertEqual(catalog.get_registrations_by_contract(ISingleton), (override,))
+        self.assertEqual(
+            catalog.get_registrations_by_contract(ITransient1),
+            base.get_registrations_by_contract(ITransient1)
+        )
+        self.assertIs(catalog.get_registration_by_injectable(_TestInstanceService), override)
+        self.assertIs(
+            catalog.get_registration_by_injectable(Singleton),
+            base.get_registration_by_injectable(Singleton)
+        )
+        self.assertTrue(catalog.is_overridden(ISingleton))
+        self.assertFalse(catalog.is_overridden(ITransient1))
+        self.assertEqual(len(catalog.get_registrations()), len(base.get_registrations()) + 1)
+
+    def test_lazy_catalog_should_import_the_injectables_on_first_demand(self):
+        """Asserts that a lazy catalog imports the module of an injectable
+        only when its registration is requested.
+        """
+
+        module_name = "tests.unit.test_lazy_injectables.lazy_service"
+        reference = ManifestRegistration( # pylint: disable=unexpected-keyword-arg
+            module_name=module_name,
+            qualname="LazyService",
+            contract_types=(get_type_name(ILazyService),),
+            scope=InjectableScopeType.TRANSIENT,
+            is_generic=False,
+            time_to_live=None,
+            refresh_in_background=True
+        )
+        catalog = LazyInjectableCatalog((reference,))
+
+        self.assertTrue(catalog.is_registered(ILazyService))
+        self.assertNotIn(module_name, sys.modules)
+
+        instance = LifetimeScope(catalog).resolve(ILazyService)
+
+        self.assertIn(module_name, sys.modules)
+        self.assertIs(type(instance), getattr(sys.modules[module_name], "LazyService"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,4 @@
+"""Injectables that are imported only by a lazy catalog.
+
+The modules of the injectables mustn't be imported by this package.
+"""
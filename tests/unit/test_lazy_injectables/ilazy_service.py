@@ -0,0 +1,2 @@
+class ILazyService:
+    """Interface for an injectable imported on demand."""
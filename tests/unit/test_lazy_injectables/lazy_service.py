@@ -0,0 +1,6 @@
+from .ilazy_service import ILazyService
+from kanata.decorators import injectable
+
+@injectable(ILazyService)
+class LazyService(ILazyService):
+    """An injectable imported on demand."""
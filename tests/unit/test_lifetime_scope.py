@@ -1,12 +1,29 @@
+import asyncio
+import gc
+import os
+import pickle
+import threading
+import time
 import unittest
-from typing import Any, Generic, Protocol, TypeVar
+import warnings
+from collections.abc import Callable
+from typing import Any, Generic, Optional, Protocol, TypeVar
 
 from tests.sdk import assert_contains, assert_contains_unique
 
-from kanata import LifetimeScope, find_injectables
+from kanata import (
+    Factory, ILifetimeScope, KeyedScopeCache, LifetimeScope, LifetimeScopeOptions, Provider,
+    compile_container, find_injectables, load_container
+)
 from kanata.catalogs import InjectableCatalog, InjectableCatalogBuilder
-from kanata.exceptions import DependencyResolutionException
-from kanata.models import InjectableRegistration, InjectableScopeType
+from kanata.decorators import inject
+from kanata.exceptions import (
+    ArgumentException, DependencyResolutionException, InjectableRegistrationException
+)
+from kanata.loggers import ILogger, get_logger, set_logger
+from kanata.models import (
+    InjectableInstanceRegistration, InjectableRegistration, InjectableScopeType
+)
 from kanata.resolvers import DefaultResolver, DefaultResolverOptions, IResolver, ResolverContext
 from .test_injectables import (
     MissingMultipleDependencies, MissingSingleDependency, ProtocolDependent, ProtocolImpl, Root,
@@ -22,6 +39,13 @@ class _ITestService:
 class _TestInstanceService(_ITestService):
     pass
 
+class _ForkAwareService(_ITestService):
+    def __init__(self) -> None:
+        self.is_reinitialized = False
+
+    def after_fork(self) -> None:
+        self.is_reinitialized = True
+
 class _InstanceDependent:
     def __init__(
         self,
@@ -86,6 +110,109 @@ class _RootWithListOfGenericDependencies:
     ) -> None:
         self.generics = list(generics)
 
+class _DisposableService:
+    def __init__(self) -> None:
+        self.is_disposed = False
+
+    def dispose(self) -> None:
+        self.is_disposed = True
+
+class _ProviderDependent:
+    def __init__(self, provider: Provider[_ITestService]) -> None:
+        self.provider = provider
+
+class _ProviderDependentHolder:
+    def __init__(self, dependent: _ProviderDependent) -> None:
+        self.dependent = dependent
+
+class _UnitOfWork:
+    pass
+
+class _UnitOfWorkDependent1:
+    def __init__(self, unit_of_work: _UnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+class _UnitOfWorkDependent2:
+    def __init__(self, unit_of_work: _UnitOfWork) -> None:
+        self.unit_of_work = unit_of_work
+
+class _UnitOfWorkRoot:
+    def __init__(
+        self,
+        dependent1: _UnitOfWorkDependent1,
+        dependent2: _UnitOfWorkDependent2
+    ) -> None:
+        self.dependent1 = dependent1
+        self.dependent2 = dependent2
+
+class _ItemHandler:
+    def __init__(self, service: _DisposableService) -> None:
+        self.service = service
+
+    def __call__(self, item: int) -> tuple[int, _DisposableService]:
+        return item * 2, self.service
+
+class _AsyncItemHandler(_ItemHandler):
+    async def __call__(self, item: int) -> tuple[int, _DisposableService]:
+        await asyncio.sleep(0)
+        return item * 2, self.service
+
+class _AsyncDisposableService:
+    def __init__(self) -> None:
+        self.is_disposed = False
+
+    async def dispose_async(self) -> None:
+        await asyncio.sleep(0)
+        self.is_disposed = True
+
+class _AsyncDisposableItemHandler:
+    def __init__(self, service: _AsyncDisposableService) -> None:
+        self.service = service
+
+    async def __call__(self, item: int) -> tuple[int, _AsyncDisposableService]:
+        await asyncio.sleep(0)
+        return item * 2, self.service
+
+def _handle_request(
+    request_id: int,
+    service: _ITestService,
+    unit_of_work: _UnitOfWork,
+    dependent: _UnitOfWorkDependent1,
+    timeout: float = 1.0
+) -> tuple[int, _ITestService, _UnitOfWork, _UnitOfWorkDependent1, float]:
+    return request_id, service, unit_of_work, dependent, timeout
+
+class _RequestController:
+    def handle(self, request_id: int, service: _ITestService) -> tuple[int, _ITestService]:
+        return request_id, service
+
+class _OrderProcessor:
+    def __init__(self, order_id: int, service: _ITestService) -> None:
+        self.order_id = order_id
+        self.service = service
+
+class _OrderService:
+    def __init__(
+        self,
+        processor_factory: Factory[_OrderProcessor],
+        callable_processor_factory: Callable[..., _OrderProcessor]
+    ) -> None:
+        self.processor_factory = processor_factory
+        self.callable_processor_factory = callable_processor_factory
+
+class _OrderServiceHolder:
+    def __init__(self, order_service: _OrderService) -> None:
+        self.order_service = order_service
+
+class _OptionalDependent:
+    def __init__(
+        self,
+        service: _ITestService | None,
+        unit_of_work: Optional[_UnitOfWork]
+    ) -> None:
+        self.service = service
+        self.unit_of_work = unit_of_work
+
 class _NullResolver(IResolver):
     def resolve(
         self,
@@ -95,6 +222,66 @@ class _NullResolver(IResolver):
     ) -> Any:
         return None
 
+class _FalsyService(_ITestService):
+    def __bool__(self) -> bool:
+        return False
+
+class _InstanceOnlyResolver(IResolver):
+    def __init__(self) -> None:
+        self.resolved_types = list[type]()
+
+    def can_resolve(self, registration: InjectableRegistration) -> bool:
+        return isinstance(registration, InjectableInstanceRegistration)
+
+    def resolve(
+        self,
+        context: ResolverContext,
+        registration: InjectableRegistration,
+        injectable_type: type
+    ) -> Any:
+        self.resolved_types.append(injectable_type)
+        return getattr(registration, "injectable_instance")
+
+class _TransientServiceResolver(IResolver):
+    def __init__(self) -> None:
+        self.resolved_types = list[type]()
+
+    def can_resolve(self, registration: InjectableRegistration) -> bool:
+        return getattr(registration, "injectable_type", None) is _TestInstanceService
+
+    def resolve(
+        self,
+        context: ResolverContext,
+        registration: InjectableRegistration,
+        injectable_type: type
+    ) -> Any:
+        self.resolved_types.append(injectable_type)
+        return _TestInstanceService()
+
+class _StructuralResolver:
+    def resolve(
+        self,
+        context: ResolverContext,
+        registration: InjectableRegistration,
+        injectable_type: type
+    ) -> Any:
+        return _TestInstanceService()
+
+class _RecordingLogger(ILogger):
+    is_debug_enabled: bool = False
+
+    def __init__(self, is_debug_enabled: bool) -> None:
+        self.is_debug_enabled = is_debug_enabled
+        self.events = list[str]()
+
+    def debug(self, event: str, **kwargs: Any) -> None:
+        if not self.is_debug_enabled:
+            raise AssertionError(f"Unexpected debug event: {event}")
+        self.events.append(event)
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        self.events.append(event)
+
 class LifetimeScopeTests(unittest.TestCase):
     """Unit tests for lifetime scopes."""
 
@@ -382,6 +569,75 @@ class LifetimeScopeTests(unittest.TestCase):
             lambda: scope.resolve(Transient1)
         )
 
+    def test_resolve_should_call_only_the_resolver_of_the_registration(self):
+        """Asserts that each injectable is constructed by the first resolver
+        that can resolve its registration, and that falsy instances are reused.
+        """
+
+        instance = _TestInstanceService()
+        catalog = (InjectableCatalogBuilder()
+            .register_instance(instance, (_TestInstanceService,))
+            .register_type(_FalsyService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .build()
+        )
+        resolver = _InstanceOnlyResolver()
+        scope = LifetimeScope(catalog, (resolver, DefaultResolver()))
+
+        self.assertIs(scope.resolve(_TestInstanceService), instance)
+        falsy_instance = scope.resolve(_ITestService)
+        self.assertIsInstance(falsy_instance, _FalsyService)
+        self.assertIs(scope.create_child_scope().resolve(_ITestService), falsy_instance)
+        self.assertEqual(resolver.resolved_types, [_TestInstanceService])
+
+    def test_resolve_should_call_the_resolver_of_transient_dependencies(self):
+        """Asserts that transient dependencies are constructed
+        by the resolvers of their own registrations, not by the ones of their dependees.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,))
+            .register_type(_InstanceDependent, (_InstanceDependent,))
+            .build()
+        )
+        resolver = _TransientServiceResolver()
+        scope = LifetimeScope(catalog, (resolver, DefaultResolver()))
+
+        instance = scope.resolve(_InstanceDependent)
+
+        self.assertIsInstance(instance.test_service, _TestInstanceService)
+        self.assertEqual(resolver.resolved_types, [_TestInstanceService])
+
+    def test_resolve_should_call_resolvers_without_can_resolve(self):
+        """Asserts that resolvers that conform to the protocol structurally,
+        without defining whether they can resolve a registration, resolve all of them.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog, (_StructuralResolver(),))
+
+        self.assertIsInstance(scope.resolve(_ITestService), _TestInstanceService)
+
+    def test_resolve_should_log_only_when_debug_logging_is_enabled(self):
+        """Asserts that the lifetime scopes and the planners build no debug events
+        unless debug logging is enabled, and that they use the configured logger.
+        """
+
+        self.addCleanup(set_logger, get_logger())
+        registrations = find_injectables("tests.unit.test_injectables")
+        for is_debug_enabled in (False, True):
+            logger = _RecordingLogger(is_debug_enabled)
+            set_logger(logger)
+            scope = LifetimeScope(InjectableCatalog(registrations))
+
+            self.assertIsInstance(scope.resolve(Root), Root)
+            self.assertEqual(bool(logger.events), is_debug_enabled)
+            if is_debug_enabled:
+                self.assertIn("Found dependent contract", logger.events)
+                self.assertIn("Instantiated injectable", logger.events)
+
     def test_resolve_should_resolve_correctly_for_generic_type(self):
         """Asserts that the lifetime scope correctly resolves
         injectables registered in a generic fashion.
@@ -403,6 +659,28 @@ class LifetimeScopeTests(unittest.TestCase):
         self.assertIsNotNone(resolved_instance.generic1.value)
         self.assertIsNotNone(resolved_instance.generic2.value)
 
+    def test_load_container_should_restore_a_scope_from_a_pickled_container(self):
+        """Asserts that a lifetime scope restored from a pickled compiled container
+        resolves the same object graph as the scope of the original catalog.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_RootWithDifferentGenericDependencies, (_RootWithDifferentGenericDependencies,))
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .register_generic(_GenericImpl, (_IGeneric,))
+            .build()
+        )
+        container = compile_container(catalog, (_RootWithDifferentGenericDependencies,))
+
+        scope = load_container(pickle.loads(pickle.dumps(container)))
+        resolved_instance = scope.resolve(_RootWithDifferentGenericDependencies)
+
+        self.assertEqual(len(container.plans), 1)
+        self.assertEqual(len(container.closed_generic_types), 2)
+        self.assertIsInstance(resolved_instance.generic1.value, _GenericTypeArg1)
+        self.assertIsInstance(resolved_instance.generic2.value, _GenericTypeArg2)
+        self.assertIs(resolved_instance.generic1.test_service, scope.resolve(_ITestService))
+
     def test_resolve_should_resolve_correctly_for_generic_type_with_identical_singletons(self):
         """Asserts that the lifetime scope correctly resolves
         the same instance registered in a generic fashion.
@@ -479,5 +757,875 @@ class LifetimeScopeTests(unittest.TestCase):
             lambda: scope.resolve(_RootWithIdenticalGenericDependencies)
         )
 
+    def test_resolve_thread_injectable_should_resolve_one_instance_per_thread(self):
+        """Asserts that a thread-bound injectable is shared within a thread,
+        even across child scopes, but not between threads.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.THREAD)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        other_thread_instances = []
+        thread = threading.Thread(
+            target=lambda: other_thread_instances.append(scope.resolve(_DisposableService))
+        )
+
+        instance1 = scope.resolve(_DisposableService)
+        instance2 = scope.create_child_scope().resolve(_DisposableService)
+        thread.start()
+        thread.join()
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(len(other_thread_instances), 1)
+        self.assertIsNot(instance1, other_thread_instances[0])
+
+    def test_thread_injectable_should_be_disposed_when_thread_ends(self):
+        """Asserts that a thread-bound injectable is disposed of when its thread ends."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.THREAD)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        instances = []
+        thread = threading.Thread(
+            target=lambda: instances.append(scope.resolve(_DisposableService))
+        )
+
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        self.assertTrue(instances[0].is_disposed)
+
+    def test_resolve_context_injectable_should_resolve_one_instance_per_task(self):
+        """Asserts that a context-bound injectable is shared within a task,
+        but not between tasks, and that it is disposed of when its task is done.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.CONTEXT)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        async def resolve_twice() -> tuple[Any, Any]:
+            instance = scope.resolve(_DisposableService)
+            await asyncio.sleep(0)
+            return instance, scope.create_child_scope().resolve(_DisposableService)
+
+        async def run() -> list[tuple[Any, Any]]:
+            return await asyncio.gather(resolve_twice(), resolve_twice())
+
+        results = asyncio.run(run())
+
+        self.assertIs(results[0][0], results[0][1])
+        self.assertIs(results[1][0], results[1][1])
+        self.assertIsNot(results[0][0], results[1][0])
+        self.assertTrue(results[0][0].is_disposed)
+        self.assertTrue(results[1][0].is_disposed)
+
+    def test_for_key_should_return_the_same_scope_for_the_same_key(self):
+        """Asserts that the same keyed child scope is returned for the same key
+        and that keyed child scopes have their own scoped instances.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        tenant1_scope = scope.for_key("tenant1")
+        tenant2_scope = scope.for_key("tenant2")
+
+        self.assertIs(tenant1_scope, scope.for_key("tenant1"))
+        self.assertIsNot(tenant1_scope, tenant2_scope)
+        self.assertIs(
+            tenant1_scope.resolve(_DisposableService),
+            scope.for_key("tenant1").resolve(_DisposableService)
+        )
+        self.assertIsNot(
+            tenant1_scope.resolve(_DisposableService),
+            tenant2_scope.resolve(_DisposableService)
+        )
+
+    def test_for_key_should_dispose_least_recently_used_scope_when_capacity_is_exceeded(self):
+        """Asserts that the least recently used keyed child scope
+        is evicted and disposed of when the capacity is exceeded.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(keyed_scope_capacity=2))
+
+        tenant1_instance = scope.for_key("tenant1").resolve(_DisposableService)
+        tenant2_instance = scope.for_key("tenant2").resolve(_DisposableService)
+        scope.for_key("tenant1")
+        scope.for_key("tenant3")
+
+        self.assertFalse(tenant1_instance.is_disposed)
+        self.assertTrue(tenant2_instance.is_disposed)
+        self.assertIsNot(scope.for_key("tenant2").resolve(_DisposableService), tenant2_instance)
+
+    def test_lease_key_should_defer_the_disposal_of_an_evicted_scope(self):
+        """Asserts that a leased keyed child scope that is evicted
+        is disposed of only when its lease ends.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(keyed_scope_capacity=1))
+
+        with scope.lease_key("tenant1") as tenant1_scope:
+            self.assertIs(tenant1_scope, scope.for_key("tenant1"))
+            tenant1_instance = tenant1_scope.resolve(_DisposableService)
+            scope.for_key("tenant2")
+
+            self.assertFalse(tenant1_instance.is_disposed)
+            self.assertIs(tenant1_scope.resolve(_DisposableService), tenant1_instance)
+
+        self.assertTrue(tenant1_instance.is_disposed)
+
+    def test_for_key_should_dispose_expired_scope(self):
+        """Asserts that a keyed child scope that hasn't been accessed
+        for longer than the time-to-live is evicted and disposed of.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(keyed_scope_time_to_live=0.01))
+
+        tenant1_scope = scope.for_key("tenant1")
+        tenant1_instance = tenant1_scope.resolve(_DisposableService)
+        time.sleep(0.02)
+        scope.for_key("tenant2")
+
+        self.assertTrue(tenant1_instance.is_disposed)
+        self.assertIsNot(scope.for_key("tenant1"), tenant1_scope)
+
+    def test_for_key_should_replace_expired_scope_of_the_same_key(self):
+        """Asserts that requesting the key of an expired keyed child scope
+        disposes of the expired scope and returns a new one.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(keyed_scope_time_to_live=0.01))
+
+        tenant1_scope = scope.for_key("tenant1")
+        tenant1_instance = tenant1_scope.resolve(_DisposableService)
+        time.sleep(0.02)
+
+        self.assertIsNot(scope.for_key("tenant1"), tenant1_scope)
+        self.assertTrue(tenant1_instance.is_disposed)
+
+    def test_keyed_scope_cache_should_create_scopes_without_blocking_other_keys(self):
+        """Asserts that a slow construction of the scope of a key
+        doesn't block getting the scopes of the other keys.
+        """
+
+        scope = LifetimeScope(InjectableCatalogBuilder().build())
+        keyed_scopes = KeyedScopeCache()
+        is_constructing = threading.Event()
+        can_construct = threading.Event()
+
+        def create_slow_scope() -> ILifetimeScope:
+            is_constructing.set()
+            can_construct.wait(1.0)
+            return scope.create_child_scope()
+
+        thread = threading.Thread(target=keyed_scopes.get_or_add, args=("slow", create_slow_scope))
+        thread.start()
+        try:
+            is_constructing.wait(1.0)
+            fast_scope = keyed_scopes.get_or_add("fast", scope.create_child_scope)
+
+            self.assertTrue(thread.is_alive())
+            self.assertIs(keyed_scopes.get_or_add("fast", scope.create_child_scope), fast_scope)
+        finally:
+            can_construct.set()
+            thread.join()
+
+        self.assertEqual(len(keyed_scopes), 2)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Forking is unsupported on this platform.")
+    def test_prepare_for_fork_should_build_singletons_and_run_fork_hooks_in_the_child(self):
+        """Asserts that preparing for a fork constructs the singletons in advance
+        and that their fork hooks are called in the forked child process only.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_ForkAwareService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        self.addCleanup(gc.unfreeze)
+
+        scope.prepare_for_fork()
+        instance = scope.resolve(_ITestService)
+
+        self.assertIsInstance(instance, _ForkAwareService)
+        self.assertGreater(gc.get_freeze_count(), 0)
+        with warnings.catch_warnings():
+            # Forking a multi-threaded process is deprecated, but the child only exits here.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            if (pid := os.fork()) == 0:
+                os._exit(0 if instance.is_reinitialized else 1) # pylint: disable=protected-access
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertFalse(instance.is_reinitialized)
+
+    def test_dispose_should_dispose_instances_in_reverse_order_of_construction(self):
+        """Asserts that disposing of a lifetime scope disposes of its instances
+        in reverse order of their construction, except for registered instances.
+        """
+
+        disposed_types = []
+        class _Disposable1:
+            def dispose(self) -> None:
+                disposed_types.append(type(self))
+        class _Disposable2:
+            def __init__(self, dependency: _Disposable1) -> None:
+                self.dependency = dependency
+            def dispose(self) -> None:
+                disposed_types.append(type(self))
+        registered_instance = _DisposableService()
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_Disposable1, (_Disposable1,), InjectableScopeType.SCOPED)
+            .register_type(_Disposable2, (_Disposable2,), InjectableScopeType.SCOPED)
+            .register_instance(registered_instance, (_DisposableService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        scope.resolve(_Disposable2)
+        scope.resolve(_DisposableService)
+
+        scope.dispose()
+
+        self.assertEqual(disposed_types, [_Disposable2, _Disposable1])
+        self.assertFalse(registered_instance.is_disposed)
+
+    def test_resolve_should_resolve_by_contract(self):
+        """Asserts that the lifetime scope resolves an injectable
+        associated to the specified contract.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance = scope.resolve(_ITestService)
+
+        self.assertIsInstance(instance, _TestInstanceService)
+        self.assertIs(instance, scope.resolve(_TestInstanceService))
+
+    def test_resolve_should_inject_provider(self):
+        """Asserts that an injected provider resolves its instances on demand."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_ProviderDependent, (_ProviderDependent,))
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance = scope.resolve(_ProviderDependent)
+
+        self.assertIsInstance(instance.provider, Provider)
+        self.assertIs(instance.provider.get(), scope.resolve(_TestInstanceService))
+
+    def test_resolve_should_bind_provider_of_singleton_to_root_scope(self):
+        """Asserts that the provider of a singleton constructed by a child scope
+        resolves its instances from the root scope, even after the child is disposed.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_ProviderDependentHolder, (_ProviderDependentHolder,))
+            .register_type(_ProviderDependent, (_ProviderDependent,), InjectableScopeType.SINGLETON)
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        child_scope = scope.create_child_scope()
+
+        instance = child_scope.resolve(_ProviderDependentHolder).dependent
+        child_instance = child_scope.resolve(_TestInstanceService)
+        child_scope.dispose()
+
+        self.assertIs(instance.provider.get(), scope.resolve(_TestInstanceService))
+        self.assertIsNot(instance.provider.get(), child_instance)
+
+    def test_resolve_should_rebuild_expired_singleton(self):
+        """Asserts that an expired singleton is rebuilt on request
+        when background refresh is turned off.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(
+                _TestInstanceService,
+                (_ITestService,),
+                InjectableScopeType.SINGLETON,
+                time_to_live=0.01,
+                refresh_in_background=False
+            )
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance1 = scope.resolve(_TestInstanceService)
+        instance2 = scope.resolve(_TestInstanceService)
+        time.sleep(0.02)
+        instance3 = scope.resolve(_TestInstanceService)
+
+        self.assertIs(instance1, instance2)
+        self.assertIsNot(instance1, instance3)
+        self.assertIs(instance3, scope.resolve(_TestInstanceService))
+
+    def test_resolve_should_refresh_expired_singleton_in_background(self):
+        """Asserts that an expired singleton is refreshed in the background,
+        after which providers observe the new instance.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_ProviderDependent, (_ProviderDependent,))
+            .register_type(
+                _TestInstanceService,
+                (_ITestService,),
+                InjectableScopeType.SINGLETON,
+                time_to_live=0.01
+            )
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        provider = scope.resolve(_ProviderDependent).provider
+
+        stale_instance = provider.get()
+        time.sleep(0.02)
+        for _ in range(100):
+            if (refreshed_instance := provider.get()) is not stale_instance:
+                break
+            time.sleep(0.01)
+
+        self.assertIsNot(refreshed_instance, stale_instance)
+        self.assertIs(scope.resolve(_TestInstanceService), refreshed_instance)
+
+    def test_resolve_should_dispose_expired_singletons(self):
+        """Asserts that an expired disposable singleton is disposed of once it's replaced,
+        whether it's rebuilt on request or refreshed in the background.
+        """
+
+        for refresh_in_background in (False, True):
+            catalog = (InjectableCatalogBuilder()
+                .register_type(
+                    _DisposableService,
+                    (_DisposableService,),
+                    InjectableScopeType.SINGLETON,
+                    time_to_live=0.01,
+                    refresh_in_background=refresh_in_background
+                )
+                .build()
+            )
+            scope = LifetimeScope(catalog)
+
+            expired_instance = scope.resolve(_DisposableService)
+            time.sleep(0.02)
+            for _ in range(100):
+                # The refresh disposes of the expired instance after it's replaced.
+                instance = scope.resolve(_DisposableService)
+                if instance is not expired_instance and expired_instance.is_disposed:
+                    break
+                time.sleep(0.01)
+
+            self.assertIsNot(instance, expired_instance)
+            self.assertTrue(expired_instance.is_disposed)
+            self.assertFalse(instance.is_disposed)
+
+    def test_catalog_should_raise_for_expiring_non_singleton(self):
+        """Asserts that only singletons may have a time-to-live."""
+
+        self.assertRaises(
+            InjectableRegistrationException,
+            lambda: (InjectableCatalogBuilder()
+                .register_type(_TestInstanceService, (_ITestService,), time_to_live=1)
+                .build()
+            )
+        )
+
+    def test_resolve_should_share_per_resolve_injectable_within_a_resolution(self):
+        """Asserts that a per-resolve injectable is shared by all of its dependees
+        within a single resolution, but not between resolutions.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_UnitOfWorkRoot, (_UnitOfWorkRoot,), InjectableScopeType.PER_RESOLVE)
+            .register_type(
+                _UnitOfWorkDependent1,
+                (_UnitOfWorkDependent1,),
+                InjectableScopeType.PER_RESOLVE
+            )
+            .register_type(
+                _UnitOfWorkDependent2,
+                (_UnitOfWorkDependent2,),
+                InjectableScopeType.PER_RESOLVE
+            )
+            .register_type(_UnitOfWork, (_UnitOfWork,), InjectableScopeType.PER_RESOLVE)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance1 = scope.resolve(_UnitOfWorkRoot)
+        instance2 = scope.resolve(_UnitOfWorkRoot)
+
+        self.assertIs(instance1.dependent1.unit_of_work, instance1.dependent2.unit_of_work)
+        self.assertIsNot(instance1.dependent1.unit_of_work, instance2.dependent1.unit_of_work)
+
+    def test_resolve_should_create_transient_injectable_for_each_dependee(self):
+        """Asserts that each dependee gets its own instance of a transient injectable."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_UnitOfWorkRoot, (_UnitOfWorkRoot,))
+            .register_type(_UnitOfWorkDependent1, (_UnitOfWorkDependent1,))
+            .register_type(_UnitOfWorkDependent2, (_UnitOfWorkDependent2,))
+            .register_type(_UnitOfWork, (_UnitOfWork,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance = scope.resolve(_UnitOfWorkRoot)
+
+        self.assertIsInstance(instance.dependent1.unit_of_work, _UnitOfWork)
+        self.assertIsInstance(instance.dependent2.unit_of_work, _UnitOfWork)
+        self.assertIsNot(instance.dependent1.unit_of_work, instance.dependent2.unit_of_work)
+
+    def test_resolve_twice_should_not_inject_transients_of_previous_resolution(self):
+        """Asserts that a multi-instance dependency only contains
+        the transients created for the current resolution.
+        """
+
+        registrations = find_injectables("tests.unit.test_injectables")
+        catalog = InjectableCatalog(registrations)
+        scope = LifetimeScope(catalog)
+
+        scope.resolve(Root)
+        instance = scope.resolve(Root)
+
+        self.assertEqual(len(instance.injectables1), 2)
+        self.assertEqual(len(instance.injectables2), 2)
+
+    def test_resolve_many_should_return_instances_in_the_order_of_the_request(self):
+        """Asserts that a batch resolution returns the instances in the order of the request."""
+
+        registrations = find_injectables("tests.unit.test_injectables")
+        catalog = InjectableCatalog(registrations)
+        scope = LifetimeScope(catalog)
+
+        instances = scope.resolve_many((Singleton, Root, ProtocolDependent))
+
+        self.assertEqual(len(instances), 3)
+        self.assertIsInstance(instances[0], Singleton)
+        self.assertIsInstance(instances[1], Root)
+        self.assertIsInstance(instances[2], ProtocolDependent)
+        self.assertIs(instances[0], scope.resolve(Singleton))
+
+    def test_resolve_many_should_share_per_resolve_injectables_within_the_batch(self):
+        """Asserts that per-resolve injectables are shared by all injectables of a batch."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(
+                _UnitOfWorkDependent1,
+                (_UnitOfWorkDependent1,),
+                InjectableScopeType.PER_RESOLVE
+            )
+            .register_type(
+                _UnitOfWorkDependent2,
+                (_UnitOfWorkDependent2,),
+                InjectableScopeType.PER_RESOLVE
+            )
+            .register_type(_UnitOfWork, (_UnitOfWork,), InjectableScopeType.PER_RESOLVE)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        dependent1, dependent2 = scope.resolve_many((_UnitOfWorkDependent1, _UnitOfWorkDependent2))
+        other_dependent1 = scope.resolve(_UnitOfWorkDependent1)
+
+        self.assertIs(dependent1.unit_of_work, dependent2.unit_of_work)
+        self.assertIsNot(dependent1.unit_of_work, other_dependent1.unit_of_work)
+
+    def test_resolve_many_should_resolve_contracts(self):
+        """Asserts that a batch resolution resolves contracts to their injectables."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_TestInstanceService, _ITestService))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instances = scope.resolve_many((_ITestService, _TestInstanceService))
+
+        self.assertIsInstance(instances[0], _TestInstanceService)
+        self.assertIsInstance(instances[1], _TestInstanceService)
+
+    def test_map_should_handle_each_item_in_a_disposed_child_scope(self):
+        """Asserts that each item is handled in its own child scope
+        that is disposed of once the item is handled, and that
+        the results are returned in the order of the items.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_ItemHandler, (_ItemHandler,), InjectableScopeType.SCOPED)
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        results = list(scope.map(_ItemHandler, range(10), concurrency=3))
+
+        self.assertEqual([result[0] for result in results], [item * 2 for item in range(10)])
+        self.assertEqual(len({id(result[1]) for result in results}), 10)
+        self.assertTrue(all(result[1].is_disposed for result in results))
+
+    def test_map_should_limit_the_number_of_items_in_flight(self):
+        """Asserts that the items are pulled lazily and that
+        no more items are handled at a time than the concurrency permits.
+        """
+
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0, "pulled": 0}
+
+        class _SlowHandler:
+            def __call__(self, item: int) -> int:
+                with lock:
+                    state["running"] += 1
+                    state["max_running"] = max(state["max_running"], state["running"])
+                time.sleep(0.01)
+                with lock:
+                    state["running"] -= 1
+                return item
+
+        def generate_items():
+            for item in range(20):
+                state["pulled"] += 1
+                yield item
+
+        catalog = InjectableCatalogBuilder().register_type(_SlowHandler, (_SlowHandler,)).build()
+        scope = LifetimeScope(catalog)
+
+        results = scope.map(_SlowHandler, generate_items(), concurrency=4)
+        first_result = next(results)
+        pulled_after_first_result = state["pulled"]
+        remaining_results = list(results)
+
+        self.assertEqual([first_result, *remaining_results], list(range(20)))
+        self.assertLessEqual(pulled_after_first_result, 5)
+        self.assertLessEqual(state["max_running"], 4)
+
+    def test_map_should_construct_each_singleton_once(self):
+        """Asserts that the concurrent resolutions of map share a single instance
+        of a singleton, even if all of them miss it at the same time.
+        """
+
+        construction_count = 0
+
+        class _SlowSingleton:
+            def __init__(self) -> None:
+                nonlocal construction_count
+                construction_count += 1
+                time.sleep(0.01)
+
+        class _SingletonHandler:
+            def __init__(self, singleton: _SlowSingleton) -> None:
+                self.singleton = singleton
+
+            def __call__(self, item: int) -> _SlowSingleton:
+                return self.singleton
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_SlowSingleton, (_SlowSingleton,), InjectableScopeType.SINGLETON)
+            .register_type(_SingletonHandler, (_SingletonHandler,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        results = list(scope.map(_SingletonHandler, range(8), concurrency=8))
+
+        self.assertEqual(construction_count, 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_map_should_raise_for_non_positive_concurrency(self):
+        """Asserts that an exception is raised for a non-positive concurrency."""
+
+        scope = LifetimeScope(InjectableCatalogBuilder().build())
+
+        with self.assertRaises(ArgumentException):
+            scope.map(_ItemHandler, (1,), concurrency=0)
+
+    def test_map_async_should_handle_each_item_in_a_disposed_child_scope(self):
+        """Asserts that the asynchronous variant awaits the handler
+        and disposes of the child scope of each item.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_AsyncItemHandler, (_AsyncItemHandler,), InjectableScopeType.SCOPED)
+            .register_type(_DisposableService, (_DisposableService,), InjectableScopeType.SCOPED)
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        async def run() -> list[tuple[int, _DisposableService]]:
+            return [
+                result
+                async for result in scope.map_async(_AsyncItemHandler, range(10), concurrency=3)
+            ]
+
+        results = asyncio.run(run())
+
+        self.assertEqual([result[0] for result in results], [item * 2 for item in range(10)])
+        self.assertTrue(all(result[1].is_disposed for result in results))
+
+    def test_map_async_should_await_the_disposal_of_each_child_scope(self):
+        """Asserts that the asynchronous variant awaits
+        the asynchronously disposable instances of the child scope of each item.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_AsyncDisposableItemHandler, (_AsyncDisposableItemHandler,))
+            .register_type(
+                _AsyncDisposableService,
+                (_AsyncDisposableService,),
+                InjectableScopeType.SCOPED
+            )
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        async def run() -> list[tuple[int, _AsyncDisposableService]]:
+            return [
+                result
+                async for result in scope.map_async(_AsyncDisposableItemHandler, range(5))
+            ]
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result[1].is_disposed for result in results))
+
+    def test_map_async_should_release_the_child_scopes_of_cancelled_items(self):
+        """Asserts that closing the asynchronous variant early awaits the cancelled items,
+        so that their child scopes are disposed of before it returns.
+        """
+
+        services = list[_AsyncDisposableService]()
+
+        class _BlockingItemHandler:
+            def __init__(self, service: _AsyncDisposableService) -> None:
+                services.append(service)
+
+            async def __call__(self, item: int) -> int:
+                if item:
+                    await asyncio.Event().wait()
+                return item
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_BlockingItemHandler, (_BlockingItemHandler,))
+            .register_type(
+                _AsyncDisposableService,
+                (_AsyncDisposableService,),
+                InjectableScopeType.SCOPED
+            )
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        async def run() -> list[bool]:
+            results = scope.map_async(_BlockingItemHandler, range(10), concurrency=3)
+            await anext(results)
+            await asyncio.sleep(0)
+            await results.aclose() # type: ignore
+            return [service.is_disposed for service in services]
+
+        is_disposed = asyncio.run(run())
+
+        self.assertGreater(len(is_disposed), 1)
+        self.assertTrue(all(is_disposed))
+
+    def test_call_should_fill_in_the_missing_parameters(self):
+        """Asserts that the annotated parameters that aren't passed explicitly
+        are filled in, sharing the per-resolve instances between them.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .register_type(_UnitOfWork, (_UnitOfWork,), InjectableScopeType.PER_RESOLVE)
+            .register_type(_UnitOfWorkDependent1, (_UnitOfWorkDependent1,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        explicit_service = _TestInstanceService()
+
+        result1 = scope.call(_handle_request, 1)
+        result2 = scope.call(_handle_request, 2, service=explicit_service, timeout=2.0)
+
+        self.assertEqual(result1[0], 1)
+        self.assertIs(result1[1], scope.resolve(_ITestService))
+        self.assertIs(result1[2], result1[3].unit_of_work)
+        self.assertEqual(result1[4], 1.0)
+        self.assertEqual(result2[0], 2)
+        self.assertIs(result2[1], explicit_service)
+        self.assertEqual(result2[4], 2.0)
+
+    def test_call_should_fill_in_the_parameters_of_bound_methods(self):
+        """Asserts that the parameters of bound methods are filled in."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        request_id, service = scope.call(_RequestController().handle, 3)
+
+        self.assertEqual(request_id, 3)
+        self.assertIsInstance(service, _TestInstanceService)
+
+    def test_call_should_raise_when_a_dependency_cannot_be_satisfied(self):
+        """Asserts that an exception is raised for a missing parameter without a registration."""
+
+        scope = LifetimeScope(InjectableCatalogBuilder().build())
+
+        with self.assertRaises(DependencyResolutionException):
+            scope.call(_RequestController().handle, 3)
+
+    def test_inject_should_fill_in_the_parameters_of_the_function(self):
+        """Asserts that a function decorated to be injected gets its parameters filled in."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        @inject(scope)
+        def handle(request_id: int, service: _ITestService) -> tuple[int, _ITestService]:
+            return request_id, service
+
+        @inject(lambda: scope)
+        async def handle_async(
+            request_id: int,
+            service: _ITestService
+        ) -> tuple[int, _ITestService]:
+            await asyncio.sleep(0)
+            return request_id, service
+
+        result = handle(4)
+        async_result = asyncio.run(handle_async(5))
+
+        self.assertEqual(result[0], 4)
+        self.assertIsInstance(result[1], _TestInstanceService)
+        self.assertEqual(async_result[0], 5)
+        self.assertIsInstance(async_result[1], _TestInstanceService)
+
+    def test_resolve_should_inject_factories_that_mix_runtime_arguments_with_dependencies(self):
+        """Asserts that injected factories construct new instances using
+        the arguments passed at runtime along with the injected dependencies.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SINGLETON)
+            .register_type(_OrderService, (_OrderService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        service = scope.resolve(_OrderService)
+        processor1 = service.processor_factory(order_id=1)
+        processor2 = service.callable_processor_factory(2)
+
+        self.assertIsInstance(processor1, _OrderProcessor)
+        self.assertEqual(processor1.order_id, 1)
+        self.assertEqual(processor2.order_id, 2)
+        self.assertIs(processor1.service, scope.resolve(_ITestService))
+        self.assertIs(processor2.service, processor1.service)
+
+    def test_resolve_should_bind_factories_of_singleton_to_root_scope(self):
+        """Asserts that the factories of a singleton constructed by a child scope
+        resolve their dependencies from the root scope, even after the child is disposed.
+        """
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_TestInstanceService, (_ITestService,), InjectableScopeType.SCOPED)
+            .register_type(_OrderService, (_OrderService,), InjectableScopeType.SINGLETON)
+            .register_type(_OrderServiceHolder, (_OrderServiceHolder,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+        child_scope = scope.create_child_scope()
+
+        service = child_scope.resolve(_OrderServiceHolder).order_service
+        child_instance = child_scope.resolve(_ITestService)
+        child_scope.dispose()
+        processor1 = service.processor_factory(order_id=1)
+        processor2 = service.callable_processor_factory(2)
+
+        self.assertIs(processor1.service, scope.resolve(_ITestService))
+        self.assertIs(processor2.service, processor1.service)
+        self.assertIsNot(processor1.service, child_instance)
+
+    def test_resolve_should_raise_when_factory_cannot_construct_the_contract(self):
+        """Asserts that an exception is raised for a factory of an unregistered interface."""
+
+        class _FactoryDependent:
+            def __init__(self, factory: Factory[_IGeneric[int]]) -> None:
+                self.factory = factory
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_FactoryDependent, (_FactoryDependent,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        with self.assertRaises(DependencyResolutionException):
+            scope.resolve(_FactoryDependent)
+
+    def test_resolve_should_inject_none_for_unregistered_optional_dependencies(self):
+        """Asserts that optional dependencies are injected if registered, or None otherwise."""
+
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_OptionalDependent, (_OptionalDependent,))
+            .register_type(_UnitOfWork, (_UnitOfWork,))
+            .build()
+        )
+        scope = LifetimeScope(catalog)
+
+        instance = scope.resolve(_OptionalDependent)
+
+        self.assertIsNone(instance.service)
+        self.assertIsInstance(instance.unit_of_work, _UnitOfWork)
+
+    def test_try_resolve_should_return_none_instead_of_raising(self):
+        """Asserts that None is returned for unregistered and unsatisfiable injectables."""
+
+        registrations = find_injectables("tests.unit.test_injectables")
+        catalog = InjectableCatalog(registrations)
+        scope = LifetimeScope(catalog)
+
+        self.assertIsNone(scope.try_resolve(_ITestService))
+        self.assertIsNone(scope.try_resolve(MissingSingleDependency))
+        self.assertIsNone(scope.try_resolve(MissingSingleDependency))
+        self.assertIsInstance(scope.try_resolve(Root), Root)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,82 @@
+import time
+import unittest
+
+from kanata import LifetimeScope, LifetimeScopeOptions, find_injectables
+from kanata.catalogs import InjectableCatalog, InjectableCatalogBuilder
+from kanata.exceptions import ArgumentException
+from kanata.metrics import MetricsRegistry
+from kanata.utils import get_type_name
+from .test_injectables import Scoped, Singleton
+
+class _SlowService:
+    def __init__(self) -> None:
+        time.sleep(0.002)
+
+class MetricsTests(unittest.TestCase):
+    """Unit tests for the metrics of lifetime scopes."""
+
+    def test_resolve_should_update_the_metrics(self):
+        """Asserts that the lifetime scopes and the default resolver record
+        the constructions, the scopes, the plan cache lookups and the live instances.
+        """
+
+        metrics = MetricsRegistry()
+        catalog = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(metrics=metrics))
+
+        scope.resolve(Singleton)
+        child_scope = scope.create_child_scope()
+        child_scope.resolve(Scoped)
+        child_scope.resolve(Singleton)
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(snapshot.get_counter_value("kanata_lifetime_scopes_created"), 2)
+        self.assertEqual(snapshot.get_counter_value("kanata_lifetime_scopes_disposed"), 0)
+        self.assertEqual(snapshot.get_counter_value("kanata_plan_cache_lookups", result="hit"), 1)
+        self.assertEqual(snapshot.get_counter_value("kanata_plan_cache_lookups", result="miss"), 2)
+        self.assertEqual(snapshot.get_gauge_value("kanata_live_instances", scope="singleton"), 1)
+        self.assertEqual(snapshot.get_gauge_value("kanata_live_instances", scope="scoped"), 1)
+        histogram = snapshot.get_histogram(
+            "kanata_construction_duration_ns",
+            injectable=get_type_name(Singleton)
+        )
+        self.assertIsNotNone(histogram)
+        self.assertEqual(histogram.count, 1)
+        self.assertEqual(sum(histogram.bucket_counts), 1)
+
+        child_scope.dispose()
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(snapshot.get_counter_value("kanata_lifetime_scopes_disposed"), 1)
+        self.assertEqual(snapshot.get_gauge_value("kanata_live_instances", scope="scoped"), 0)
+
+    def test_resolve_should_record_slow_constructions(self):
+        """Asserts that only the constructions slower than the threshold are recorded as slow."""
+
+        metrics = MetricsRegistry(slow_construction_threshold_ns=1_000_000)
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_SlowService, (_SlowService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(metrics=metrics))
+
+        scope.resolve(_SlowService)
+        metrics.record_construction(Singleton, 10)
+        slow_constructions = metrics.snapshot().slow_constructions
+
+        self.assertEqual(len(slow_constructions), 1)
+        self.assertIs(slow_constructions[0].injectable_type, _SlowService)
+        self.assertGreater(slow_constructions[0].duration_ns, 1_000_000)
+
+    def test_registry_should_return_the_same_metric_for_the_same_labels(self):
+        """Asserts that the metrics are bound once per name and labels."""
+
+        metrics = MetricsRegistry()
+
+        counter = metrics.get_counter("requests", method="GET", status="200")
+        counter.increment()
+        metrics.get_counter("requests", status="200", method="GET").increment(2)
+
+        self.assertIs(metrics.get_counter("requests", status="200", method="GET"), counter)
+        self.assertEqual(counter.value, 3)
+        self.assertRaises(ArgumentException, lambda: MetricsRegistry(duration_bounds_ns=(2, 1)))
@@ -0,0 +1,109 @@
+import unittest
+
+from kanata import LifetimeScope, find_injectables
+from kanata.catalogs import (
+    InjectableCatalog, InjectableCatalogBuilder, MutableInjectableCatalog, OverlayInjectableCatalog
+)
+from kanata.models import InjectableInstanceRegistration, InjectableTypeRegistration
+from kanata.plans import ResolutionPlanner
+from .test_injectables import ISingleton, ITransient1, Root, Scoped, Singleton
+
+class _TestSingleton(ISingleton):
+    pass
+
+class _PluginTransient(ITransient1):
+    pass
+
+class ResolutionPlannerTests(unittest.TestCase):
+    """Unit tests for ResolutionPlanner."""
+
+    def test_for_catalog_should_return_the_same_planner_for_the_same_catalog(self):
+        """Asserts that the lifetime scopes of the same catalog share their planner."""
+
+        catalog = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+
+        planner = ResolutionPlanner.for_catalog(catalog)
+
+        self.assertIs(ResolutionPlanner.for_catalog(catalog), planner)
+
+    def test_get_plan_should_keep_only_the_most_recently_used_batch_plans(self):
+        """Asserts that the plans of batches are evicted in least recently used order
+        once there are too many of them, while the plans of single injectables are kept.
+        """
+
+        builder = InjectableCatalogBuilder()
+        injectables = [type(f"_BatchInjectable{index}", (), {}) for index in range(20)]
+        for injectable in injectables:
+            builder.register_type(injectable, (injectable,))
+        planner = ResolutionPlanner(builder.build())
+        single_plan = planner.get_plan((injectables[0],))
+
+        first_batch = (injectables[0], injectables[1])
+        for left in injectables:
+            for right in injectables:
+                if left is not right:
+                    planner.get_plan((left, right))
+                    planner.get_plan(first_batch)
+
+        batch_plans = [plan for plan in planner.get_plans() if len(plan.requested_types) > 1]
+        self.assertLessEqual(len(batch_plans), 256)
+        self.assertTrue(planner.is_planned(first_batch))
+        self.assertFalse(planner.is_planned((injectables[0], injectables[2])))
+        self.assertIs(planner.get_plan((injectables[0],)), single_plan)
+
+    def test_overlay_planner_should_reuse_only_the_unaffected_plans_of_the_base(self):
+        """Asserts that the planner of an overlay catalog reuses the plans of the base
+        that don't depend on the overridden contracts, and rebuilds the rest of them.
+        """
+
+        base = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        instance = _TestSingleton()
+        catalog = OverlayInjectableCatalog(
+            base,
+            (
+                InjectableInstanceRegistration( # pylint: disable=unexpected-keyword-arg
+                    contract_types={ISingleton},
+                    injectable_instance=instance
+                ),
+            )
+        )
+        base_planner = ResolutionPlanner.for_catalog(base)
+        planner = ResolutionPlanner.for_catalog(catalog)
+
+        self.assertIs(planner.get_plan((Root,)), base_planner.get_plan((Root,)))
+        self.assertIsNot(planner.get_plan((ISingleton,)), base_planner.get_plan((ISingleton,)))
+        self.assertIs(LifetimeScope(catalog).resolve(ISingleton), instance)
+        self.assertIsInstance(LifetimeScope(base).resolve(ISingleton), Singleton)
+
+    def test_mutable_catalog_changes_should_invalidate_only_the_affected_plans(self):
+        """Asserts that changing the registrations of a mutable catalog invalidates
+        the plans depending on the changed contracts, but not the rest of them.
+        """
+
+        catalog = MutableInjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        planner = ResolutionPlanner.for_catalog(catalog)
+        scope = LifetimeScope(catalog)
+        registration = InjectableTypeRegistration( # pylint: disable=unexpected-keyword-arg
+            injectable_type=_PluginTransient,
+            contract_types={ITransient1}
+        )
+        root_plan = planner.get_plan((Root,))
+        scoped_plan = planner.get_plan((Scoped,))
+        injectables_before = scope.resolve(Root).injectables1
+
+        catalog.add_registration(registration)
+        injectables_after_addition = scope.resolve(Root).injectables1
+        root_plan_after_addition = planner.get_plan((Root,))
+        removed = catalog.remove_registration(registration)
+        injectables_after_removal = scope.resolve(Root).injectables1
+
+        self.assertIsNot(root_plan_after_addition, root_plan)
+        self.assertIs(planner.get_plan((Scoped,)), scoped_plan)
+        self.assertTrue(removed)
+        self.assertFalse(catalog.remove_registration(registration))
+        self.assertEqual(len(injectables_after_addition), len(injectables_before) + 1)
+        self.assertTrue(any(isinstance(i, _PluginTransient) for i in injectables_after_addition))
+        self.assertEqual(len(injectables_after_removal), len(injectables_before))
+
+if __name__ == "__main__":
+    unittest.main()
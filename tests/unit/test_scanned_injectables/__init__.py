@@ -0,0 +1,5 @@
+"""Injectables that are discovered by scanning their sources.
+
+The modules of the injectables mustn't be imported by this package,
+nor by any of the test modules, so that the scans can be verified in a new process.
+"""
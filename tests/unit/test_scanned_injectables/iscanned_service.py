@@ -0,0 +1,2 @@
+class IScannedService:
+    """Interface for an injectable discovered by scanning its sources."""
@@ -0,0 +1 @@
+"""Injectables declared in a subpackage, with aliased decorators."""
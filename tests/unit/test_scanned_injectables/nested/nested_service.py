@@ -0,0 +1,6 @@
+from ..iscanned_service import IScannedService
+from kanata.decorators import injectable as register
+
+@register(IScannedService)
+class NestedService(IScannedService):
+    """An injectable discovered by scanning the sources of a subpackage."""
@@ -0,0 +1,6 @@
+from .iscanned_service import IScannedService
+from kanata.decorators import injectable
+
+@injectable(IScannedService)
+class ScannedService(IScannedService):
+    """An injectable discovered by scanning its sources."""
@@ -0,0 +1,8 @@
+from kanata.models import InjectableScopeType
+
+class UndecoratedService:
+    """A class that refers to the framework without being decorated,
+    hence its module mustn't be imported by the scans.
+    """
+
+    scope = InjectableScopeType.SINGLETON
@@ -1,3 +1,10 @@
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 
 from tests.sdk import assert_contains_all, first
@@ -8,9 +15,15 @@ from tests.unit.test_injectables import (
     SingletonToTransientDependency, Transient1, Transient2
 )
 
-from kanata import find_injectables
+from kanata import find_injectable_references, find_injectables
+from kanata.decorators import injectable
+from kanata.discovery_manifest_store import load_manifest
+from kanata.injectable_registry import get_registered_injectables
 from kanata.models import InjectableTypeRegistration
 
+# The package scanned in a new process, which none of the tests import.
+_SCANNED_MODULE_NAME = "tests.unit.test_scanned_injectables"
+
 class ServiceDiscoveryTests(unittest.TestCase):
     """Unit tests for service discovery."""
 
@@ -46,5 +59,131 @@ class ServiceDiscoveryTests(unittest.TestCase):
             self.assertEqual(len(contracts), len(registration.contract_types))
             assert_contains_all(registration.contract_types, contracts)
 
+    def test_find_injectables_with_source_scan_should_import_only_the_declaring_modules(self):
+        """Asserts that scanning the sources imports only the modules that declare injectables,
+        along with the modules they import, in a process that hasn't imported any of them.
+        """
+
+        statement = (
+            "import json, sys\n"
+            "from kanata import find_injectables\n"
+            f"registrations = find_injectables({_SCANNED_MODULE_NAME!r}, scan_sources=True)\n"
+            "print(json.dumps({\n"
+            "    'injectables': sorted(i.injectable_type.__name__ for i in registrations),\n"
+            "    'modules': sorted(\n"
+            f"        i for i in sys.modules if i.startswith({_SCANNED_MODULE_NAME!r})\n"
+            "    )\n"
+            "}))"
+        )
+
+        result = subprocess.run(
+            (sys.executable, "-c", statement),
+            capture_output=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))},
+            text=True
+        )
+
+        document = json.loads(result.stdout)
+        self.assertEqual(document["injectables"], ["NestedService", "ScannedService"])
+        self.assertEqual(document["modules"], [
+            _SCANNED_MODULE_NAME,
+            f"{_SCANNED_MODULE_NAME}.iscanned_service",
+            f"{_SCANNED_MODULE_NAME}.nested",
+            f"{_SCANNED_MODULE_NAME}.nested.nested_service",
+            f"{_SCANNED_MODULE_NAME}.scanned_service"
+        ])
+        self.assertNotIn(f"{_SCANNED_MODULE_NAME}.undecorated_service", document["modules"])
+
+    def test_find_injectables_with_manifest_should_record_the_injectables(self):
+        """Asserts that a discovery manifest is recorded on the first discovery
+        and that it is reused on further discoveries.
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            manifest_path = os.path.join(directory, "manifest.json")
+            expected_registrations = find_injectables(
+                "tests.unit.test_injectables",
+                manifest_path=manifest_path
+            )
+            manifest = load_manifest(manifest_path, "tests.unit.test_injectables")
+
+            self.assertIsNotNone(manifest)
+            manifest_registrations = {
+                registration.qualname: registration
+                for source_file in manifest.source_files # type: ignore
+                for registration in source_file.registrations
+            }
+            self.assertEqual(len(manifest_registrations), len(expected_registrations))
+            self.assertEqual(
+                manifest_registrations["Singleton"].contract_types,
+                tuple(sorted(
+                    f"{contract.__module__}:{contract.__qualname__}"
+                    for contract in (ISingleton, ITransient1, ITransient2)
+                ))
+            )
+            self.assertIsNone(load_manifest(manifest_path, "tests.unit"))
+
+            modified_time = os.stat(manifest_path).st_mtime_ns
+            registrations = find_injectables(
+                "tests.unit.test_injectables",
+                manifest_path=manifest_path
+            )
+            self.assertEqual(os.stat(manifest_path).st_mtime_ns, modified_time)
+            self.assertEqual(len(registrations), len(expected_registrations))
+            assert_contains_all(registrations, expected_registrations)
+            self.assertEqual(
+                len(find_injectable_references("tests.unit.test_injectables", manifest_path)),
+                len(expected_registrations)
+            )
+
+    def test_decorators_should_register_injectables_by_module(self):
+        """Asserts that the decorators add the injectables to the registry of their module
+        and that decorating a subclass leaves the registration of its base class intact.
+        """
+
+        @injectable(ITransient1)
+        class _TestSubclass(Transient1):
+            pass
+
+        registrations = get_registered_injectables(__name__)
+        self.assertIn(
+            getattr(_TestSubclass, InjectableTypeRegistration.PROPERTY_NAME),
+            registrations
+        )
+        self.assertEqual(len(registrations), 1)
+        self.assertFalse(get_registered_injectables("tests.unit.test_injectable"))
+        registration = getattr(Transient1, InjectableTypeRegistration.PROPERTY_NAME)
+        self.assertIs(registration.injectable_type, Transient1)
+
+    def test_find_injectables_should_replace_the_injectables_of_reloaded_modules(self):
+        """Asserts that reloading a module replaces the registrations of its classes
+        instead of adding new ones.
+        """
+
+        registrations = find_injectables("samples.calculator")
+        module = importlib.reload(importlib.import_module("samples.calculator.calculator"))
+
+        reloaded_registrations = find_injectables("samples.calculator")
+        self.assertEqual(len(reloaded_registrations), len(registrations))
+        self.assertIn(
+            getattr(module.Calculator, InjectableTypeRegistration.PROPERTY_NAME),
+            reloaded_registrations
+        )
+
+    def test_decorators_should_not_keep_dynamic_injectables_alive(self):
+        """Asserts that the injectables created dynamically are removed from the registry
+        once they're collected.
+        """
+
+        def create_injectable(name: str) -> type:
+            return injectable(ITransient1)(type(name, (Transient1,), {"__module__": __name__}))
+
+        registration_count = len(get_registered_injectables(__name__))
+        create_injectable("_DynamicInjectable")
+        gc.collect()
+
+        self.assertEqual(len(get_registered_injectables(__name__)), registration_count)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,34 @@
+import logging
+import unittest
+
+import structlog
+
+from kanata.loggers import StructlogLogger
+
+class StructlogLoggerTests(unittest.TestCase):
+    """Unit tests for forwarding the log events to structlog."""
+
+    def test_is_debug_enabled_should_follow_the_level_of_the_logger(self):
+        """Asserts that debug events are enabled only if the level of the wrapped logger
+        enables them, unless they're enabled or disabled explicitly.
+        """
+
+        stdlib_logger = logging.getLogger("kanata.tests.structlog_logger")
+        stdlib_logger.setLevel(logging.INFO)
+
+        self.assertFalse(StructlogLogger(structlog.wrap_logger(
+            stdlib_logger,
+            wrapper_class=structlog.stdlib.BoundLogger
+        )).is_debug_enabled)
+        self.assertFalse(StructlogLogger(structlog.wrap_logger(
+            structlog.PrintLogger(),
+            wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+        )).is_debug_enabled)
+        self.assertTrue(StructlogLogger(structlog.wrap_logger(
+            structlog.PrintLogger(),
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG)
+        )).is_debug_enabled)
+        self.assertTrue(StructlogLogger(stdlib_logger, is_debug_enabled=True).is_debug_enabled)
+
+if __name__ == "__main__":
+    unittest.main()
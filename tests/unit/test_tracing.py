@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import unittest
+
+from kanata import LifetimeScope, LifetimeScopeOptions, find_injectables
+from kanata.catalogs import InjectableCatalog, InjectableCatalogBuilder
+from kanata.exceptions import ArgumentException
+from kanata.models import InjectableScopeType
+from kanata.tracing import ChromeTraceExporter, InMemorySpanCollector, Tracer
+from .test_injectables import Root
+
+class _SharedService:
+    pass
+
+class _TransientService:
+    def __init__(self, service: _SharedService) -> None:
+        self.service = service
+
+class TracingTests(unittest.TestCase):
+    """Unit tests for tracing the operations of lifetime scopes."""
+
+    def test_resolve_should_record_nested_spans(self):
+        """Asserts that the planning and the constructions are recorded
+        as the children of the span of the resolution.
+        """
+
+        collector = InMemorySpanCollector()
+        catalog = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(tracer=Tracer((collector,))))
+
+        scope.resolve(Root)
+
+        resolve_spans = collector.get_spans_by_name("resolve")
+        self.assertEqual(len(resolve_spans), 1)
+        resolve_span = resolve_spans[0]
+        self.assertIsNone(resolve_span.parent_id)
+        self.assertIs(resolve_span.attributes["injectable"], Root)
+        for name in ("build_graph", "sort", "construct"):
+            spans = collector.get_spans_by_name(name)
+            self.assertTrue(spans)
+            for span in spans:
+                self.assertEqual(span.parent_id, resolve_span.span_id)
+                self.assertGreaterEqual(span.start_time_ns, resolve_span.start_time_ns)
+                self.assertLessEqual(span.end_time_ns, resolve_span.end_time_ns)
+
+        construct_spans = collector.get_spans_by_name("construct")
+        self.assertIn(Root, tuple(span.attributes["injectable"] for span in construct_spans))
+
+        # The plan is cached, hence only the constructions are recorded.
+        collector.clear()
+        scope.create_child_scope().resolve(Root)
+
+        self.assertFalse(collector.get_spans_by_name("build_graph"))
+        self.assertTrue(collector.get_spans_by_name("construct"))
+
+    def test_resolve_should_record_only_the_constructions_of_new_instances(self):
+        """Asserts that the shared instances are recorded as constructed only once,
+        even though their dependees are constructed by each resolution.
+        """
+
+        collector = InMemorySpanCollector()
+        catalog = (InjectableCatalogBuilder()
+            .register_type(_SharedService, (_SharedService,), InjectableScopeType.SINGLETON)
+            .register_type(_TransientService, (_TransientService,))
+            .build()
+        )
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(tracer=Tracer((collector,))))
+
+        for _ in range(3):
+            scope.resolve(_TransientService)
+
+        injectables = [
+            span.attributes["injectable"] for span in collector.get_spans_by_name("construct")
+        ]
+        self.assertEqual(injectables.count(_SharedService), 1)
+        self.assertEqual(injectables.count(_TransientService), 3)
+
+    def test_resolve_should_record_only_the_sampled_resolutions(self):
+        """Asserts that none of the spans of the resolutions that aren't sampled are recorded."""
+
+        collector = InMemorySpanCollector()
+        catalog = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        tracer = Tracer((collector,), sample_rate=0.0)
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(tracer=tracer))
+
+        for _ in range(10):
+            scope.resolve(Root)
+
+        self.assertEqual(collector.spans, ())
+        self.assertIsNone(Tracer.get_current_tracer())
+        self.assertRaises(ArgumentException, lambda: Tracer((collector,), sample_rate=1.5))
+
+    def test_chrome_trace_exporter_should_write_complete_events(self):
+        """Asserts that the Chrome trace exporter writes
+        a complete event for each of the recorded spans.
+        """
+
+        exporter = ChromeTraceExporter()
+        catalog = InjectableCatalog(find_injectables("tests.unit.test_injectables"))
+        scope = LifetimeScope(catalog, options=LifetimeScopeOptions(tracer=Tracer((exporter,))))
+        scope.resolve(Root)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            exporter.write(path)
+            with open(path, "r", encoding="utf-8") as file:
+                events = json.load(file)["traceEvents"]
+
+        self.assertIn("resolve", tuple(event["name"] for event in events))
+        for event in events:
+            self.assertEqual(event["ph"], "X")
+            self.assertGreaterEqual(event["dur"], 0)
+            self.assertIn("span_id", event["args"])
@@ -0,0 +1,159 @@
+import asyncio
+import unittest
+from collections.abc import Iterator
+from typing import Any
+
+from kanata import LifetimeScope
+from kanata.catalogs import InjectableCatalogBuilder
+from kanata.decorators import inject
+from kanata.models import InjectableScopeType
+from kanata.web import (
+    LIFETIME_SCOPE_KEY, AsgiRequest, LifetimeScopeAsgiMiddleware, LifetimeScopeWsgiMiddleware,
+    WsgiRequest, get_request_scope
+)
+
+class _AsyncDisposableSession:
+    def __init__(self) -> None:
+        self.is_disposed = False
+
+    async def dispose_async(self) -> None:
+        await asyncio.sleep(0)
+        self.is_disposed = True
+
+class _AsgiRequestHandler:
+    def __init__(self, request: AsgiRequest, session: _AsyncDisposableSession) -> None:
+        self.request = request
+        self.session = session
+
+class _WsgiRequestHandler:
+    def __init__(self, request: WsgiRequest) -> None:
+        self.request = request
+
+def _create_scope() -> LifetimeScope:
+    catalog = (InjectableCatalogBuilder()
+        .register_external(AsgiRequest)
+        .register_external(WsgiRequest)
+        .register_type(
+            _AsyncDisposableSession,
+            (_AsyncDisposableSession,),
+            InjectableScopeType.SCOPED
+        )
+        .register_type(_AsgiRequestHandler, (_AsgiRequestHandler,), InjectableScopeType.SCOPED)
+        .register_type(_WsgiRequestHandler, (_WsgiRequestHandler,))
+        .build()
+    )
+    return LifetimeScope(catalog)
+
+class WebMiddlewareTests(unittest.TestCase):
+    """Unit tests for the ASGI and WSGI middleware."""
+
+    def test_asgi_middleware_should_handle_each_request_in_its_own_scope(self):
+        """Asserts that each ASGI request is handled in its own child scope
+        that has the request registered and is disposed of asynchronously.
+        """
+
+        handlers = list[_AsgiRequestHandler]()
+
+        @inject(get_request_scope)
+        async def handle(handler: _AsgiRequestHandler) -> None:
+            handlers.append(handler)
+
+        async def app(scope: dict[str, Any], receive: Any, send: Any) -> None:
+            if scope["type"] == "lifespan":
+                self.assertNotIn(LIFETIME_SCOPE_KEY, scope)
+                return
+
+            self.assertIs(scope[LIFETIME_SCOPE_KEY], get_request_scope())
+            await handle()
+            await send({"type": "http.response.start", "status": 200})
+
+        async def receive() -> dict[str, Any]:
+            return {"type": "http.request"}
+
+        async def run() -> list[dict[str, Any]]:
+            sent_messages = list[dict[str, Any]]()
+
+            async def send(message: dict[str, Any]) -> None:
+                sent_messages.append(message)
+
+            middleware = LifetimeScopeAsgiMiddleware(app, _create_scope())
+            await middleware({"type": "http", "path": "/1"}, receive, send)
+            await middleware({"type": "http", "path": "/2"}, receive, send)
+            await middleware({"type": "lifespan"}, receive, send)
+            self.assertEqual(middleware.metrics.snapshot().request_count, 2)
+            return sent_messages
+
+        sent_messages = asyncio.run(run())
+
+        self.assertEqual(len(sent_messages), 2)
+        self.assertEqual(len(handlers), 2)
+        self.assertEqual(handlers[0].request.scope["path"], "/1")
+        self.assertEqual(handlers[1].request.scope["path"], "/2")
+        self.assertIsNot(handlers[0].session, handlers[1].session)
+        self.assertTrue(handlers[0].session.is_disposed)
+        self.assertTrue(handlers[1].session.is_disposed)
+        with self.assertRaises(LookupError):
+            get_request_scope()
+
+    def test_wsgi_middleware_should_dispose_of_the_scope_when_the_response_is_closed(self):
+        """Asserts that each WSGI request is handled in its own child scope
+        that is kept until the response is closed.
+        """
+
+        handlers = list[_WsgiRequestHandler]()
+
+        def app(environ: dict[str, Any], start_response: Any) -> list[bytes]:
+            handlers.append(environ[LIFETIME_SCOPE_KEY].resolve(_WsgiRequestHandler))
+            start_response("200 OK", [])
+            return [b"Hello", b"World"]
+
+        middleware = LifetimeScopeWsgiMiddleware(app, _create_scope())
+        environ = {"PATH_INFO": "/1"}
+
+        response = middleware(environ, lambda status, headers: None)
+        self.assertEqual(middleware.metrics.snapshot().request_count, 0)
+        body = b"".join(response)
+        response.close()
+        snapshot = middleware.metrics.snapshot()
+
+        self.assertEqual(body, b"HelloWorld")
+        self.assertIs(handlers[0].request.environ, environ)
+        self.assertEqual(snapshot.request_count, 1)
+        self.assertGreater(snapshot.total_overhead_ns, 0)
+        self.assertGreaterEqual(snapshot.max_overhead_ns, snapshot.average_overhead_ns)
+
+    def test_wsgi_middleware_should_set_the_request_scope_while_producing_the_body(self):
+        """Asserts that the scope of the request is current while
+        a lazily produced body is iterated and closed, and only then.
+        """
+
+        scopes = list[Any]()
+
+        def app(environ: dict[str, Any], start_response: Any) -> Iterator[bytes]:
+            start_response("200 OK", [])
+            try:
+                scopes.append(get_request_scope())
+                yield b"Hello"
+                scopes.append(get_request_scope())
+                yield b"World"
+            finally:
+                scopes.append(get_request_scope())
+
+        middleware = LifetimeScopeWsgiMiddleware(app, _create_scope())
+        environ = {"PATH_INFO": "/1"}
+
+        response = middleware(environ, lambda status, headers: None)
+        iterator = iter(response)
+        first_chunk = next(iterator)
+        with self.assertRaises(LookupError):
+            get_request_scope()
+        response.close()
+
+        self.assertEqual(first_chunk, b"Hello")
+        self.assertEqual(len(scopes), 2)
+        self.assertTrue(all(scope is environ[LIFETIME_SCOPE_KEY] for scope in scopes))
+        with self.assertRaises(LookupError):
+            get_request_scope()
+
+if __name__ == "__main__":
+    unittest.main()